@@ -19,6 +19,8 @@ from app.use_cases.system import (
     auto_detect_host_ip_use_case,
     start_health_checker_use_case,
     stop_health_checker_use_case,
+    start_container_watcher_use_case,
+    stop_container_watcher_use_case,
     stop_managed_containers_use_case,
 )
 
@@ -78,6 +80,7 @@ async def bootstrap_application() -> Dict[str, Any]:
     
     # 5. Start background services (use case)
     start_health_checker_use_case()
+    start_container_watcher_use_case()
     
     return results
 
@@ -95,6 +98,7 @@ async def shutdown_application():
     try:
         # Stop health checker (use case)
         await stop_health_checker_use_case()
+        await stop_container_watcher_use_case()
         
         # Stop Quick Tunnel in production
         if not settings.is_development() and settings.quick_tunnel_enabled:
@@ -104,6 +108,22 @@ async def shutdown_application():
         
         # Stop all managed containers (use case)
         await stop_managed_containers_use_case()
+
+        # Flush buffered system logs
+        from app.repositories.log_repository import log_manager
+        await log_manager.stop()
+
+        # Flush buffered analytics requests
+        from app.controllers.analytics import analytics_service
+        await analytics_service.stop()
+
+        # Close open stats databases
+        from app.repositories.server_stats_repository import server_stats_repository
+        server_stats_repository.close_all()
+
+        # Close the shared Cloudflare API client
+        from app.integrations.cloudflare.dns_driver import close_http_client
+        await close_http_client()
         
         logger.info("Graceful shutdown complete")
     except Exception as e:
@@ -9,6 +9,7 @@ import uuid
 
 from core.database import get_db, engine
 from core.network import is_localhost_connection
+from core.serialization import dumps
 from app.repositories.server_repository import server_repository
 from app.models.server import Server
 from app.controllers.system_logs import system_logs_controller
@@ -458,7 +459,7 @@ async def websocket_agent_control(websocket: WebSocket):
                                 server = server_repository.get_by_id(session, server_id)
                                 if server:
                                     # Update services
-                                    server.detected_services = json.dumps(services_data)
+                                    server.detected_services = dumps(services_data)
                                     
                                     # Update scan status
                                     server.scanning_status = "completed"
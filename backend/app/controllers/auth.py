@@ -5,12 +5,13 @@ Authentication controller - Username/Password + JWT with SQLModel
 from datetime import datetime
 
 from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlmodel import Session, select
 
 from app.models.user import User
 from app.schemas.auth import LoginRequest, TokenResponse, UserResponse
 from app.schemas.oauth import OAuthLinkRequest, OAuthLoginRequest
-from core.auth import create_access_token
+from core.auth import create_access_token, invalidate_token, invalidate_user, security
 from core.database import get_db
 from core.hash import Hash
 from core.logger import setup_logger
@@ -95,18 +96,22 @@ class AuthController:
             is_admin=current_user.is_admin,
         )
 
-    async def logout(self, current_user: User) -> dict:
+    async def logout(
+        self, current_user: User, credentials: HTTPAuthorizationCredentials = Depends(security)
+    ) -> dict:
         """
         Logout user (client-side token invalidation).
         Laravel equivalent: AuthController@logout
 
         Args:
             current_user: User from authentication dependency
+            credentials: Bearer token, dropped from the authentication cache
 
         Returns:
             Success message
         """
         logger.info(f"User logout: {current_user.username}")
+        invalidate_token(credentials.credentials)
         return {"message": "Logged out successfully"}
 
     async def link_provider(
@@ -128,6 +133,7 @@ class AuthController:
 
         db.add(current_user)
         db.commit()
+        invalidate_user(current_user.id)
         db.refresh(current_user)
 
         return UserResponse(
@@ -157,6 +163,7 @@ class AuthController:
 
         db.add(current_user)
         db.commit()
+        invalidate_user(current_user.id)
         db.refresh(current_user)
 
         return UserResponse(
@@ -277,6 +284,7 @@ class AuthController:
             logger.warning(f"Could not update token last_used: {e}")
         
         db.commit()
+        invalidate_user(admin.id)
         
         logger.info("✅ Password reset successfully")
         
@@ -360,8 +360,7 @@ class DNSController:
             repo = DNSRepository(db)
 
             # Primero encontrar la zona por nombre
-            zones = await repo.list_zones(provider_key)
-            target_zone = next((z for z in zones if z["name"] == zone_name), None)
+            target_zone = await repo.get_zone(provider_key, zone_name)
 
             if not target_zone:
                 raise HTTPException(status_code=404, detail=f"Zona DNS '{zone_name}' no encontrada")
@@ -4,6 +4,7 @@ Metrics Controller - Gestión centralizada de métricas de servidores y analytic
 
 import json
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import List, Optional
 
@@ -559,11 +560,12 @@ class MetricsController:
         total_requests = 0
         total_bandwidth_mb = 0.0
         response_times = []
-        all_paths = {}
-        all_devices = {"mobile": 0, "tablet": 0, "desktop": 0, "bot": 0}
-        all_browsers = {}
-        all_countries = {}
-        all_country_codes = {}
+        all_paths: Counter = Counter()
+        all_status_codes: Counter = Counter()
+        all_devices: Counter = Counter({"mobile": 0, "tablet": 0, "desktop": 0, "bot": 0})
+        all_browsers: Counter = Counter()
+        all_countries: Counter = Counter()
+        all_country_codes: Counter = Counter()
 
         # Agregar analytics de todos los túneles
         for tunnel in tunnels:
@@ -577,29 +579,13 @@ class MetricsController:
                 if avg_rt > 0:
                     response_times.append(avg_rt)
                 
-                # Agregar paths
-                for path, count in stats.get("top_paths", {}).items():
-                    all_paths[path] = all_paths.get(path, 0) + count
-                
-                # Agregar status codes
-                for code, count in stats.get("status_codes", {}).items():
-                    all_status_codes[code] = all_status_codes.get(code, 0) + count
-
-                # Agregar devices
-                for device, count in stats.get("devices", {}).items():
-                    all_devices[device] = all_devices.get(device, 0) + count
-
-                # Agregar browsers
-                for browser, count in stats.get("browsers", {}).items():
-                    all_browsers[browser] = all_browsers.get(browser, 0) + count
-
-                # Agregar countries
-                for country, count in stats.get("countries", {}).items():
-                    all_countries[country] = all_countries.get(country, 0) + count
-
-                # Agregar country_codes
-                for code, count in stats.get("country_codes", {}).items():
-                    all_country_codes[code] = all_country_codes.get(code, 0) + count
+                # Sumar conteos por dimensión
+                all_paths.update(stats.get("top_paths", {}))
+                all_status_codes.update(stats.get("status_codes", {}))
+                all_devices.update(stats.get("devices", {}))
+                all_browsers.update(stats.get("browsers", {}))
+                all_countries.update(stats.get("countries", {}))
+                all_country_codes.update(stats.get("country_codes", {}))
                 
             except Exception as e:
                 logger.warning(f"Error getting analytics for tunnel {tunnel.id}: {e}")
@@ -610,23 +596,11 @@ class MetricsController:
             sum(response_times) / len(response_times) if response_times else 0.0
         )
 
-        # Ordenar top paths
-        sorted_paths = dict(
-            sorted(all_paths.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
-
-        # Ordenar browsers y countries
-        sorted_browsers = dict(
-            sorted(all_browsers.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
-        # Ordenar countries
-        sorted_countries = dict(
-            sorted(all_countries.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
-        # Ordenar country codes
-        sorted_country_codes = dict(
-            sorted(all_country_codes.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
+        # Top 10 por dimensión (selección parcial con heap, sin ordenar todo)
+        sorted_paths = dict(all_paths.most_common(10))
+        sorted_browsers = dict(all_browsers.most_common(10))
+        sorted_countries = dict(all_countries.most_common(10))
+        sorted_country_codes = dict(all_country_codes.most_common(10))
 
         return ServerTunnelAnalytics(
             server_id=server_id,
@@ -636,11 +610,11 @@ class MetricsController:
             total_bandwidth_mb=round(total_bandwidth_mb, 2),
             avg_response_time_ms=round(avg_response_time, 2),
             top_paths=sorted_paths,
-            devices=all_devices,
+            devices=dict(all_devices),
             browsers=sorted_browsers,
             countries=sorted_countries,
             country_codes=sorted_country_codes, # Use the sorted country codes
-            status_codes=all_status_codes,
+            status_codes=dict(all_status_codes),
         )
 
 
@@ -10,6 +10,8 @@ from sqlmodel import Session, select
 
 from app.models.provider import Provider
 from app.models.user import User
+from app.repositories.dns_repository import DNSRepository
+from app.repositories.service_repository import ServiceRepository
 from core.auth import get_current_user
 from core.database import get_db
 from core.logger import setup_logger
@@ -211,6 +213,8 @@ class ProvidersController:
         provider.updated_at = datetime.utcnow()
         db.add(provider)
         db.commit()
+        ServiceRepository.invalidate_provider_cache(provider_key)
+        DNSRepository.invalidate_account(provider_key)
 
         logger.info(f"Provider {provider_key} configuration updated")
 
@@ -228,6 +232,8 @@ class ProvidersController:
         if provider:
             db.delete(provider)
             db.commit()
+            ServiceRepository.invalidate_provider_cache(provider_key)
+            DNSRepository.invalidate_account(provider_key)
             logger.info(f"Provider {provider_key} deleted")
 
         return {"message": f"{provider_key.title()} configuration deleted successfully"}
@@ -262,6 +268,8 @@ class ProvidersController:
 
         db.add(provider)
         db.commit()
+        ServiceRepository.invalidate_provider_cache(provider_key)
+        DNSRepository.invalidate_account(provider_key)
 
         return {"message": f"{protocol.upper()} enabled for {provider_key}"}
 
@@ -287,6 +295,8 @@ class ProvidersController:
 
         db.add(provider)
         db.commit()
+        ServiceRepository.invalidate_provider_cache(provider_key)
+        DNSRepository.invalidate_account(provider_key)
 
         return {"message": f"{protocol.upper()} disabled for {provider_key}"}
 
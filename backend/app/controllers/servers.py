@@ -3,7 +3,7 @@ Servers Controller
 Handles all server-related operations including CRUD, stats, status, and terminal sessions.
 """
 
-from fastapi import WebSocket, WebSocketDisconnect, HTTPException, Depends
+from fastapi import WebSocket, WebSocketDisconnect, HTTPException, Depends, Response
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta
@@ -16,6 +16,7 @@ from app.services.server_service import server_service
 from sqlmodel import Session
 from core.database import engine
 from core.auth import get_current_user
+from core.serialization import loads
 
 # Repositories
 from app.repositories.server_repository import server_repository
@@ -38,6 +39,7 @@ from app.schemas.server import (
     ServerDetailResponse,
     DetectedService,
     ConnectivityCheckResponse,
+    SERVER_LIST_ADAPTER,
 )
 
 # Services (imported in __init__ to avoid circular dependency)
@@ -97,7 +99,7 @@ class ServersController:
             raise HTTPException(status_code=404, detail="Server not found")
         return server
 
-    async def get_server_by_id(self, server_id: str) -> ServerWithServices:
+    async def get_server_by_id(self, server_id: str) -> Response:
         """
         Get server by ID.
 
@@ -112,20 +114,19 @@ class ServersController:
             services = []
             if server.detected_services:
                 try:
-                    services = json.loads(server.detected_services)
+                    services = loads(server.detected_services)
                 except:
                     pass
 
-            response = ServerWithServices.model_validate(server)
-            response.services = services
-            return response
+            response = ServerWithServices.model_validate(server).model_copy(update={"services": services})
+            return Response(content=response.model_dump_json(), media_type="application/json")
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             logger.error(f"Error getting server: {e}")
             raise HTTPException(status_code=500, detail="Failed to get server")
 
-    async def get_server_detail(self, server_id: str) -> ServerDetailResponse:
+    async def get_server_detail(self, server_id: str) -> Response:
         """
         Get detailed server information.
 
@@ -145,7 +146,7 @@ class ServersController:
             discovered_services = []
             if server.detected_services:
                 try:
-                    discovered_services = json.loads(server.detected_services)
+                    discovered_services = loads(server.detected_services)
                 except:
                     pass
 
@@ -159,20 +160,21 @@ class ServersController:
                 agent_last_seen = agent_manager.last_activity[server_id]
 
             # Build response
-            response = ServerDetailResponse.model_validate(server)
-            response.agent_installed = agent_installed
-            response.agent_connected = agent_connected
-            response.agent_last_seen = agent_last_seen
-            response.discovered_services = discovered_services
-
-            return response
+            response = ServerDetailResponse(
+                **ServerResponse.model_validate(server).model_dump(),
+                agent_installed=agent_installed,
+                agent_connected=agent_connected,
+                agent_last_seen=agent_last_seen,
+                discovered_services=discovered_services,
+            )
+            return Response(content=response.model_dump_json(), media_type="application/json")
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             logger.error(f"Error getting server detail: {e}")
             raise HTTPException(status_code=500, detail="Failed to get server detail")
 
-    async def get_all_servers(self, only_reachable: bool = False) -> list[ServerWithServices]:
+    async def get_all_servers(self, only_reachable: bool = False) -> Response:
         """
         Get all servers.
 
@@ -192,15 +194,13 @@ class ServersController:
                 services = []
                 if server.detected_services:
                     try:
-                        services = json.loads(server.detected_services)
+                        services = loads(server.detected_services)
                     except:
                         pass
 
-                response = ServerWithServices.model_validate(server)
-                response.services = services
-                results.append(response)
+                results.append(ServerWithServices.model_validate(server).model_copy(update={"services": services}))
 
-            return results
+            return Response(content=SERVER_LIST_ADAPTER.dump_json(results), media_type="application/json")
         except Exception as e:
             logger.error(f"Error getting servers: {e}")
             raise HTTPException(status_code=500, detail="Failed to get servers")
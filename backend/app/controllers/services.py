@@ -14,7 +14,7 @@ import logging
 import uuid
 from typing import Any, Dict, List, Optional
 
-from fastapi import Depends, HTTPException, Query
+from fastapi import Depends, HTTPException, Query, Response
 from sqlmodel import Session
 
 from app.services.dns_service import dns_service
@@ -27,6 +27,7 @@ from app.schemas.service import (
     ServiceCreateRequest,
     ServiceResponse,
     ServiceUpdateRequest,
+    SERVICE_LIST_ADAPTER,
 )
 from core.auth import get_current_user
 from core.database import get_db
@@ -61,13 +62,20 @@ class ServicesController:
 
     def _enrich_service_response(self, service: Service) -> ServiceResponse:
         """Enriquecer respuesta con campos computados"""
-        response = ServiceResponse.model_validate(service)
-        response.full_domain = service.full_domain
-        response.local_endpoint = service.local_endpoint
-        response.is_named_service = service.is_named_service
-        response.is_quick_service = service.is_quick_service
-        response.expected_container_name = service.get_expected_container_name()
-        return response
+        return ServiceResponse.model_validate(service).model_copy(
+            update={
+                "full_domain": service.full_domain,
+                "local_endpoint": service.local_endpoint,
+                "is_named_service": service.is_named_service,
+                "is_quick_service": service.is_quick_service,
+                "expected_container_name": service.get_expected_container_name(),
+            }
+        )
+
+    def _service_list_response(self, services: List[Service]) -> Response:
+        """Serializar la lista con el TypeAdapter compartido, sin revalidar en FastAPI"""
+        items = [self._enrich_service_response(s) for s in services]
+        return Response(content=SERVICE_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
     # ========== CRUD Operations ==========
 
@@ -78,7 +86,7 @@ class ServicesController:
         protocol: Optional[str] = Query(default=None),
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db),
-    ) -> List[ServiceResponse]:
+    ) -> Response:
         """Listar servicios con filtros opcionales"""
         try:
             # Delegate to use case (no repository needed)
@@ -90,7 +98,7 @@ class ServicesController:
                 protocol=protocol,
             )
 
-            return [self._enrich_service_response(s) for s in services]
+            return self._service_list_response(services)
 
         except Exception as e:
             logger.error(f"Error listando servicios: {e}")
@@ -294,13 +302,13 @@ class ServicesController:
         self,
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db),
-    ) -> List[ServiceResponse]:
+    ) -> Response:
         """Listar todos los servicios actualmente corriendo"""
         try:
             repo = ServiceRepository(db)
             services = repo.list_running(current_user.id)
 
-            return [self._enrich_service_response(s) for s in services]
+            return self._service_list_response(services)
 
         except Exception as e:
             logger.error(f"Error listando servicios activos: {e}")
@@ -388,16 +396,18 @@ class ServicesController:
 
     async def reconcile_services(
         self,
+        verbose: bool = Query(default=False),
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db),
     ) -> Dict[str, Any]:
         """
         Reconcile service states with running Docker containers.
         Updates services that have running containers but show error/stopped status.
+        Per-service details are only included with ?verbose=true.
         """
         try:
             use_case = ReconcileServicesUseCase(db)
-            result = await use_case.execute(current_user.id)
+            result = await use_case.execute(current_user.id, verbose=verbose)
             
             logger.info(
                 f"Reconciliation completed for user {current_user.id}: "
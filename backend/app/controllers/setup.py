@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field
 
 from app.models.config import Config
 from app.models.user import User
+from core.auth import invalidate_user
 from core.database import get_db
 from core.hash import Hash
 from core.logger import setup_logger
@@ -253,6 +254,7 @@ class SetupController:
             db.add(config)
             db.commit()
             db.refresh(config)
+            invalidate_user(admin.id)
 
             logger.info(
                 f"✅ Setup completed for installation: {request.installation_name}"
@@ -21,7 +21,7 @@ import uuid
 from sqlmodel import Session
 from core.database import engine
 from app.repositories.server_repository import server_repository
-from app.models.server import Server
+from app.models.server import LOCAL_HOSTS, Server
 
 
 class ConnectionManager:
@@ -63,7 +63,7 @@ class ConnectionManager:
         print(f"Agent registered via WebSocket. Server ID: {server_id}. Host: {client_host}")
 
         # Check for Local Agent Auto-Discovery
-        if client_host in ["127.0.0.1", "::1", "localhost"]:
+        if client_host in LOCAL_HOSTS:
             try:
                 with Session(engine) as session:
                     local_server = server_repository.get_localhost(session)
@@ -3,7 +3,7 @@ System Logs Controller
 Handles system-wide log retrieval, filtering, and real-time streaming via WebSocket.
 """
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query as QueryParam, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query as QueryParam, Depends, Response
 from typing import List, Optional, Dict, Any
 import logging
 import asyncio
@@ -15,7 +15,8 @@ from app.schemas.log_schemas import (
     PaginatedLogsResponse,
     LogStatsResponse,
     LogEntry as LogEntrySchema,
-    PaginationMeta
+    PaginationMeta,
+    PAGINATED_LOGS_ADAPTER
 )
 
 
@@ -195,7 +196,9 @@ async def get_logs(
         page_size=page_size
     )
     
-    return result
+    # Validate and encode in pydantic-core, skipping FastAPI's dict round-trip
+    page_model = PAGINATED_LOGS_ADAPTER.validate_python(result)
+    return Response(content=PAGINATED_LOGS_ADAPTER.dump_json(page_model), media_type="application/json")
 
 
 
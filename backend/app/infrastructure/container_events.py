@@ -0,0 +1,136 @@
+"""
+Container Event Watcher
+
+Sigue el stream de eventos de Docker (start/die) de los contenedores gestionados
+por localrun y mantiene en memoria qué contenedores están corriendo, para que la
+reconciliación no tenga que listar todos los contenedores en cada ejecución.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.infrastructure.docker_service import docker_service
+
+logger = logging.getLogger(__name__)
+
+
+class ContainerEventWatcher:
+    """
+    Background service that tracks managed containers through Docker events.
+
+    Events are read in a worker thread and queued; `running_containers()` drains
+    the queue and returns the tracked set. Until `seed()` has been called after
+    the current subscription, callers must fall back to a full container list.
+    """
+
+    LABEL = "managed-by=localrun-agent"
+    FILTERS = {"type": "container", "label": LABEL, "event": ["start", "die"]}
+    RETRY_SECONDS = 5
+
+    def __init__(self):
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+        self.synced = False
+        self._stream = None
+        self._queue: Optional[asyncio.Queue] = None
+        # container id -> labels (event attributes)
+        self._containers: Dict[str, Dict[str, str]] = {}
+
+    def _consume(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        """Leer eventos (bloqueante, en un hilo) y encolarlos en el event loop"""
+        stream = self._stream = docker_service.client.events(decode=True, filters=self.FILTERS)
+        if not self.running:
+            # stop() ran before the stream existed
+            stream.close()
+            return
+        for event in stream:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    async def run(self):
+        """Run the event subscription, resubscribing if the stream drops."""
+        self.running = True
+        loop = asyncio.get_running_loop()
+        logger.info("Container event watcher started")
+
+        while self.running:
+            # Events missed while (re)subscribing are covered by the next full list
+            self.synced = False
+            try:
+                await asyncio.to_thread(self._consume, loop, self._queue)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Docker event stream error: {e}")
+            if self.running:
+                await asyncio.sleep(self.RETRY_SECONDS)
+
+    def start(self):
+        """Start the watcher as a background task (no-op without Docker)."""
+        if not docker_service.is_available():
+            logger.warning("Docker not available; container event watcher not started")
+            return
+        if self.task is None or self.task.done():
+            self._queue = asyncio.Queue()
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Stop the watcher and close the event stream."""
+        self.running = False
+        self.synced = False
+        if self._stream is not None:
+            # Unblocks the worker thread waiting on the daemon
+            self._stream.close()
+            self._stream = None
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Container event watcher stopped")
+
+    def _drain(self):
+        """Aplicar los eventos pendientes al conjunto de contenedores corriendo"""
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            event = self._queue.get_nowait()
+            actor = event.get("Actor") or {}
+            container_id = actor.get("ID") or event.get("id")
+            if not container_id:
+                continue
+            if event.get("Action") == "start":
+                self._containers[container_id] = actor.get("Attributes") or {}
+            else:
+                self._containers.pop(container_id, None)
+
+    def seed(self, containers: List[Any]):
+        """
+        Reemplazar el conjunto seguido con un listado completo.
+
+        Args:
+            containers: Contenedores gestionados corriendo (docker SDK)
+        """
+        self._drain()
+        self._containers = {c.id: c.labels for c in containers}
+        self.synced = self.running
+
+    def running_containers(self) -> Optional[List[Any]]:
+        """
+        Contenedores gestionados corriendo según los eventos recibidos.
+
+        Returns:
+            Lista de contenedores (docker SDK, sin inspeccionar) o None si hace falta un listado completo
+        """
+        if not (self.running and self.synced):
+            return None
+        self._drain()
+        return [
+            docker_service.client.containers.prepare_model({"Id": container_id, "Config": {"Labels": labels}})
+            for container_id, labels in self._containers.items()
+        ]
+
+
+# Global container event watcher instance
+container_event_watcher = ContainerEventWatcher()
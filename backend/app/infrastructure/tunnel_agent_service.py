@@ -577,69 +577,60 @@ class TunnelAgentService:
         Sincronizar estado de servicios entre BD y túneles reales
 
         Args:
-            services: Lista de servicios de la BD
+            services: Servicios de la BD (Service o filas de list_sync_view: id, name,
+                status, port, domain, subdomain)
             repo: ServiceRepository para actualizar estados
 
         Returns:
             Dict con resultados de la sincronización
         """
+        # Importar ServiceStatus aquí para evitar importación circular
+        from app.enums.service import ServiceStatus
+
+        running = ServiceStatus.RUNNING.value
         sync_results = []
+        to_running = []
+        to_stopped = []
 
         # Obtener túneles activos
-        quick_tunnels = self.list_quick_tunnels()
-        named_routes = self.list_named_tunnel_routes()
+        quick_ports = {tunnel["port"] for tunnel in self.list_quick_tunnels()}
+        named_routes = {(route["hostname"], route["port"]) for route in self.list_named_tunnel_routes()}
 
         for service in services:
-            old_status = service.status
-            is_actually_running = False
-
             # Verificar si está realmente corriendo
-            if service.is_quick_service:
-                # Buscar en Quick Tunnels
-                for tunnel in quick_tunnels:
-                    if tunnel["port"] == service.port:
-                        is_actually_running = True
-                        break
-            else:
+            if service.domain and service.subdomain:
                 # Buscar en Named Tunnel routes
-                hostname = f"{service.subdomain}.{service.domain}"
-                for route in named_routes:
-                    if route["hostname"] == hostname and route["port"] == service.port:
-                        is_actually_running = True
-                        break
-
-            # Importar ServiceStatus aquí para evitar importación circular
-            from app.enums.service import ServiceStatus
+                is_actually_running = (f"{service.subdomain}.{service.domain}", service.port) in named_routes
+            else:
+                # Buscar en Quick Tunnels
+                is_actually_running = service.port in quick_ports
 
             # Sincronizar estado
-            if is_actually_running and service.status != ServiceStatus.RUNNING.value:
-                repo.update_status(service, ServiceStatus.RUNNING)
-                sync_results.append(
-                    {
-                        "id": service.id,
-                        "name": service.name,
-                        "old_status": old_status,
-                        "new_status": ServiceStatus.RUNNING.value,
-                        "synced": True,
-                    }
-                )
+            if is_actually_running and service.status != running:
+                to_running.append(service.id)
+                new_status = running
+            elif not is_actually_running and service.status == running:
+                to_stopped.append(service.id)
+                new_status = ServiceStatus.STOPPED.value
+            else:
+                continue
 
-            elif not is_actually_running and service.status == ServiceStatus.RUNNING.value:
-                repo.update_status(service, ServiceStatus.STOPPED)
-                sync_results.append(
-                    {
-                        "id": service.id,
-                        "name": service.name,
-                        "old_status": old_status,
-                        "new_status": ServiceStatus.STOPPED.value,
-                        "synced": True,
-                    }
-                )
+            sync_results.append(
+                {
+                    "id": service.id,
+                    "name": service.name,
+                    "old_status": service.status,
+                    "new_status": new_status,
+                    "synced": True,
+                }
+            )
 
-        synced_count = len([r for r in sync_results if r.get("synced")])
+        # Un UPDATE por estado destino
+        repo.update_status_many(to_running, ServiceStatus.RUNNING)
+        repo.update_status_many(to_stopped, ServiceStatus.STOPPED)
 
         return {
-            "message": f"Sincronización completada: {synced_count} cambios",
+            "message": f"Sincronización completada: {len(sync_results)} cambios",
             "results": sync_results,
         }
 
@@ -703,19 +694,8 @@ class TunnelAgentService:
 
             correlations.append(correlation)
 
-        # Obtener estadísticas desde repo (asumiendo que services[0] tiene user_id)
-        stats = (
-            repo.get_statistics(services[0].user_id)
-            if services
-            else {
-                "total": 0,
-                "enabled": 0,
-                "disabled": 0,
-                "running": 0,
-                "stopped": 0,
-                "error": 0,
-            }
-        )
+        # Estadísticas calculadas sobre la misma lista (sin otra consulta a BD)
+        stats = repo.compute_statistics(services)
 
         return {
             "database": {
@@ -10,6 +10,25 @@ from core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# One keep-alive client for all Cloudflare API calls (created on first use)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Shared HTTP client; reuses TLS connections to the Cloudflare API across calls and drivers"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_keepalive_connections=32))
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (application shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class CloudflareDNSDriver(DNSDriver):
     """Cloudflare DNS provider"""
@@ -79,11 +98,11 @@ class CloudflareDNSDriver(DNSDriver):
         temp_driver = CloudflareDNSDriver(api_token, zone_id)
         return await temp_driver.list_records_simple()
 
-    async def list_zones(self, credentials: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def list_zones(self, credentials: Dict[str, Any], name: Optional[str] = None) -> List[Dict[str, Any]]:
         """List DNS zones (Interface method)"""
         api_token = credentials.get("api_token", self.api_token)
         temp_driver = CloudflareDNSDriver(api_token)
-        return await temp_driver.list_zones_simple()
+        return await temp_driver.list_zones_simple(name)
 
     async def validate_credentials(self, credentials: Dict[str, Any]) -> bool:
         """Validate credentials"""
@@ -106,79 +125,80 @@ class CloudflareDNSDriver(DNSDriver):
         """Create DNS record in Cloudflare"""
         logger.info(f"Creating DNS record: {name} ({record_type})")
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records"
+        client = _http_client()
+        url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records"
 
-            payload = {
-                "type": record_type,
-                "name": name,
-                "content": content,
-                "proxied": proxied,
-                "ttl": ttl if not proxied else 1,  # Auto if proxied
-            }
+        payload = {
+            "type": record_type,
+            "name": name,
+            "content": content,
+            "proxied": proxied,
+            "ttl": ttl if not proxied else 1,  # Auto if proxied
+        }
 
-            logger.debug(f"Cloudflare API request: POST {url}")
-            resp = await client.post(url, json=payload, headers=self.headers)
-            resp.raise_for_status()
+        logger.debug(f"Cloudflare API request: POST {url}")
+        resp = await client.post(url, json=payload, headers=self.headers)
+        resp.raise_for_status()
 
-            data = resp.json()
-            if not data.get("success"):
-                logger.error(f"Cloudflare API error: {data.get('errors')}")
-                raise Exception(f"Cloudflare API error: {data.get('errors')}")
+        data = resp.json()
+        if not data.get("success"):
+            logger.error(f"Cloudflare API error: {data.get('errors')}")
+            raise Exception(f"Cloudflare API error: {data.get('errors')}")
 
-            logger.info(f"DNS record created successfully: {data['result']['id']}")
-            return data["result"]
+        logger.info(f"DNS record created successfully: {data['result']['id']}")
+        return data["result"]
 
     async def delete_record_simple(self, record_id: str) -> None:
         """Delete DNS record from Cloudflare"""
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records/{record_id}"
-            resp = await client.delete(url, headers=self.headers)
-            resp.raise_for_status()
+        client = _http_client()
+        url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records/{record_id}"
+        resp = await client.delete(url, headers=self.headers)
+        resp.raise_for_status()
 
     async def list_records_simple(self) -> List[Dict[str, Any]]:
         """List all DNS records in zone"""
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records"
-            resp = await client.get(url, headers=self.headers)
-            resp.raise_for_status()
+        client = _http_client()
+        url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records"
+        resp = await client.get(url, headers=self.headers)
+        resp.raise_for_status()
 
-            data = resp.json()
-            if not data.get("success"):
-                raise Exception(f"Cloudflare API error: {data.get('errors')}")
+        data = resp.json()
+        if not data.get("success"):
+            raise Exception(f"Cloudflare API error: {data.get('errors')}")
 
-            return data["result"]
+        return data["result"]
 
-    async def list_zones_simple(self) -> List[Dict[str, Any]]:
-        """List all DNS zones available to this API token"""
+    async def list_zones_simple(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List all DNS zones available to this API token (or only the zone named `name`)"""
         logger.info("Listing available Cloudflare DNS zones")
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/zones"
-            resp = await client.get(url, headers=self.headers)
-            resp.raise_for_status()
+        client = _http_client()
+        url = f"{self.BASE_URL}/zones"
+        params = {"name": name} if name else None
+        resp = await client.get(url, headers=self.headers, params=params)
+        resp.raise_for_status()
 
-            data = resp.json()
-            if not data.get("success"):
-                logger.error(f"Cloudflare API error: {data.get('errors')}")
-                raise Exception(f"Cloudflare API error: {data.get('errors')}")
+        data = resp.json()
+        if not data.get("success"):
+            logger.error(f"Cloudflare API error: {data.get('errors')}")
+            raise Exception(f"Cloudflare API error: {data.get('errors')}")
 
-            zones = data["result"]
-            logger.info(f"Found {len(zones)} DNS zones")
-            return zones
+        zones = data["result"]
+        logger.info(f"Found {len(zones)} DNS zones")
+        return zones
 
     async def update_record_simple(self, record_id: str, content: str, proxied: bool = False) -> Dict[str, Any]:
         """Update existing DNS record"""
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records/{record_id}"
+        client = _http_client()
+        url = f"{self.BASE_URL}/zones/{self.zone_id}/dns_records/{record_id}"
 
-            payload = {"content": content, "proxied": proxied}
+        payload = {"content": content, "proxied": proxied}
 
-            resp = await client.patch(url, json=payload, headers=self.headers)
-            resp.raise_for_status()
+        resp = await client.patch(url, json=payload, headers=self.headers)
+        resp.raise_for_status()
 
-            data = resp.json()
-            if not data.get("success"):
-                raise Exception(f"Cloudflare API error: {data.get('errors')}")
+        data = resp.json()
+        if not data.get("success"):
+            raise Exception(f"Cloudflare API error: {data.get('errors')}")
 
-            return data["result"]
+        return data["result"]
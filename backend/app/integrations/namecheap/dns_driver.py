@@ -116,8 +116,8 @@ class NamecheapDNSDriver(DNSDriver):
 
         return records
 
-    async def list_zones(self, credentials: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """List DNS zones (domains)"""
+    async def list_zones(self, credentials: Dict[str, Any], name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List DNS zones (domains), optionally only the domain named `name`"""
         api_user = credentials.get("api_user", self.api_user)
         api_key = credentials.get("api_key", self.api_key)
         username = credentials.get("username", self.username)
@@ -133,6 +133,8 @@ class NamecheapDNSDriver(DNSDriver):
                 "ClientIp": await self._get_client_ip(),
                 "PageSize": 100,
             }
+            if name:
+                params["SearchTerm"] = name
 
             resp = await client.get(self.BASE_URL, params=params)
             resp.raise_for_status()
@@ -151,6 +153,9 @@ class NamecheapDNSDriver(DNSDriver):
 
             for domain in domain_list:
                 domain_name = domain.get("Name")
+                if name and domain_name != name:
+                    # SearchTerm is a substring match
+                    continue
                 domains.append(
                     {
                         "id": domain_name,  # Use domain name as ID
@@ -2,96 +2,108 @@
 URL extraction utilities for different tunnel providers
 """
 import re
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple, Union
 
 
-def extract_cloudflare_url(logs: str) -> Optional[str]:
+def _compile(*sources: str) -> Tuple[Tuple[re.Pattern, ...], Tuple[re.Pattern, ...]]:
+    """Compile patterns once for str logs and once for raw bytes logs."""
+    return (
+        tuple(re.compile(source) for source in sources),
+        tuple(re.compile(source.encode("ascii")) for source in sources),
+    )
+
+
+# Patterns compiled once at import, in priority order per provider
+_CLOUDFLARE_PATTERNS = _compile(
+    # trycloudflare.com URLs
+    r"https://[a-zA-Z0-9-]+\.trycloudflare\.com",
+)
+
+_NGROK_PATTERNS = _compile(
+    # ngrok URLs (free and paid)
+    r"https://[a-zA-Z0-9-]+\.ngrok(?:-free)?\.app",
+    # ngrok.io (older format)
+    r"https://[a-zA-Z0-9-]+\.ngrok\.io",
+)
+
+_PINGGY_PATTERNS = _compile(
+    # Pinggy free URLs
+    r"https?://[a-zA-Z0-9-]+\.a\.free\.pinggy\.link",
+    # Pinggy paid URLs
+    r"https?://[a-zA-Z0-9-]+\.a\.pinggy\.link",
+    # TCP format
+    r"tcp://[a-zA-Z0-9-]+\.a\.(?:free\.)?pinggy\.link:\d+",
+)
+
+
+def _first_match(
+    patterns: Tuple[Tuple[re.Pattern, ...], Tuple[re.Pattern, ...]], logs: Union[str, bytes]
+) -> Optional[str]:
+    """
+    First match in the earliest line; within a line, patterns are tried in order.
+
+    Raw bytes logs are searched as-is and only the matched URL is decoded.
+    """
+    if isinstance(logs, bytes):
+        for line in logs.split(b"\n"):
+            for pattern in patterns[1]:
+                match = pattern.search(line)
+                if match:
+                    return match.group(0).decode("ascii")
+        return None
+
+    for line in logs.split("\n"):
+        for pattern in patterns[0]:
+            match = pattern.search(line)
+            if match:
+                return match.group(0)
+    return None
+
+
+def extract_cloudflare_url(logs: Union[str, bytes]) -> Optional[str]:
     """
     Extract Cloudflare tunnel URL from container logs.
     Format: https://xxxxx.trycloudflare.com
     """
-    try:
-        for line in logs.split("\n"):
-            # Match trycloudflare.com URLs
-            pattern = r"https://[a-zA-Z0-9-]+\.trycloudflare\.com"
-            matches = re.findall(pattern, line)
-            if matches:
-                return matches[0]
-    except Exception:
-        pass
-    return None
+    return _first_match(_CLOUDFLARE_PATTERNS, logs)
 
 
-def extract_ngrok_url(logs: str) -> Optional[str]:
+def extract_ngrok_url(logs: Union[str, bytes]) -> Optional[str]:
     """
     Extract Ngrok tunnel URL from container logs.
     Format: https://xxxxx.ngrok-free.app or https://xxxxx.ngrok.app
     """
-    try:
-        for line in logs.split("\n"):
-            # Match ngrok URLs (free and paid)
-            pattern = r"https://[a-zA-Z0-9-]+\.ngrok(?:-free)?\.app"
-            matches = re.findall(pattern, line)
-            if matches:
-                return matches[0]
-            
-            # Also try ngrok.io (older format)
-            pattern_old = r"https://[a-zA-Z0-9-]+\.ngrok\.io"
-            matches = re.findall(pattern_old, line)
-            if matches:
-                return matches[0]
-    except Exception:
-        pass
-    return None
+    return _first_match(_NGROK_PATTERNS, logs)
 
 
-def extract_pinggy_url(logs: str) -> Optional[str]:
+def extract_pinggy_url(logs: Union[str, bytes]) -> Optional[str]:
     """
     Extract Pinggy tunnel URL from container logs.
     Format: https://xxxxx-xxx-xxx-xxx-xxx.a.free.pinggy.link
     """
-    try:
-        for line in logs.split("\n"):
-            # Match Pinggy free URLs
-            pattern = r"https?://[a-zA-Z0-9-]+\.a\.free\.pinggy\.link"
-            matches = re.findall(pattern, line)
-            if matches:
-                return matches[0]
-            
-            # Match Pinggy paid URLs
-            pattern_pro = r"https?://[a-zA-Z0-9-]+\.a\.pinggy\.link"
-            matches = re.findall(pattern_pro, line)
-            if matches:
-                return matches[0]
-            
-            # TCP format
-            tcp_pattern = r"tcp://[a-zA-Z0-9-]+\.a\.(?:free\.)?pinggy\.link:\d+"
-            matches = re.findall(tcp_pattern, line)
-            if matches:
-                return matches[0]
-    except Exception:
-        pass
-    return None
+    return _first_match(_PINGGY_PATTERNS, logs)
 
 
-def extract_url_by_provider(provider: str, logs: str) -> Optional[str]:
+# Extractor by lowercased provider key
+_EXTRACTORS: Dict[str, Callable[[Union[str, bytes]], Optional[str]]] = {
+    "cloudflare": extract_cloudflare_url,
+    "ngrok": extract_ngrok_url,
+    "pinggy": extract_pinggy_url,
+}
+
+
+def extract_url_by_provider(provider: str, logs: Union[str, bytes]) -> Optional[str]:
     """
     Extract tunnel URL based on provider type.
-    
+
     Args:
         provider: Provider name (cloudflare, ngrok, pinggy)
-        logs: Container logs to parse
-        
+        logs: Container logs to parse (str, or raw bytes as returned by Docker)
+
     Returns:
         Extracted URL or None
     """
-    provider_lower = provider.lower()
-    
-    if provider_lower == "cloudflare":
-        return extract_cloudflare_url(logs)
-    elif provider_lower == "ngrok":
-        return extract_ngrok_url(logs)
-    elif provider_lower == "pinggy":
-        return extract_pinggy_url(logs)
-    
-    return None
+    extractor = _EXTRACTORS.get(provider.lower())
+    if extractor is None:
+        return None
+    return extractor(logs)
@@ -8,6 +8,9 @@ import uuid
 from sqlmodel import Field
 from core.database_model import DatabaseModel
 
+# Host values that always refer to this machine
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
 
 class Server(DatabaseModel, table=True):
     """
@@ -83,4 +86,4 @@ class Server(DatabaseModel, table=True):
     @property
     def is_localhost(self) -> bool:
         """Check if this server is localhost"""
-        return self.host in ["localhost", "127.0.0.1", "::1"] or self.is_local
+        return self.host in LOCAL_HOSTS or self.is_local
@@ -3,12 +3,16 @@ Service model for tunnel configurations.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import uuid
-from sqlmodel import Field
-from core.database_model import DatabaseModel
+from sqlalchemy import Index
+from sqlmodel import Field, Relationship
+from core.database_model import DatabaseModel, utcnow
 from app.enums.service import ServiceStatus
 
+if TYPE_CHECKING:
+    from app.models.server import Server
+
 
 class Service(DatabaseModel, table=True):
     """
@@ -21,6 +25,15 @@ class Service(DatabaseModel, table=True):
     """
 
     __tablename__ = "services"
+    __table_args__ = (
+        # Índices compuestos para las consultas por usuario del ServiceRepository
+        Index("ix_service_user_status", "user_id", "status"),
+        Index("ix_service_user_port_host", "user_id", "port", "host"),
+        Index("ix_service_user_provider", "user_id", "provider_key"),
+        Index("ix_service_user_enabled", "user_id", "enabled"),
+        # Filtros de ListServicesUseCase (user_id, enabled, provider_key, protocol) en ese orden
+        Index("ix_service_user_enabled_provider_protocol", "user_id", "enabled", "provider_key", "protocol"),
+    )
 
     # Identificación
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
@@ -56,6 +69,7 @@ class Service(DatabaseModel, table=True):
     server_id: Optional[str] = Field(
         default=None, foreign_key="servers.id", index=True, description="Optional remote server UUID"
     )
+    server: Optional["Server"] = Relationship()
 
     # Healthcheck configuration
     healthcheck_enabled: bool = Field(default=True, description="Enable healthcheck for this service")
@@ -70,8 +84,8 @@ class Service(DatabaseModel, table=True):
     healthcheck_consecutive_failures: int = Field(default=0, description="Consecutive failure count")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     started_at: Optional[datetime] = Field(default=None)
 
     class Config:
@@ -136,11 +150,12 @@ class Service(DatabaseModel, table=True):
         error_message: Optional[str] = None,
     ):
         """Actualiza el estado del servicio"""
+        now = utcnow()
         self.status = status.value
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
         if status == ServiceStatus.RUNNING:
-            self.started_at = datetime.utcnow()
+            self.started_at = now
             self.error_message = None  # Limpiar error al correr
             if public_url:
                 self.public_url = public_url
@@ -8,8 +8,10 @@ Responsabilidades:
 - Operaciones CRUD de registros DNS
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from sqlmodel import Session, select
 
@@ -22,6 +24,14 @@ logger = logging.getLogger(__name__)
 class DNSRepository:
     """Repository para gestionar operaciones DNS"""
 
+    # Cache TTL de respuestas del provider, compartido entre instancias (una por request)
+    CACHE_TTL = 60
+    NEGATIVE_CACHE_TTL = 10
+    CACHE_MAXSIZE = 256
+    _cache: Dict[Tuple, Tuple[Any, float]] = {}
+    _inflight: Dict[Tuple, asyncio.Future] = {}
+    _account_ids: Dict[str, str] = {}
+
     def __init__(self, db: Session):
         """
         Inicializar repository con sesión de BD
@@ -103,6 +113,109 @@ class DNSRepository:
 
         return self._drivers[cache_key]
 
+    # ========== Cache ==========
+
+    @classmethod
+    def _cache_get(cls, key: Tuple) -> Tuple[bool, Any]:
+        """
+        Obtener valor cacheado si no ha expirado
+
+        Args:
+            key: Clave (provider_key, zone_id, record_type)
+
+        Returns:
+            Tupla (hit, valor)
+        """
+        entry = cls._cache.get(key)
+        if entry is None:
+            return False, None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            cls._cache.pop(key, None)
+            return False, None
+
+        return True, value
+
+    @classmethod
+    def _cache_set(cls, key: Tuple, value: Any) -> None:
+        """
+        Guardar valor en cache (TTL corto para resultados vacíos)
+
+        Args:
+            key: Clave (provider_key, zone_id, record_type)
+            value: Valor a cachear
+        """
+        ttl = cls.CACHE_TTL if value else cls.NEGATIVE_CACHE_TTL
+
+        if key not in cls._cache and len(cls._cache) >= cls.CACHE_MAXSIZE:
+            # Descartar la entrada más antigua
+            cls._cache.pop(next(iter(cls._cache)), None)
+
+        cls._cache[key] = (value, time.monotonic() + ttl)
+
+    async def _cached(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Resolver una consulta usando cache y agrupando consultas idénticas en curso
+
+        Args:
+            key: Clave (provider_key, zone_id, record_type)
+            fetch: Corrutina que consulta al provider en caso de miss
+
+        Returns:
+            Resultado de la consulta
+        """
+        hit, value = self._cache_get(key)
+        if hit:
+            return value
+
+        # Si ya hay una consulta idéntica en curso, esperar su resultado
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Evitar warning si no hay otros consumidores
+            raise
+        else:
+            self._cache_set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    @classmethod
+    def invalidate_zone(cls, zone_id: str) -> None:
+        """
+        Invalidar registros cacheados de una zona
+
+        Args:
+            zone_id: ID de la zona
+        """
+        for key in [k for k in cls._cache if k[1] == zone_id]:
+            cls._cache.pop(key, None)
+
+    @classmethod
+    def invalidate_account(cls, provider_key: str) -> None:
+        """
+        Olvidar el account_id y las respuestas cacheadas de un provider
+        (tras cambiar sus credenciales o eliminarlo)
+
+        Args:
+            provider_key: Clave del provider
+        """
+        cls._account_ids.pop(provider_key, None)
+        for key in [k for k in cls._cache if k[0] == provider_key]:
+            cls._cache.pop(key, None)
+
     # ========== DNS Operations ==========
 
     async def validate_provider_connection(self, provider_key: str) -> bool:
@@ -135,7 +248,7 @@ class DNSRepository:
         """
         credentials = self.get_provider_credentials(provider_key)
         driver = self.get_driver(provider_key, credentials)
-        return await driver.list_zones(credentials)
+        return await self._cached((provider_key, None, None), lambda: driver.list_zones(credentials))
 
     async def list_records(
         self, provider_key: str, zone_id: str, record_type: Optional[str] = None
@@ -153,7 +266,10 @@ class DNSRepository:
         """
         credentials = self.get_provider_credentials(provider_key)
         driver = self.get_driver(provider_key, credentials)
-        return await driver.list_records(zone_id, credentials, record_type)
+        return await self._cached(
+            (provider_key, zone_id, record_type),
+            lambda: driver.list_records(zone_id, credentials, record_type),
+        )
 
     async def get_record(self, provider_key: str, zone_id: str, record_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -198,7 +314,7 @@ class DNSRepository:
         credentials = self.get_provider_credentials(provider_key)
         driver = self.get_driver(provider_key, credentials)
 
-        return await driver.create_record(
+        record = await driver.create_record(
             zone_id=zone_id,
             record_type=record_type,
             name=name,
@@ -207,6 +323,8 @@ class DNSRepository:
             ttl=ttl,
             proxied=proxied,
         )
+        self.invalidate_zone(zone_id)
+        return record
 
     async def delete_record(self, provider_key: str, zone_id: str, record_id: str) -> None:
         """
@@ -220,6 +338,26 @@ class DNSRepository:
         credentials = self.get_provider_credentials(provider_key)
         driver = self.get_driver(provider_key, credentials)
         await driver.delete_record(zone_id, record_id, credentials)
+        self.invalidate_zone(zone_id)
+
+    async def get_zone(self, provider_key: str, zone_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtener una zona por nombre (filtrada en el provider)
+
+        Args:
+            provider_key: Clave del provider
+            zone_name: Nombre de la zona
+
+        Returns:
+            Zona encontrada o None
+        """
+        credentials = self.get_provider_credentials(provider_key)
+        driver = self.get_driver(provider_key, credentials)
+        zones = await self._cached(
+            (provider_key, None, f"zone:{zone_name}"),
+            lambda: driver.list_zones(credentials, name=zone_name),
+        )
+        return self.get_zone_by_name(provider_key, zone_name, zones)
 
     # ========== Helper Methods ==========
 
@@ -227,7 +365,7 @@ class DNSRepository:
         self, provider_key: str, zone_name: str, zones: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
-        Buscar zona por nombre
+        Buscar zona por nombre en una lista ya obtenida (ver get_zone)
 
         Args:
             provider_key: Clave del provider
@@ -253,28 +391,68 @@ class DNSRepository:
         if provider_key != "cloudflare":
             raise ValueError("Solo soportado para Cloudflare")
 
+        return await self._cached(
+            (provider_key, None, f"tunnel:{tunnel_name}"),
+            lambda: self._fetch_tunnel_hostname(provider_key, tunnel_name),
+        )
+
+    async def _fetch_tunnel_hostname(self, provider_key: str, tunnel_name: str) -> Optional[str]:
+        """
+        Consultar hostname del túnel en la API de Cloudflare
+
+        Args:
+            provider_key: Clave del provider
+            tunnel_name: Nombre del túnel
+
+        Returns:
+            Hostname del túnel o None
+        """
         try:
-            from app.integrations.cloudflare.tunnel_driver import CloudflareDriver
+            from app.repositories.cloudflare_repository import CloudflareRepository
 
             credentials = self.get_provider_credentials(provider_key)
-            driver = CloudflareDriver(credentials["api_token"])
+            account_id = await self.get_account_id(provider_key)
 
-            # Obtener account_id
-            account_id = driver.get_account_id()
+            # Filtrado por nombre y túneles no eliminados en la API
+            cf_repo = CloudflareRepository(credentials["api_token"], account_id)
+            tunnel = await asyncio.to_thread(cf_repo.find_tunnel_by_name, tunnel_name)
 
-            # Listar túneles
-            tunnels = await driver.list_tunnels(account_id, name=tunnel_name)
+            if not tunnel:
+                logger.warning(f"Túnel '{tunnel_name}' no encontrado")
+                return None
 
-            # Buscar túnel exacto que no esté eliminado
-            for tunnel in tunnels:
-                if tunnel.get("name") == tunnel_name and not tunnel.get("deleted_at"):
-                    tunnel_id = tunnel["id"]
-                    logger.info(f"Túnel encontrado: {tunnel_name} (UUID: {tunnel_id})")
-                    return f"{tunnel_id}.cfargotunnel.com"
-
-            logger.warning(f"Túnel '{tunnel_name}' no encontrado")
-            return None
+            tunnel_id = tunnel["id"]
+            logger.info(f"Túnel encontrado: {tunnel_name} (UUID: {tunnel_id})")
+            return f"{tunnel_id}.cfargotunnel.com"
 
         except Exception as e:
             logger.error(f"Error obteniendo hostname del túnel: {e}")
             return None
+
+    async def get_account_id(self, provider_key: str) -> str:
+        """
+        Obtener account_id de Cloudflare (cacheado por provider)
+
+        Args:
+            provider_key: Clave del provider
+
+        Returns:
+            Account ID
+
+        Raises:
+            ValueError: Si no se puede determinar el account_id
+        """
+        account_id = self._account_ids.get(provider_key)
+        if account_id:
+            return account_id
+
+        account_id = self.get_provider_credentials(provider_key).get("account_id")
+        if not account_id:
+            # El account_id viene en cada zona del token
+            zones = await self.list_zones(provider_key)
+            if not zones:
+                raise ValueError(f"No se pudo obtener account_id para '{provider_key}'")
+            account_id = zones[0]["account"]["id"]
+
+        self._account_ids[provider_key] = account_id
+        return account_id
@@ -7,11 +7,27 @@ from tinydb import TinyDB, Query
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
+import asyncio
+import heapq
+import time
 import uuid
 import logging
 
+from core.serialization import OrjsonStorage, dumps
+
 logger = logging.getLogger(__name__)
 
+_utcnow = datetime.utcnow
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds and 'Z' suffix."""
+    dt = _utcnow()
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T"
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond:06d}Z"
+    )
+
 
 class LogRepository:
     """
@@ -19,15 +35,22 @@ class LogRepository:
     Supports multiple log categories with automatic 7-day TTL cleanup.
     """
 
-    CATEGORIES = ["metrics", "websocket", "services", "backend", "agents"]
-    LEVELS = ["info", "warning", "error"]
+    CATEGORIES = frozenset({"metrics", "websocket", "services", "backend", "agents"})
+    LEVELS = frozenset({"info", "warning", "error"})
     TTL_DAYS = 7
+    CLEANUP_INTERVAL_SECONDS = 3600
+    QUEUE_MAXSIZE = 10000
+    WRITE_BATCH_SIZE = 500
 
     def __init__(self, db_path: str = "/app/database/logs.json"):
         """Initialize log repository with TinyDB storage."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.db = TinyDB(str(self.db_path))
+        self.db = TinyDB(str(self.db_path), storage=OrjsonStorage)
+        self._last_cleanup = float("-inf")
+        # Write buffer drained by a background writer task (created on first use)
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         logger.info(f"LogRepository initialized with database at {self.db_path}")
 
     def log(
@@ -53,6 +76,58 @@ class LogRepository:
         Returns:
             Log entry ID
         """
+        log_entry = self._build_entry(category, level, message, server_id, server_name, metadata)
+
+        # Inside the event loop, hand the write off to the background writer
+        if self._enqueue(log_entry):
+            return log_entry["id"]
+
+        self.db.insert(log_entry)
+        self._maybe_cleanup()
+
+        return log_entry["id"]
+
+    def log_many(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several log entries with a single write.
+
+        Args:
+            entries: List of dicts with the same keys accepted by log()
+                (category, level, message, server_id, server_name, metadata)
+
+        Returns:
+            List of log entry IDs
+        """
+        log_entries = [
+            self._build_entry(
+                entry["category"],
+                entry["level"],
+                entry["message"],
+                entry.get("server_id"),
+                entry.get("server_name"),
+                entry.get("metadata"),
+            )
+            for entry in entries
+        ]
+
+        if not log_entries:
+            return []
+
+        self.db.insert_multiple(log_entries)
+        self._maybe_cleanup()
+
+        return [log_entry["id"] for log_entry in log_entries]
+
+    def _build_entry(
+        self,
+        category: str,
+        level: str,
+        message: str,
+        server_id: Optional[str],
+        server_name: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Validate fields and build a log entry ready to be stored."""
         if category not in self.CATEGORIES:
             logger.warning(f"Invalid log category: {category}")
             category = "backend"
@@ -61,24 +136,117 @@ class LogRepository:
             logger.warning(f"Invalid log level: {level}")
             level = "info"
 
-        log_entry = {
+        metadata = metadata or {}
+
+        return {
             "id": str(uuid.uuid4()),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "category": category,
             "level": level,
             "server_id": server_id,
             "server_name": server_name,
             "message": message,
-            "metadata": metadata or {},
+            "metadata": metadata,
+            # Lowercased JSON of metadata, precomputed for search
+            "metadata_text": self._metadata_text(metadata),
         }
 
-        self.db.insert(log_entry)
+    @staticmethod
+    def _metadata_text(metadata: Dict[str, Any]) -> str:
+        """Searchable (lowercased JSON) representation of a metadata dict."""
+        if not metadata:
+            return ""
+        return dumps(metadata).lower()
 
-        # Cleanup old logs periodically (every 100 inserts)
-        if len(self.db) % 100 == 0:
-            self.cleanup_old_logs()
+    def _enqueue(self, log_entry: Dict[str, Any]) -> bool:
+        """
+        Queue a log entry for the background writer.
 
-        return log_entry["id"]
+        Returns:
+            False if there is no running event loop or the queue is full,
+            in which case the caller writes synchronously.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        if self._writer_task is None or self._writer_task.done() or self._writer_task.get_loop() is not loop:
+            self._flush_pending()
+            self._queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+            self._writer_task = loop.create_task(self._writer())
+
+        try:
+            self._queue.put_nowait(log_entry)
+        except asyncio.QueueFull:
+            return False
+
+        return True
+
+    async def _writer(self):
+        """Background task: write queued entries in batches."""
+        queue = self._queue
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+
+            batch = [entry]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    entry = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if entry is None:
+                    # Re-queue the stop sentinel for the next iteration
+                    queue.put_nowait(None)
+                    break
+                batch.append(entry)
+
+            try:
+                self.db.insert_multiple(batch)
+                self._maybe_cleanup()
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} log entries: {e}")
+
+    def _flush_pending(self):
+        """Synchronously write any entries still waiting in the queue."""
+        if self._queue is None:
+            return
+
+        batch = []
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if entry is None:
+                self._queue.put_nowait(None)
+                break
+            batch.append(entry)
+
+        if batch:
+            self.db.insert_multiple(batch)
+
+    async def stop(self):
+        """Flush queued entries and stop the background writer."""
+        if self._writer_task is None:
+            return
+
+        if not self._writer_task.done():
+            await self._queue.put(None)
+            await self._writer_task
+
+        self._writer_task = None
+        self._flush_pending()
+        self._queue = None
+
+    def _maybe_cleanup(self):
+        """Cleanup old logs periodically (at most once per interval)."""
+        now = time.monotonic()
+        if now - self._last_cleanup > self.CLEANUP_INTERVAL_SECONDS:
+            self._last_cleanup = now
+            self.cleanup_old_logs()
 
     def get_logs(
         self,
@@ -101,6 +269,8 @@ class LogRepository:
         Returns:
             List of log entries
         """
+        self._flush_pending()
+
         LogEntry = Query()
         query_conditions = []
 
@@ -120,11 +290,8 @@ class LogRepository:
         else:
             results = self.db.all()
 
-        # Sort by timestamp descending (newest first)
-        results.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-
-        # Apply pagination
-        return results[offset : offset + limit]
+        # Newest first; only the requested page is ordered (top-k, not a full sort)
+        return heapq.nlargest(offset + limit, results, key=lambda x: x.get("timestamp", ""))[offset:]
 
     def get_recent_logs(self, minutes: int = 5) -> List[Dict[str, Any]]:
         """
@@ -136,6 +303,8 @@ class LogRepository:
         Returns:
             List of recent log entries
         """
+        self._flush_pending()
+
         cutoff = datetime.utcnow() - timedelta(minutes=minutes)
         cutoff_str = cutoff.isoformat() + "Z"
 
@@ -154,6 +323,8 @@ class LogRepository:
         Returns:
             Number of logs removed
         """
+        self._flush_pending()
+
         cutoff = datetime.utcnow() - timedelta(days=self.TTL_DAYS)
         cutoff_str = cutoff.isoformat() + "Z"
 
@@ -192,6 +363,8 @@ class LogRepository:
         Returns:
             Dictionary with paginated results and metadata
         """
+        self._flush_pending()
+
         LogEntry = Query()
         query_conditions = []
 
@@ -236,35 +409,23 @@ class LogRepository:
             filtered_results = []
             
             for log in results:
-                # Search in message
-                if search_lower in log.get("message", "").lower():
-                    filtered_results.append(log)
-                    continue
-                
-                # Search in server_name
-                server_name = log.get("server_name")
-                if server_name and search_lower in server_name.lower():
-                    filtered_results.append(log)
-                    continue
-                
-                # Search in category
-                if search_lower in log.get("category", "").lower():
+                # Entries are built by _build_entry, so every field is present;
+                # category/level are validated lowercase values
+                server_name = log["server_name"]
+                metadata_text = log.get("metadata_text")
+                if metadata_text is None:
+                    # Entries stored before metadata_text existed
+                    metadata_text = self._metadata_text(log["metadata"])
+
+                if (
+                    search_lower in log["message"].lower()
+                    or (server_name and search_lower in server_name.lower())
+                    or search_lower in log["category"]
+                    or search_lower in log["level"]
+                    or search_lower in metadata_text
+                ):
                     filtered_results.append(log)
-                    continue
-                
-                # Search in level
-                if search_lower in log.get("level", "").lower():
-                    filtered_results.append(log)
-                    continue
-                
-                # Search in metadata (convert to string)
-                metadata = log.get("metadata", {})
-                if metadata:
-                    metadata_str = str(metadata).lower()
-                    if search_lower in metadata_str:
-                        filtered_results.append(log)
-                        continue
-            
+
             results = filtered_results
 
         # Get total count before pagination
@@ -281,18 +442,20 @@ class LogRepository:
                 return ("", "") if not reverse else ("zzz", "zzz")
             return (str(value).lower() if isinstance(value, str) else value, "")
         
+        # Calculate pagination
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        offset = (page - 1) * page_size
+
+        # Only order the rows up to the requested page (top-k, not a full sort)
+        select_top = heapq.nlargest if reverse else heapq.nsmallest
         try:
-            results.sort(key=get_sort_key, reverse=reverse)
+            ordered = select_top(offset + page_size, results, key=get_sort_key)
         except Exception as e:
             logger.warning(f"Error sorting by {sort_by}: {e}. Falling back to timestamp sort.")
-            results.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+            ordered = heapq.nlargest(offset + page_size, results, key=lambda x: x.get("timestamp", ""))
 
-        # Calculate pagination
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        offset = (page - 1) * page_size
-        
         # Get page items
-        items = results[offset : offset + page_size]
+        items = ordered[offset:]
 
         # Build response
         return {
@@ -322,6 +485,8 @@ class LogRepository:
         Returns:
             Dictionary with log statistics
         """
+        self._flush_pending()
+
         all_logs = self.db.all()
 
         stats = {
@@ -333,18 +498,19 @@ class LogRepository:
         }
 
         # Count by category and level
+        by_category = stats["by_category"]
+        by_level = stats["by_level"]
         for log in all_logs:
-            category = log.get("category", "unknown")
-            level = log.get("level", "unknown")
-
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-            stats["by_level"][level] = stats["by_level"].get(level, 0) + 1
+            category = log["category"]
+            level = log["level"]
+            by_category[category] = by_category.get(category, 0) + 1
+            by_level[level] = by_level.get(level, 0) + 1
 
         # Get oldest and newest
         if all_logs:
-            sorted_logs = sorted(all_logs, key=lambda x: x.get("timestamp", ""))
-            stats["oldest_log"] = sorted_logs[0].get("timestamp")
-            stats["newest_log"] = sorted_logs[-1].get("timestamp")
+            timestamps = [log["timestamp"] for log in all_logs]
+            stats["oldest_log"] = min(timestamps)
+            stats["newest_log"] = max(timestamps)
 
         return stats
 
@@ -355,6 +521,8 @@ class LogRepository:
         Returns:
             Number of logs removed
         """
+        self._flush_pending()
+
         count = len(self.db)
         self.db.truncate()
         logger.warning(f"Cleared all {count} log entries")
@@ -2,7 +2,7 @@
 Server repository for database operations.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from sqlmodel import Session, select
 from datetime import datetime
 
@@ -20,6 +20,14 @@ class ServerRepository:
         statement = select(Server).where(Server.id == server_id)
         return db.exec(statement).first()
 
+    def get_many(self, db: Session, server_ids: Iterable[str]) -> Dict[str, Server]:
+        """Get several servers by ID in one query, keyed by ID"""
+        server_ids = set(server_ids)
+        if not server_ids:
+            return {}
+        statement = select(Server).where(Server.id.in_(server_ids))
+        return {server.id: server for server in db.exec(statement)}
+
     def get_by_host(self, db: Session, host: str) -> Optional[Server]:
         """Get server by host"""
         statement = select(Server).where(Server.host == host)
@@ -1,76 +1,135 @@
 """
 Server Stats Repository
-Handles storage and retrieval of server statistics using TinyDB.
+Handles storage and retrieval of server statistics using SQLite.
 """
 
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from tinydb import TinyDB, Query
+from datetime import datetime, timezone
+import json
 import os
+import sqlite3
+import time
+
+_utcnow = datetime.utcnow
+
+
+def _utc_timestamp(dt: datetime) -> str:
+    """Naive UTC datetime as ISO 8601 with microseconds (no timezone suffix)."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T"
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond:06d}"
+    )
+
+
+def _unix_ms(dt: datetime) -> int:
+    """Datetime as unix milliseconds; naive values are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def _cutoff_ms(seconds: float) -> int:
+    """Unix milliseconds for `seconds` ago."""
+    return int((time.time() - seconds) * 1000)
 
 
 class ServerStatsRepository:
     """
-    Manages stats storage per server using TinyDB.
+    Manages stats storage for all servers in a single SQLite database.
     Retains 2 weeks of data with automatic rotation.
     """
 
+    CLEANUP_INTERVAL_SECONDS = 3600
+
     def __init__(self, data_dir: str = "database/stats"):
         self.data_dir = data_dir
         os.makedirs(data_dir, exist_ok=True)
         self.retention_days = 14
-
-    def _get_db(self, server_id: str) -> TinyDB:
-        """Get TinyDB instance for a specific server."""
-        db_path = os.path.join(self.data_dir, f"{server_id}.json")
-        return TinyDB(db_path)
+        self.db_path = os.path.join(data_dir, "all.sqlite")
+        self._conn: Optional[sqlite3.Connection] = None
+        # Last retention cleanup per server (monotonic seconds)
+        self._last_cleanup: Dict[str, float] = {}
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get the shared SQLite connection (created on first use)."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stats (
+                    server_id TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (server_id, ts DESC)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close_all(self):
+        """Close the SQLite connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def add_stats(self, server_id: str, stats: Dict[str, Any]):
-        """Add stats entry and clean old data."""
-        db = self._get_db(server_id)
+        """Add stats entry and periodically clean old data."""
+        conn = self._get_conn()
 
-        # Add timestamp if not present
+        # Add timestamp if not present; the ts column holds it as unix ms
+        now = _utcnow()
         if "timestamp" not in stats:
-            stats["timestamp"] = datetime.utcnow().isoformat()
-
-        # Insert new stats
-        db.insert(stats)
-
-        # Clean old data (older than retention period)
-        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
-        cutoff_str = cutoff.isoformat()
-
-        StatsQuery = Query()
-        db.remove(StatsQuery.timestamp < cutoff_str)
-
-        db.close()
+            stats["timestamp"] = _utc_timestamp(now)
+            ts = _unix_ms(now)
+        else:
+            try:
+                ts = _unix_ms(datetime.fromisoformat(stats["timestamp"]))
+            except (TypeError, ValueError):
+                ts = _unix_ms(now)
+
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO stats (server_id, ts, payload) VALUES (?, ?, ?)",
+                (server_id, ts, json.dumps(stats)),
+            )
+
+        # Clean old data at most once per interval per server
+        now = time.monotonic()
+        if now - self._last_cleanup.get(server_id, float("-inf")) > self.CLEANUP_INTERVAL_SECONDS:
+            self._last_cleanup[server_id] = now
+            self._cleanup(server_id)
+
+    def _cleanup(self, server_id: str):
+        """Remove stats older than the retention period for a server."""
+        with self._get_conn() as conn:
+            conn.execute(
+                "DELETE FROM stats WHERE server_id = ? AND ts < ?",
+                (server_id, _cutoff_ms(self.retention_days * 86400)),
+            )
 
     def get_stats(self, server_id: str, hours: int = 168) -> List[Dict[str, Any]]:
-        """Get stats for the last N hours (default 1 week)."""
-        db = self._get_db(server_id)
-
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-        cutoff_str = cutoff.isoformat()
-
-        StatsQuery = Query()
-        results = db.search(StatsQuery.timestamp >= cutoff_str)
-
-        db.close()
-
-        # Sort by timestamp
-        return sorted(results, key=lambda x: x.get("timestamp", ""), reverse=True)
+        """Get stats for the last N hours (default 1 week), most recent first."""
+        rows = self._get_conn().execute(
+            "SELECT payload FROM stats WHERE server_id = ? AND ts >= ? ORDER BY ts DESC",
+            (server_id, _cutoff_ms(hours * 3600)),
+        )
+        return [json.loads(payload) for (payload,) in rows]
 
     def get_latest(self, server_id: str) -> Optional[Dict[str, Any]]:
         """Get the most recent stats entry."""
-        db = self._get_db(server_id)
-        all_stats = db.all()
-        db.close()
+        row = self._get_conn().execute(
+            "SELECT payload FROM stats WHERE server_id = ? ORDER BY ts DESC LIMIT 1",
+            (server_id,),
+        ).fetchone()
 
-        if not all_stats:
+        if not row:
             return None
 
-        # Return the most recent
-        return max(all_stats, key=lambda x: x.get("timestamp", ""))
+        return json.loads(row[0])
 
 
 # Singleton instance
@@ -6,10 +6,13 @@ incluyendo CRUD, queries, y operaciones de estado.
 """
 
 import logging
+import time
 import uuid
-from typing import List, Optional
-from datetime import datetime
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from sqlalchemy import Row, bindparam, exists, func, literal, update
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 from fastapi import HTTPException
 
@@ -17,13 +20,79 @@ from app.models.service import Service
 from app.enums.service import ServiceStatus, ServiceProtocol
 from app.models.provider import Provider
 from app.models.user import User
+from core.database_model import utcnow
 
 logger = logging.getLogger(__name__)
 
+# Valores de estado resueltos una vez al importar el módulo
+_RUNNING = ServiceStatus.RUNNING.value
+_STOPPED = ServiceStatus.STOPPED.value
+_ERROR = ServiceStatus.ERROR.value
+
+# Consultas de forma fija construidas una sola vez; los valores van como
+# bindparams para que SQLAlchemy reutilice el SQL compilado entre llamadas
+_GET_BY_ID_STMT = select(Service).where(Service.id == bindparam("sid"), Service.user_id == bindparam("uid"))
+
+_GET_BY_PORT_AND_HOST_STMT = select(Service).where(
+    Service.user_id == bindparam("uid"), Service.port == bindparam("port"), Service.host == bindparam("host")
+)
+
+_GET_BY_PORT_STMT = _GET_BY_PORT_AND_HOST_STMT.where(Service.provider_key == bindparam("provider_key"))
+
+# Listados masivos (iniciar/detener todos): el servidor de cada servicio se carga en
+# una sola consulta IN por lote en vez de una consulta perezosa por servicio
+_LIST_ENABLED_STMT = (
+    select(Service)
+    .where(Service.user_id == bindparam("uid"), Service.enabled == True, Service.status != _RUNNING)
+    .options(selectinload(Service.server))
+)
+
+_LIST_RUNNING_STMT = (
+    select(Service)
+    .where(Service.user_id == bindparam("uid"), Service.status == _RUNNING)
+    .options(selectinload(Service.server))
+)
+
+# Proyección para sincronizar estados: solo las columnas que usa la sincronización
+_SYNC_VIEW_STMT = select(
+    Service.id, Service.name, Service.status, Service.port, Service.domain, Service.subdomain
+).where(Service.user_id == bindparam("uid"))
+
+_RUNNING_BY_PORT_CONDITIONS = (
+    Service.user_id == bindparam("uid"),
+    Service.port == bindparam("port"),
+    Service.provider_key == bindparam("provider_key"),
+    Service.status == _RUNNING,
+)
+
+_GET_RUNNING_BY_PORT_STMT = select(Service).where(*_RUNNING_BY_PORT_CONDITIONS)
+
+_GET_RUNNING_ID_BY_PORT_STMT = select(Service.id).where(*_RUNNING_BY_PORT_CONDITIONS)
+
+_COUNT_BY_STATUS_STMT = (
+    select(func.count())
+    .select_from(Service)
+    .where(Service.user_id == bindparam("uid"), Service.status == bindparam("status"))
+)
+
+_STATISTICS_STMT = (
+    select(Service.status, Service.enabled, Service.provider_key, Service.protocol, func.count())
+    .where(Service.user_id == bindparam("uid"))
+    .group_by(Service.status, Service.enabled, Service.provider_key, Service.protocol)
+)
+
 
 class ServiceRepository:
     """Repository para gestionar servicios en base de datos"""
 
+    # Filas por lote al recorrer resultados con iter_*
+    STREAM_BATCH_SIZE = 200
+    _stream_options = {"yield_per": STREAM_BATCH_SIZE}
+
+    # Caché compartida de proveedores: key -> (expira_en, snapshot)
+    PROVIDER_CACHE_TTL = 60
+    _provider_cache: Dict[str, Tuple[float, Provider]] = {}
+
     def __init__(self, db: Session):
         """
         Inicializar repository con sesión de BD.
@@ -32,6 +101,8 @@ class ServiceRepository:
             db: Sesión de SQLModel
         """
         self.db = db
+        # Caché por request de get_by_id: (service_id, user_id) -> Service
+        self._by_id_cache: Dict[Tuple[uuid.UUID, int], Service] = {}
 
     # ========== CRUD Básico ==========
 
@@ -46,8 +117,13 @@ class ServiceRepository:
         Returns:
             Service si existe, None si no
         """
-        statement = select(Service).where(Service.id == service_id, Service.user_id == user_id)
-        return self.db.exec(statement).first()
+        key = (service_id, user_id)
+        service = self._by_id_cache.get(key)
+        if service is None:
+            service = self.db.exec(_GET_BY_ID_STMT, params={"sid": service_id, "uid": user_id}).first()
+            if service is not None:
+                self._by_id_cache[key] = service
+        return service
 
     def get_by_port(self, port: int, host: str, user_id: int, provider_key: str) -> Optional[Service]:
         """
@@ -62,10 +138,8 @@ class ServiceRepository:
         Returns:
             Service si existe, None si no
         """
-        statement = select(Service).where(
-            Service.user_id == user_id, Service.port == port, Service.host == host, Service.provider_key == provider_key
-        )
-        return self.db.exec(statement).first()
+        params = {"uid": user_id, "port": port, "host": host, "provider_key": provider_key}
+        return self.db.exec(_GET_BY_PORT_STMT, params=params).first()
 
     def get_by_port_and_host(self, port: int, host: str, user_id: int) -> Optional[Service]:
         """
@@ -79,18 +153,18 @@ class ServiceRepository:
         Returns:
             Service si existe, None si no
         """
-        statement = select(Service).where(Service.user_id == user_id, Service.port == port, Service.host == host)
-        return self.db.exec(statement).first()
+        params = {"uid": user_id, "port": port, "host": host}
+        return self.db.exec(_GET_BY_PORT_AND_HOST_STMT, params=params).first()
 
-    def list_all(
+    def iter_all(
         self,
         user_id: int,
         enabled: Optional[bool] = None,
         provider: Optional[str] = None,
         protocol: Optional[str] = None,
-    ) -> List[Service]:
+    ) -> Iterator[Service]:
         """
-        Listar servicios con filtros opcionales.
+        Recorrer servicios con filtros opcionales, cargándolos por lotes.
 
         Args:
             user_id: ID del usuario
@@ -99,7 +173,7 @@ class ServiceRepository:
             protocol: Filtrar por protocolo
 
         Returns:
-            Lista de servicios
+            Iterador de servicios
         """
         statement = select(Service).where(Service.user_id == user_id)
 
@@ -112,7 +186,52 @@ class ServiceRepository:
         if protocol:
             statement = statement.where(Service.protocol == protocol)
 
-        return list(self.db.exec(statement).all())
+        return self.db.exec(statement, execution_options=self._stream_options)
+
+    def iter_enabled(self, user_id: int) -> Iterator[Service]:
+        """
+        Recorrer servicios habilitados que no están corriendo.
+
+        Args:
+            user_id: ID del usuario
+
+        Returns:
+            Iterador de servicios habilitados detenidos
+        """
+        return self.db.exec(_LIST_ENABLED_STMT, params={"uid": user_id}, execution_options=self._stream_options)
+
+    def iter_running(self, user_id: int) -> Iterator[Service]:
+        """
+        Recorrer servicios actualmente corriendo.
+
+        Args:
+            user_id: ID del usuario
+
+        Returns:
+            Iterador de servicios en ejecución
+        """
+        return self.db.exec(_LIST_RUNNING_STMT, params={"uid": user_id}, execution_options=self._stream_options)
+
+    def list_all(
+        self,
+        user_id: int,
+        enabled: Optional[bool] = None,
+        provider: Optional[str] = None,
+        protocol: Optional[str] = None,
+    ) -> List[Service]:
+        """
+        Listar servicios con filtros opcionales.
+
+        Args:
+            user_id: ID del usuario
+            enabled: Filtrar por habilitado/deshabilitado
+            provider: Filtrar por proveedor
+            protocol: Filtrar por protocolo
+
+        Returns:
+            Lista de servicios
+        """
+        return list(self.iter_all(user_id, enabled=enabled, provider=provider, protocol=protocol))
 
     def list_enabled(self, user_id: int) -> List[Service]:
         """
@@ -124,10 +243,21 @@ class ServiceRepository:
         Returns:
             Lista de servicios habilitados detenidos
         """
-        statement = select(Service).where(
-            Service.user_id == user_id, Service.enabled == True, Service.status != ServiceStatus.RUNNING.value
-        )
-        return list(self.db.exec(statement).all())
+        return list(self.iter_enabled(user_id))
+
+    def list_sync_view(self, user_id: int) -> List[Row]:
+        """
+        Listar los servicios del usuario como filas livianas (sin hidratar Service).
+
+        Cada fila tiene id, name, status, port, domain y subdomain.
+
+        Args:
+            user_id: ID del usuario
+
+        Returns:
+            Lista de filas
+        """
+        return list(self.db.exec(_SYNC_VIEW_STMT, params={"uid": user_id}))
 
     def list_running(self, user_id: int) -> List[Service]:
         """
@@ -139,8 +269,7 @@ class ServiceRepository:
         Returns:
             Lista de servicios en ejecución
         """
-        statement = select(Service).where(Service.user_id == user_id, Service.status == ServiceStatus.RUNNING.value)
-        return list(self.db.exec(statement).all())
+        return list(self.iter_running(user_id))
 
     def create(self, service: Service) -> Service:
         """
@@ -168,7 +297,8 @@ class ServiceRepository:
         Returns:
             Service actualizado
         """
-        service.updated_at = datetime.utcnow()
+        self._forget(service)
+        service.updated_at = utcnow()
         self.db.add(service)
         self.db.commit()
         self.db.refresh(service)
@@ -184,6 +314,7 @@ class ServiceRepository:
         """
         service_name = service.name
         service_id = service.id
+        self._forget(service)
         self.db.delete(service)
         self.db.commit()
         logger.info(f"Servicio eliminado de BD: {service_name} (ID: {service_id})")
@@ -202,20 +333,51 @@ class ServiceRepository:
             Service actualizado
         """
         old_status = service.status
-        service.status = status.value
-        service.updated_at = datetime.utcnow()
+        name = service.name
+        now = utcnow()
+        fields = {"status": status.value, "updated_at": now}
 
         if status == ServiceStatus.RUNNING:
-            service.started_at = datetime.utcnow()
+            fields["started_at"] = now
 
-        self.db.add(service)
-        self.db.commit()
-        self.db.refresh(service)
+        service = self._apply(service, **fields)
 
-        logger.info(f"Estado de servicio actualizado: {service.name} ({old_status} -> {status.value})")
+        logger.info(f"Estado de servicio actualizado: {name} ({old_status} -> {status.value})")
         return service
 
-    def mark_as_running(self, service: Service, public_url: str, process_id: str) -> Service:
+    def update_status_many(self, service_ids: List[uuid.UUID], status: ServiceStatus) -> int:
+        """
+        Actualizar el estado de varios servicios con un solo UPDATE.
+
+        Args:
+            service_ids: IDs de los servicios
+            status: Nuevo estado
+
+        Returns:
+            Cantidad de servicios actualizados
+        """
+        if not service_ids:
+            return 0
+
+        now = utcnow()
+        fields = {"status": status.value, "updated_at": now}
+        if status == ServiceStatus.RUNNING:
+            fields["started_at"] = now
+
+        statement = (
+            update(Service)
+            .where(Service.id.in_(service_ids))
+            .values(**fields)
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.exec(statement)
+        self.db.commit()
+        self._by_id_cache.clear()
+
+        logger.info(f"Estado actualizado a {status.value}: {result.rowcount} servicios")
+        return result.rowcount
+
+    def mark_as_running(self, service: Service, public_url: str, process_id: str, commit: bool = True) -> Service:
         """
         Marcar servicio como corriendo con URL pública.
 
@@ -223,66 +385,157 @@ class ServiceRepository:
             service: Servicio a actualizar
             public_url: URL pública del túnel
             process_id: ID del proceso/túnel
+            commit: Si es False, el UPDATE queda en la transacción abierta y el llamador hace commit
 
         Returns:
             Service actualizado
         """
-        service.status = ServiceStatus.RUNNING.value
-        service.public_url = public_url
-        service.process_id = process_id
-        service.started_at = datetime.utcnow()
-        service.error_message = None
-        service.updated_at = datetime.utcnow()
-
-        self.db.add(service)
-        self.db.commit()
-        self.db.refresh(service)
+        name = service.name
+        now = utcnow()
+        service = self._apply(
+            service,
+            status=_RUNNING,
+            public_url=public_url,
+            process_id=process_id,
+            started_at=now,
+            error_message=None,
+            updated_at=now,
+            commit=commit,
+        )
 
-        logger.info(f"Servicio marcado como running: {service.name} -> {public_url}")
+        logger.info(f"Servicio marcado como running: {name} -> {public_url}")
         return service
 
-    def mark_as_stopped(self, service: Service) -> Service:
+    def mark_many_as_running(self, updates: List[Tuple[uuid.UUID, str, str]], commit: bool = True) -> int:
+        """
+        Marcar varios servicios como corriendo en una sola transacción.
+
+        Usa el UPDATE masivo por clave primaria del ORM (executemany).
+
+        Args:
+            updates: Tuplas (service_id, public_url, process_id)
+            commit: Si es False, el llamador hace commit
+
+        Returns:
+            Cantidad de servicios actualizados
+        """
+        if not updates:
+            return 0
+
+        now = utcnow()
+        rows = [
+            {
+                "id": service_id,
+                "status": _RUNNING,
+                "public_url": public_url,
+                "process_id": process_id,
+                "started_at": now,
+                "error_message": None,
+                "updated_at": now,
+            }
+            for service_id, public_url, process_id in updates
+        ]
+        self.db.exec(update(Service), params=rows)
+        if commit:
+            self.db.commit()
+        self._by_id_cache.clear()
+
+        logger.info(f"Servicios marcados como running: {len(rows)}")
+        return len(rows)
+
+    def mark_many_as_error(self, updates: List[Tuple[uuid.UUID, str]], commit: bool = True) -> int:
+        """
+        Marcar varios servicios con error en una sola transacción.
+
+        Args:
+            updates: Tuplas (service_id, error_message)
+            commit: Si es False, el llamador hace commit
+
+        Returns:
+            Cantidad de servicios actualizados
+        """
+        if not updates:
+            return 0
+
+        now = utcnow()
+        rows = [
+            {"id": service_id, "status": _ERROR, "error_message": error_message, "updated_at": now}
+            for service_id, error_message in updates
+        ]
+        self.db.exec(update(Service), params=rows)
+        if commit:
+            self.db.commit()
+        self._by_id_cache.clear()
+
+        logger.error(f"Servicios marcados con error: {len(rows)}")
+        return len(rows)
+
+    def mark_as_stopped(self, service: Service, commit: bool = True) -> Service:
         """
         Marcar servicio como detenido.
 
         Args:
             service: Servicio a actualizar
+            commit: Si es False, el llamador hace commit
 
         Returns:
             Service actualizado
         """
-        service.status = ServiceStatus.STOPPED.value
-        service.public_url = None
-        service.process_id = None
-        service.updated_at = datetime.utcnow()
-
-        self.db.add(service)
-        self.db.commit()
-        self.db.refresh(service)
+        name = service.name
+        service = self._apply(service, status=_STOPPED, public_url=None, process_id=None, commit=commit)
 
-        logger.info(f"Servicio marcado como stopped: {service.name}")
+        logger.info(f"Servicio marcado como stopped: {name}")
         return service
 
-    def mark_as_error(self, service: Service, error_message: str) -> Service:
+    def mark_many_stopped(self, service_ids: List[uuid.UUID], commit: bool = True) -> int:
+        """
+        Marcar varios servicios como detenidos con un solo UPDATE.
+
+        Args:
+            service_ids: IDs de los servicios a detener
+            commit: Si es False, el llamador hace commit
+
+        Returns:
+            Cantidad de servicios actualizados
+        """
+        if not service_ids:
+            return 0
+
+        statement = (
+            update(Service)
+            .where(Service.id.in_(service_ids))
+            .values(
+                status=_STOPPED,
+                public_url=None,
+                process_id=None,
+                updated_at=utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.exec(statement)
+        if commit:
+            self.db.commit()
+        self._by_id_cache.clear()
+
+        logger.info(f"Servicios marcados como stopped: {result.rowcount}")
+        return result.rowcount
+
+    def mark_as_error(self, service: Service, error_message: str, commit: bool = True) -> Service:
         """
         Marcar servicio con error.
 
         Args:
             service: Servicio a actualizar
             error_message: Mensaje de error
+            commit: Si es False, el llamador hace commit
 
         Returns:
             Service actualizado
         """
-        service.status = ServiceStatus.ERROR.value
-        service.error_message = error_message
-        service.updated_at = datetime.utcnow()
+        name = service.name
+        service = self._apply(service, status=_ERROR, error_message=error_message, commit=commit)
 
-        self.db.add(service)
-        self.db.commit()
-        self.db.refresh(service)
-
-        logger.error(f"Servicio marcado con error: {service.name} - {error_message}")
+        logger.error(f"Servicio marcado con error: {name} - {error_message}")
         return service
 
     def enable(self, service: Service) -> Service:
@@ -295,14 +548,10 @@ class ServiceRepository:
         Returns:
             Service actualizado
         """
-        service.enabled = True
-        service.updated_at = datetime.utcnow()
-
-        self.db.add(service)
-        self.db.commit()
-        self.db.refresh(service)
+        name = service.name
+        service = self._apply(service, enabled=True)
 
-        logger.info(f"Servicio habilitado: {service.name}")
+        logger.info(f"Servicio habilitado: {name}")
         return service
 
     def disable(self, service: Service) -> Service:
@@ -315,22 +564,51 @@ class ServiceRepository:
         Returns:
             Service actualizado
         """
-        service.enabled = False
-        service.updated_at = datetime.utcnow()
+        name = service.name
+        fields = {"enabled": False}
 
         # Si está corriendo, cambiar a stopped
-        if service.status == ServiceStatus.RUNNING.value:
-            service.status = ServiceStatus.STOPPED.value
-            service.public_url = None
-            service.process_id = None
+        if service.status == _RUNNING:
+            fields.update(status=_STOPPED, public_url=None, process_id=None)
 
-        self.db.add(service)
-        self.db.commit()
-        self.db.refresh(service)
+        service = self._apply(service, **fields)
+
+        logger.info(f"Servicio deshabilitado: {name}")
+        return service
+
+    def _apply(self, service: Service, commit: bool = True, **fields) -> Service:
+        """
+        Aplicar cambios parciales con un único UPDATE ... RETURNING.
+
+        Siempre actualiza updated_at (salvo que se pase explícitamente)
+        y no necesita SELECT de refresh.
+
+        Args:
+            service: Servicio a actualizar
+            commit: Si es False, no hace commit (el UPDATE ya se ejecutó en la transacción)
+            **fields: Columnas y valores nuevos
 
-        logger.info(f"Servicio deshabilitado: {service.name}")
+        Returns:
+            Service devuelto por RETURNING (misma instancia de la sesión)
+        """
+        fields.setdefault("updated_at", utcnow())
+        self._forget(service)
+        statement = (
+            update(Service)
+            .where(Service.id == service.id)
+            .values(**fields)
+            .returning(Service)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        service = self.db.exec(statement).scalar_one()
+        if commit:
+            self.db.commit()
         return service
 
+    def _forget(self, service: Service) -> None:
+        """Quitar un servicio de la caché de get_by_id."""
+        self._by_id_cache.pop((service.id, service.user_id), None)
+
     # ========== Validaciones ==========
 
     def validate_provider_exists(self, provider_key: str) -> Provider:
@@ -369,14 +647,15 @@ class ServiceRepository:
         Raises:
             HTTPException: Si el puerto ya está en uso
         """
-        statement = select(Service).where(Service.user_id == user_id, Service.port == port, Service.host == host)
+        conditions = [Service.user_id == user_id, Service.port == port, Service.host == host]
 
         if exclude_service_id:
-            statement = statement.where(Service.id != exclude_service_id)
+            conditions.append(Service.id != exclude_service_id)
 
-        existing = self.db.exec(statement).first()
+        # Solo interesa la existencia: EXISTS sin hidratar el modelo
+        statement = select(literal(True)).where(exists().where(*conditions))
 
-        if existing:
+        if self.db.exec(statement).first():
             raise HTTPException(status_code=400, detail=f"Ya existe un servicio en {host}:{port}")
 
     # ========== Queries Especializadas ==========
@@ -393,13 +672,26 @@ class ServiceRepository:
         Returns:
             Service si está corriendo, None si no
         """
-        statement = select(Service).where(
-            Service.user_id == user_id,
-            Service.port == port,
-            Service.provider_key == provider_key,
-            Service.status == ServiceStatus.RUNNING.value,
-        )
-        return self.db.exec(statement).first()
+        params = {"uid": user_id, "port": port, "provider_key": provider_key}
+        return self.db.exec(_GET_RUNNING_BY_PORT_STMT, params=params).first()
+
+    def get_running_id_by_port(self, port: int, provider_key: str, user_id: int) -> Optional[uuid.UUID]:
+        """
+        Obtener solo el ID del servicio corriendo en un puerto y proveedor.
+
+        Consulta únicamente la columna id; si luego se necesita la entidad,
+        usar get_by_id.
+
+        Args:
+            port: Puerto del servicio
+            provider_key: Clave del proveedor
+            user_id: ID del usuario
+
+        Returns:
+            ID del servicio si está corriendo, None si no
+        """
+        params = {"uid": user_id, "port": port, "provider_key": provider_key}
+        return self.db.exec(_GET_RUNNING_ID_BY_PORT_STMT, params=params).first()
 
     def count_by_status(self, user_id: int, status: ServiceStatus) -> int:
         """
@@ -412,8 +704,7 @@ class ServiceRepository:
         Returns:
             Cantidad de servicios en ese estado
         """
-        statement = select(Service).where(Service.user_id == user_id, Service.status == status.value)
-        return len(list(self.db.exec(statement).all()))
+        return self.db.exec(_COUNT_BY_STATUS_STMT, params={"uid": user_id, "status": status.value}).one()
 
     def get_statistics(self, user_id: int) -> dict:
         """
@@ -425,37 +716,73 @@ class ServiceRepository:
         Returns:
             Dict con estadísticas
         """
-        all_services = self.list_all(user_id)
-
-        return {
-            "total": len(all_services),
-            "enabled": len([s for s in all_services if s.enabled]),
-            "disabled": len([s for s in all_services if not s.enabled]),
-            "running": len([s for s in all_services if s.status == ServiceStatus.RUNNING.value]),
-            "stopped": len([s for s in all_services if s.status == ServiceStatus.STOPPED.value]),
-            "error": len([s for s in all_services if s.status == ServiceStatus.ERROR.value]),
-            "by_provider": self._count_by_provider(all_services),
-            "by_protocol": self._count_by_protocol(all_services),
-        }
-
-    def _count_by_provider(self, services: List[Service]) -> dict:
-        """Contar servicios por proveedor."""
-        counts = {}
-        for service in services:
-            provider = service.provider_key
-            counts[provider] = counts.get(provider, 0) + 1
-        return counts
+        # Una sola consulta agregada; el resto se suma en un único recorrido
+        stats = {"total": 0, "enabled": 0, "disabled": 0, "running": 0, "stopped": 0, "error": 0}
+        by_provider = Counter()
+        by_protocol = Counter()
+
+        for status, enabled, provider_key, protocol, count in self.db.exec(_STATISTICS_STMT, params={"uid": user_id}):
+            stats["total"] += count
+            stats["enabled" if enabled else "disabled"] += count
+            if status in (_RUNNING, _STOPPED, _ERROR):
+                stats[status] += count
+            by_provider[provider_key] += count
+            by_protocol[protocol] += count
+
+        stats["by_provider"] = dict(by_provider)
+        stats["by_protocol"] = dict(by_protocol)
+        return stats
+
+    def list_all_with_stats(self, user_id: int) -> Tuple[List[Service], dict]:
+        """
+        Listar servicios y calcular sus estadísticas con una sola consulta.
+
+        Args:
+            user_id: ID del usuario
+
+        Returns:
+            Tupla (servicios, estadísticas) con el mismo formato que get_statistics
+        """
+        services = self.list_all(user_id)
+        return services, self.compute_statistics(services)
+
+    @staticmethod
+    def compute_statistics(services: List[Service]) -> dict:
+        """
+        Calcular estadísticas a partir de servicios ya cargados (sin consultar BD).
+
+        Args:
+            services: Servicios del usuario
+
+        Returns:
+            Dict con estadísticas (mismo formato que get_statistics)
+        """
+        stats = {"total": len(services), "enabled": 0, "disabled": 0, "running": 0, "stopped": 0, "error": 0}
+        by_provider = Counter()
+        by_protocol = Counter()
 
-    def _count_by_protocol(self, services: List[Service]) -> dict:
-        """Contar servicios por protocolo."""
-        counts = {}
         for service in services:
-            protocol = service.protocol
-            counts[protocol] = counts.get(protocol, 0) + 1
-        return counts
+            stats["enabled" if service.enabled else "disabled"] += 1
+            if service.status in (_RUNNING, _STOPPED, _ERROR):
+                stats[service.status] += 1
+            by_provider[service.provider_key] += 1
+            by_protocol[service.protocol] += 1
+
+        stats["by_provider"] = dict(by_provider)
+        stats["by_protocol"] = dict(by_protocol)
+        return stats
 
     def get_cloudflare_provider(self) -> Provider:
-        """Obtener provider de Cloudflare desde BD"""
+        """
+        Obtener provider de Cloudflare desde BD.
+
+        El resultado se cachea PROVIDER_CACHE_TTL segundos como una copia
+        desvinculada de la sesión (solo lectura).
+        """
+        cached = self._provider_cache.get("cloudflare")
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         statement = select(Provider).where(
             Provider.key == "cloudflare",
             Provider.is_active,
@@ -465,4 +792,19 @@ class ServiceRepository:
         if not provider:
             raise ValueError("Proveedor Cloudflare no configurado")
 
-        return provider
+        snapshot = Provider.model_validate(provider.model_dump())
+        self._provider_cache["cloudflare"] = (time.monotonic() + self.PROVIDER_CACHE_TTL, snapshot)
+        return snapshot
+
+    @classmethod
+    def invalidate_provider_cache(cls, key: Optional[str] = None) -> None:
+        """
+        Invalidar la caché de proveedores tras modificar uno.
+
+        Args:
+            key: Clave del proveedor (None para vaciar toda la caché)
+        """
+        if key is None:
+            cls._provider_cache.clear()
+        else:
+            cls._provider_cache.pop(key, None)
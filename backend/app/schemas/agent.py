@@ -5,7 +5,7 @@ Pydantic schemas for CLI-agent communication.
 """
 
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentHandshakeRequest(BaseModel):
@@ -15,14 +15,16 @@ class AgentHandshakeRequest(BaseModel):
     agent_version: str = Field(..., description="CLI-agent version")
     hostname: str = Field(..., description="System hostname")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "server_id": "e1db3a86-b931-4520-baf2-d25634a59242",
                 "agent_version": "1.0.0",
                 "hostname": "my-server"
             }
-        }
+        },
+    )
 
 
 class AgentHandshakeResponse(BaseModel):
@@ -42,11 +44,12 @@ class AgentHandshakeResponse(BaseModel):
     )
     message: str = Field(..., description="Human-readable message")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "ok",
                 "server_id": "be9662a4-bf98-4f2e-ace7-4743e579e35d",
                 "message": "Server found, proceed with WebSocket"
             }
-        }
+        },
+    )
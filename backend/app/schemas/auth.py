@@ -2,7 +2,7 @@
 Authentication schemas
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LoginRequest(BaseModel):
@@ -13,8 +13,7 @@ class LoginRequest(BaseModel):
 
     password: str = Field(..., min_length=1)
 
-    class Config:
-        json_schema_extra = {"example": {"password": "your-secure-password"}}
+    model_config = ConfigDict(json_schema_extra={"example": {"password": "your-secure-password"}})
 
 
 class TokenResponse(BaseModel):
@@ -26,14 +25,15 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
     expires_in: int  # Minutes
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "bearer",
                 "expires_in": 10080,
             }
-        }
+        },
+    )
 
 
 class UserResponse(BaseModel):
@@ -49,8 +49,8 @@ class UserResponse(BaseModel):
     is_active: bool
     is_admin: bool
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "username": "demo",
@@ -60,7 +60,8 @@ class UserResponse(BaseModel):
                 "is_active": True,
                 "is_admin": True,
             }
-        }
+        },
+    )
 
 
 class ResetPasswordRequest(BaseModel):
@@ -70,5 +71,4 @@ class ResetPasswordRequest(BaseModel):
 
     new_password: str = Field(..., min_length=8, description="New password (minimum 8 characters)")
 
-    class Config:
-        json_schema_extra = {"example": {"new_password": "new-secure-password123"}}
+    model_config = ConfigDict(json_schema_extra={"example": {"new_password": "new-secure-password123"}})
@@ -3,14 +3,26 @@ Log Schemas for LocalRun
 Pydantic models for log query parameters and responses.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 
+# Allowed values for query validation (display order kept for error messages)
+_SORT_FIELDS = ('timestamp', 'category', 'level', 'server_name', 'message', 'server_id')
+_CATEGORIES = ('metrics', 'websocket', 'services', 'backend', 'agents')
+_LEVELS = ('info', 'warning', 'error')
+
+_ALLOWED_SORT = frozenset(_SORT_FIELDS)
+_ALLOWED_CATS = frozenset(_CATEGORIES)
+_ALLOWED_LEVELS = frozenset(_LEVELS)
+
+
 class LogQueryParams(BaseModel):
     """Parameters for querying logs with pagination, filtering, and sorting."""
     
+    model_config = ConfigDict(extra="ignore")
+    
     search: Optional[str] = Field(
         None,
         description="Search term to find in message, server_name, category, level, or metadata"
@@ -51,9 +63,8 @@ class LogQueryParams(BaseModel):
     @classmethod
     def validate_sort_by(cls, v: str) -> str:
         """Validate sort_by field."""
-        allowed_fields = ['timestamp', 'category', 'level', 'server_name', 'message', 'server_id']
-        if v not in allowed_fields:
-            raise ValueError(f"sort_by must be one of: {', '.join(allowed_fields)}")
+        if v not in _ALLOWED_SORT:
+            raise ValueError(f"sort_by must be one of: {', '.join(_SORT_FIELDS)}")
         return v
     
     @field_validator('categories')
@@ -62,10 +73,9 @@ class LogQueryParams(BaseModel):
         """Validate categories."""
         if v is None:
             return v
-        allowed = ['metrics', 'websocket', 'services', 'backend', 'agents']
-        for cat in v:
-            if cat not in allowed:
-                raise ValueError(f"Invalid category: {cat}. Allowed: {', '.join(allowed)}")
+        if not _ALLOWED_CATS.issuperset(v):
+            cat = next(c for c in v if c not in _ALLOWED_CATS)
+            raise ValueError(f"Invalid category: {cat}. Allowed: {', '.join(_CATEGORIES)}")
         return v
     
     @field_validator('levels')
@@ -74,10 +84,9 @@ class LogQueryParams(BaseModel):
         """Validate levels."""
         if v is None:
             return v
-        allowed = ['info', 'warning', 'error']
-        for level in v:
-            if level not in allowed:
-                raise ValueError(f"Invalid level: {level}. Allowed: {', '.join(allowed)}")
+        if not _ALLOWED_LEVELS.issuperset(v):
+            level = next(lv for lv in v if lv not in _ALLOWED_LEVELS)
+            raise ValueError(f"Invalid level: {level}. Allowed: {', '.join(_LEVELS)}")
         return v
 
 
@@ -91,10 +100,12 @@ class LogEntry(BaseModel):
     message: str = Field(..., description="Log message")
     server_id: Optional[str] = Field(None, description="Associated server ID")
     server_name: Optional[str] = Field(None, description="Associated server name")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    # Opaque to the server: passed through without deep validation
+    metadata: Any = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "timestamp": "2025-12-11T03:00:00Z",
@@ -105,7 +116,8 @@ class LogEntry(BaseModel):
                 "server_name": "my-server",
                 "metadata": {"port": 8080}
             }
-        }
+        },
+    )
 
 
 class PaginationMeta(BaseModel):
@@ -126,8 +138,9 @@ class PaginatedLogsResponse(BaseModel):
     pagination: PaginationMeta = Field(..., description="Pagination metadata")
     filters: Dict[str, Any] = Field(default_factory=dict, description="Applied filters")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "items": [
                     {
@@ -156,7 +169,8 @@ class PaginatedLogsResponse(BaseModel):
                     "server_id": None
                 }
             }
-        }
+        },
+    )
 
 
 class LogStatsResponse(BaseModel):
@@ -167,3 +181,7 @@ class LogStatsResponse(BaseModel):
     by_level: Dict[str, int]
     oldest_log: Optional[str]
     newest_log: Optional[str]
+
+
+# Built once at import; serializes pages straight to JSON bytes in pydantic-core
+PAGINATED_LOGS_ADAPTER = TypeAdapter(PaginatedLogsResponse)
@@ -5,7 +5,7 @@ Metrics Schemas - Schemas para métricas de servidores y analytics
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ========== Server Metrics Schemas ==========
@@ -158,6 +158,9 @@ class ServerComparison(BaseModel):
 class ServerTunnelAnalytics(BaseModel):
     """Analytics de túneles asociados a un servidor"""
     
+    # Se construye una vez por respuesta y no se modifica
+    model_config = ConfigDict(frozen=True)
+    
     server_id: str
     server_name: str
     period_hours: float
@@ -168,13 +171,13 @@ class ServerTunnelAnalytics(BaseModel):
     avg_response_time_ms: float = 0.0
     
     # Top paths
-    top_paths: Dict[str, int] = Field(default_factory=dict)
+    top_paths: dict[str, int] = Field(default_factory=dict)
     
     # Detailed stats
-    devices: Dict[str, int] = Field(default_factory=dict)
-    browsers: Dict[str, int] = Field(default_factory=dict)
-    countries: Dict[str, int] = Field(default_factory=dict)
-    country_codes: Dict[str, int] = Field(default_factory=dict)
+    devices: dict[str, int] = Field(default_factory=dict)
+    browsers: dict[str, int] = Field(default_factory=dict)
+    countries: dict[str, int] = Field(default_factory=dict)
+    country_codes: dict[str, int] = Field(default_factory=dict)
     
     # Status codes
-    status_codes: Dict[str, int] = Field(default_factory=dict)
+    status_codes: dict[str, int] = Field(default_factory=dict)
@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class OAuthLinkRequest(BaseModel):
@@ -11,6 +11,8 @@ class OAuthLinkRequest(BaseModel):
 
 
 class OAuthLoginRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     provider: str
     provider_id: str
     email: Optional[str] = None
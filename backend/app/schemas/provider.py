@@ -2,9 +2,28 @@
 Provider schemas - DTOs for API requests/responses
 """
 
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ProviderCredentials(BaseModel):
+    """
+    Credentials accepted by the provider drivers.
+    Keys match the credentials_required declared in DriversController;
+    unknown keys are kept so a driver's credentials are never dropped.
+    """
+
+    token: Optional[str] = Field(None, description="Cloudflare tunnel token")
+    authtoken: Optional[str] = Field(None, description="ngrok authtoken")
+    api_token: Optional[str] = Field(None, description="Cloudflare API token")
+    account_id: Optional[str] = Field(None, description="Cloudflare account ID")
+    zone_id: Optional[str] = Field(None, description="Cloudflare DNS zone ID")
+    api_user: Optional[str] = Field(None, description="Namecheap API user")
+    api_key: Optional[str] = Field(None, description="Namecheap API key")
+    username: Optional[str] = Field(None, description="Namecheap account username")
+
+    model_config = ConfigDict(extra="allow")
 
 
 class ProviderCreateRequest(BaseModel):
@@ -15,16 +34,17 @@ class ProviderCreateRequest(BaseModel):
 
     name: str = Field(..., min_length=3, max_length=255, description="User-defined name")
     types: list[str] = Field(..., description="Provider types (cloudflare_tunnel, cloudflare_dns, etc)")
-    credentials: Dict[str, Any] = Field(..., description="Provider credentials")
+    credentials: ProviderCredentials = Field(..., description="Provider credentials")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "My Cloudflare Account",
                 "types": ["cloudflare_tunnel", "cloudflare_dns"],
                 "credentials": {"token": "eyJhIjoiYWJjMTIzIiwidCI6ImRlZjQ1NiIsInMiOiJnaGk3ODkifQ=="},
             }
-        }
+        },
+    )
 
 
 class ProviderResponse(BaseModel):
@@ -41,8 +61,12 @@ class ProviderResponse(BaseModel):
     is_active: bool = True
     created_at: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "My Cloudflare Account",
@@ -52,7 +76,8 @@ class ProviderResponse(BaseModel):
                 "is_active": True,
                 "created_at": "2024-01-01T00:00:00",
             }
-        }
+        },
+    )
 
 
 class ProviderUpdateRequest(BaseModel):
@@ -61,5 +86,5 @@ class ProviderUpdateRequest(BaseModel):
     """
 
     name: Optional[str] = Field(None, min_length=3, max_length=255)
-    credentials: Optional[Dict[str, Any]] = None
+    credentials: Optional[ProviderCredentials] = None
     is_active: Optional[bool] = None
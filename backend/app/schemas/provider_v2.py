@@ -4,7 +4,9 @@ Provider schemas - DTOs for API requests/responses
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.provider import ProviderCredentials
 
 
 class ProviderCreateRequest(BaseModel):
@@ -15,18 +17,19 @@ class ProviderCreateRequest(BaseModel):
 
     name: str = Field(..., min_length=3, max_length=255, description="User-defined name")
     provider: str = Field(..., description="Provider name (cloudflare, ngrok)")
-    credentials: Dict[str, Any] = Field(..., description="Provider credentials")
+    credentials: ProviderCredentials = Field(..., description="Provider credentials")
     enable_protocols: List[str] = Field(default=[], description="Protocols to enable immediately")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "My Cloudflare Account",
                 "provider": "cloudflare",
                 "credentials": {"api_token": "abc123...", "account_id": "xyz789..."},
                 "enable_protocols": ["http", "https", "dns"],
             }
-        }
+        },
+    )
 
 
 class ProviderResponse(BaseModel):
@@ -43,8 +46,12 @@ class ProviderResponse(BaseModel):
     is_active: bool
     created_at: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "My Cloudflare Account",
@@ -58,7 +65,8 @@ class ProviderResponse(BaseModel):
                 "is_active": True,
                 "created_at": "2024-01-01T00:00:00",
             }
-        }
+        },
+    )
 
 
 class DriverEnableRequest(BaseModel):
@@ -67,8 +75,9 @@ class DriverEnableRequest(BaseModel):
     protocol: str = Field(..., description="Protocol to enable (http, https, tcp, etc)")
     config: Optional[Dict[str, Any]] = Field(default={}, description="Protocol-specific configuration")
 
-    class Config:
-        json_schema_extra = {"example": {"protocol": "http", "config": {"auto_https": True, "compression": True}}}
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"protocol": "http", "config": {"auto_https": True, "compression": True}}}
+    )
 
 
 class DriverResponse(BaseModel):
@@ -3,8 +3,9 @@ Server schemas for API requests and responses.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 
 class ServerBase(BaseModel):
@@ -44,8 +45,7 @@ class ServerResponse(ServerBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True, populate_by_name=True)
 
 
 class ServerWithServices(ServerResponse):
@@ -54,6 +54,10 @@ class ServerWithServices(ServerResponse):
     services: list[dict] = Field(default_factory=list)
 
 
+# Built once at import; serializes server lists straight to JSON bytes in pydantic-core
+SERVER_LIST_ADAPTER = TypeAdapter(list[ServerWithServices])
+
+
 class ServerDetailResponse(ServerResponse):
     """Detailed server response with agent status and discovered services"""
     
@@ -64,9 +68,6 @@ class ServerDetailResponse(ServerResponse):
     
     # Discovered services (parsed)
     discovered_services: list[dict] = Field(default_factory=list, description="Services discovered by CLI agent")
-    
-    class Config:
-        from_attributes = True
 
 
 class ConnectivityCheckResponse(BaseModel):
@@ -77,7 +78,8 @@ class ConnectivityCheckResponse(BaseModel):
     error: Optional[str] = None
 
 
-class DetectedService(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DetectedService:
     """Detected service information"""
 
     port: int
@@ -88,7 +90,8 @@ class DetectedService(BaseModel):
     banner: Optional[str] = None
 
 
-class NetworkScanResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NetworkScanResult:
     """Result from network scan"""
 
     host: str
@@ -102,7 +105,7 @@ class ServerStatus(BaseModel):
     """Server status response."""
     server_id: str
     name: str
-    agent_status: str  # "installed", "connected", "disconnected", "not_installed"
+    agent_status: Literal["installed", "connected", "disconnected", "not_installed"]
     is_reachable: bool
     last_check: Optional[datetime] = None
     os_type: Optional[str] = None
@@ -110,7 +113,8 @@ class ServerStatus(BaseModel):
     memory_gb: Optional[float] = None
 
 
-class StatsEntry(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StatsEntry:
     """Single stats entry."""
     timestamp: str
     cpu_percent: float
@@ -124,5 +128,5 @@ class StatsEntry(BaseModel):
 class PortTestRequest(BaseModel):
     """Request model for port testing"""
     port: int
-    protocol: str = "tcp"
+    protocol: Literal["tcp", "udp"] = "tcp"
 
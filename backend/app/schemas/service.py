@@ -1,8 +1,8 @@
-from typing import List, Dict, Optional
+from typing import List, Literal, Optional
 import uuid
 from app.enums.service import ServiceProtocol
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ServiceCreateRequest(BaseModel):
@@ -91,8 +91,7 @@ class ServiceResponse(BaseModel):
     is_quick_service: bool = True
     expected_container_name: str = ""
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True, populate_by_name=True)
 
 
 # === Runtime DTOs ===
@@ -102,13 +101,28 @@ class ServiceAgentRequest(BaseModel):
     """Request para activar un servicio."""
 
     port: int = Field(..., ge=1, le=65535, description="Puerto del host a exponer")
-    protocol: str = Field("http", description="Protocolo (http/https)")
+    protocol: Literal["http", "https"] = Field("http", description="Protocolo (http/https)")
     provider: str = Field("cloudflare", description="Proveedor del servicio")
     subdomain: Optional[str] = Field(None, description="Subdominio personalizado (si el proveedor lo soporta)")
     domain: Optional[str] = Field(None, description="Dominio personalizado (si el proveedor lo soporta)")
     region: Optional[str] = Field(None, description="Región del servidor (para ngrok)")
 
 
+class CnameRecordInstructions(BaseModel):
+    """Registro CNAME que el usuario debe crear en su DNS."""
+
+    name: Optional[str] = None
+    target: str
+    type: str = "CNAME"
+    description: Optional[str] = None
+
+
+class SetupInstructions(BaseModel):
+    """Instrucciones de configuración para Named Services."""
+
+    cname_record: Optional[CnameRecordInstructions] = None
+
+
 class ServiceAgentResponse(BaseModel):
     """Response cuando se activa un servicio."""
 
@@ -121,7 +135,7 @@ class ServiceAgentResponse(BaseModel):
     # Campos adicionales para Named Services
     tunnel_url: Optional[str] = None
     cname_target: Optional[str] = None
-    setup_instructions: Optional[Dict] = None
+    setup_instructions: Optional[SetupInstructions] = None
 
 
 class ServiceListResponse(BaseModel):
@@ -130,3 +144,7 @@ class ServiceListResponse(BaseModel):
     services: List[ServiceAgentResponse]
     total: int
     providers: List[str]
+
+
+# Construidos una vez al importar; serializan listas directamente a JSON en pydantic-core
+SERVICE_LIST_ADAPTER = TypeAdapter(List[ServiceResponse])
@@ -4,7 +4,7 @@ Tunnel schemas - DTOs for API requests/responses
 
 from typing import Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.enums import TunnelProtocol
 
@@ -24,8 +24,8 @@ class TunnelCreateRequest(BaseModel):
     dns_provider_key: Optional[str] = Field(None, description="DNS provider key (optional)")
     config: Optional[Dict[str, Any]] = Field(None, description="Tunnel configuration (tunnel_mode, hostname, etc.)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Mi App Puerto 3006",
                 "provider_key": "cloudflare",
@@ -33,7 +33,8 @@ class TunnelCreateRequest(BaseModel):
                 "port": 3006,
                 "host": "localhost",
             }
-        }
+        },
+    )
 
 
 class TunnelResponse(BaseModel):
@@ -58,8 +59,12 @@ class TunnelResponse(BaseModel):
     created_at: str
     started_at: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "Mi App Puerto 3006",
@@ -71,7 +76,8 @@ class TunnelResponse(BaseModel):
                 "public_url": None,
                 "created_at": "2024-01-01T00:00:00",
             }
-        }
+        },
+    )
 
 
 class TunnelUpdateRequest(BaseModel):
@@ -1,31 +1,143 @@
 """
-Analytics Service - Gestión de métricas y analytics con TinyDB
+Analytics Service - Gestión de métricas y analytics con SQLite
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from tinydb import TinyDB, Query
+from collections import Counter, deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
+import asyncio
+import logging
+import socket
+import sqlite3
+import sys
+import time
 import geoip2.database
 from user_agents import parse as parse_user_agent
 
+logger = logging.getLogger(__name__)
+
+# Rangos IPv4 sin datos GeoIP (privados, loopback, link-local) como [inicio, fin) en enteros
+_NO_GEO_RANGES = (
+    (0x0A000000, 0x0B000000),  # 10.0.0.0/8
+    (0x7F000000, 0x80000000),  # 127.0.0.0/8
+    (0xA9FE0000, 0xA9FF0000),  # 169.254.0.0/16
+    (0xAC100000, 0xAC200000),  # 172.16.0.0/12
+    (0xC0A80000, 0xC0A90000),  # 192.168.0.0/16
+)
+_UNKNOWN_GEO = ("Unknown", "XX")
+
+
+def _has_no_geo(ip: str) -> bool:
+    """Indicar si la IP es IPv4 de un rango que GeoIP nunca resuelve"""
+    try:
+        ip_int = int.from_bytes(socket.inet_aton(ip), "big")
+    except (OSError, TypeError):
+        return False
+    for start, end in _NO_GEO_RANGES:
+        if start <= ip_int < end:
+            return True
+    return False
+
+
+# Estadísticas de un túnel sin tráfico: plantilla de solo lectura; cada consulta recibe copias
+_EMPTY_STATS = MappingProxyType(
+    {
+        "total_requests": 0,
+        "avg_response_time_ms": 0,
+        "countries": MappingProxyType({}),
+        "browsers": MappingProxyType({}),
+        "devices": MappingProxyType({"mobile": 0, "tablet": 0, "desktop": 0, "bot": 0}),
+        "status_codes": MappingProxyType({}),
+        "top_paths": MappingProxyType({}),
+    }
+)
+
+# Clase de dispositivo guardada como entero: índice -> nombre
+DEVICE_DESKTOP, DEVICE_MOBILE, DEVICE_TABLET, DEVICE_BOT = range(4)
+
+
+def _device_class(is_bot: bool, is_mobile: bool, is_tablet: bool) -> int:
+    """Clasificar un dispositivo (bot tiene prioridad, como en las estadísticas)"""
+    if is_bot:
+        return DEVICE_BOT
+    if is_mobile:
+        return DEVICE_MOBILE
+    if is_tablet:
+        return DEVICE_TABLET
+    return DEVICE_DESKTOP
+
+
+@lru_cache(maxsize=4096)
+def _parse_user_agent(user_agent: str) -> Tuple:
+    """
+    Parsear un User-Agent a las columnas de browser/os y la clase de dispositivo
+
+    La cardinalidad real de User-Agents es baja, así que el caché acierta casi siempre.
+    """
+    ua = parse_user_agent(user_agent or "")
+    return (
+        sys.intern(ua.browser.family),
+        ua.browser.version_string,
+        sys.intern(ua.os.family),
+        ua.os.version_string,
+        _device_class(ua.is_bot, ua.is_mobile, ua.is_tablet),
+    )
+
 
 class AnalyticsService:
     """Servicio para almacenar y consultar analytics de túneles"""
 
-    def __init__(self, db_path: str = "database/analytics.json"):
+    # Columnas de la tabla requests (orden de inserción)
+    COLUMNS = (
+        "tunnel_id",
+        "ts",
+        "ip",
+        "method",
+        "path",
+        "status_code",
+        "response_time_ms",
+        "request_size_bytes",
+        "response_size_bytes",
+        "referer",
+        "accept_language",
+        "browser_family",
+        "browser_version",
+        "os_family",
+        "os_version",
+        "device_class",
+        "country",
+        "country_code",
+    )
+    INSERT_SQL = f"INSERT INTO requests ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+    # Escritura por lotes: se vuelca cada FLUSH_INTERVAL_SECONDS o al llegar a FLUSH_BATCH_SIZE filas
+    FLUSH_INTERVAL_SECONDS = 0.25
+    FLUSH_BATCH_SIZE = 500
+
+    def __init__(self, db_path: str = "database/analytics.sqlite"):
         """
         Inicializar servicio de analytics
 
         Args:
-            db_path: Ruta al archivo TinyDB
+            db_path: Ruta a la base de datos SQLite
         """
         # Crear directorio si no existe
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.db = TinyDB(db_path)
-        self.requests_table = self.db.table("requests")
-        self.sessions_table = self.db.table("sessions")
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._read_conn: Optional[sqlite3.Connection] = None
+
+        # GeoIP cacheado por IP: (country, country_code)
+        self._geo_lookup = lru_cache(maxsize=65536)(self._lookup_geo)
+
+        # Requests crudos pendientes de escribir y tarea que los vuelca
+        self._buffer: Deque[Tuple] = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_event: Optional[asyncio.Event] = None
 
         # GeoIP reader (opcional, requiere base de datos)
         self.geoip_reader = None
@@ -36,6 +148,64 @@ class AnalyticsService:
         except Exception:
             pass
 
+    def _get_conn(self) -> sqlite3.Connection:
+        """Obtener la conexión SQLite (se crea en el primer uso)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS requests (
+                    tunnel_id TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    ip TEXT,
+                    method TEXT,
+                    path TEXT,
+                    status_code INTEGER,
+                    response_time_ms REAL,
+                    request_size_bytes INTEGER,
+                    response_size_bytes INTEGER,
+                    referer TEXT,
+                    accept_language TEXT,
+                    browser_family TEXT,
+                    browser_version TEXT,
+                    os_family TEXT,
+                    os_version TEXT,
+                    device_class INTEGER NOT NULL,
+                    country TEXT,
+                    country_code TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_requests_tunnel_ts ON requests (tunnel_id, ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_requests_ts ON requests (ts)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_read_conn(self) -> sqlite3.Connection:
+        """
+        Obtener la conexión de solo lectura usada por las estadísticas
+
+        En modo autocommit no abre transacciones y, con WAL, lee sin bloquear
+        los volcados de la conexión de escritura.
+        """
+        if self._read_conn is None:
+            self._get_conn()  # Asegura que el esquema exista
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            self._read_conn = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+        return self._read_conn
+
+    def close(self):
+        """Cerrar las conexiones SQLite"""
+        if self._read_conn is not None:
+            self._read_conn.close()
+            self._read_conn = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def log_request(
         self,
         tunnel_id: str,
@@ -65,67 +235,238 @@ class AnalyticsService:
             accept_language: Accept-Language header
 
         Returns:
-            Dict con el registro creado
+            Dict con el registro encolado (sin enriquecer; UA y GeoIP se
+            resuelven al escribir el lote)
         """
-        # Parse User-Agent
-        ua = parse_user_agent(user_agent)
-
-        # GeoIP lookup
-        geo_data = self._get_geo_data(ip)
+        now = time.time()
+
+        # Valores muy repetidos: los requests encolados comparten un único objeto
+        # (los eventos de /analytics/batch pueden traerlos vacíos)
+        if isinstance(tunnel_id, str):
+            tunnel_id = sys.intern(tunnel_id)
+        if isinstance(method, str):
+            method = sys.intern(method)
+
+        # Camino rápido: solo encolar los datos crudos
+        self._buffer.append(
+            (
+                int(now * 1000),
+                tunnel_id,
+                ip,
+                user_agent,
+                method,
+                path,
+                status_code,
+                response_time_ms,
+                request_size_bytes,
+                response_size_bytes,
+                referer,
+                accept_language,
+            )
+        )
+        self._schedule_flush()
 
-        # Crear registro
-        record = {
+        return {
             "tunnel_id": tunnel_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcfromtimestamp(now).isoformat(),
             "ip": ip,
             "method": method,
             "path": path,
             "status_code": status_code,
             "response_time_ms": response_time_ms,
-            "request_size_bytes": request_size_bytes,
-            "response_size_bytes": response_size_bytes,
-            "referer": referer,
-            "accept_language": accept_language,
-            # User-Agent parsed
-            "browser": {
-                "family": ua.browser.family,
-                "version": ua.browser.version_string,
-            },
-            "os": {
-                "family": ua.os.family,
-                "version": ua.os.version_string,
-            },
-            "device": {
-                "family": ua.device.family,
-                "brand": ua.device.brand,
-                "model": ua.device.model,
-                "is_mobile": ua.is_mobile,
-                "is_tablet": ua.is_tablet,
-                "is_pc": ua.is_pc,
-                "is_bot": ua.is_bot,
-            },
-            # GeoIP
-            "geo": geo_data,
         }
 
-        # Insertar en DB
-        self.requests_table.insert(record)
+    def _enrich(self, raw: Tuple) -> Tuple:
+        """
+        Convertir un request encolado en una fila de la tabla requests
+
+        Parsea el User-Agent y resuelve GeoIP (ambos cacheados por valor).
 
-        return record
+        Args:
+            raw: Tupla encolada por log_request
+
+        Returns:
+            Tupla en el orden de COLUMNS
+        """
+        (
+            ts,
+            tunnel_id,
+            ip,
+            user_agent,
+            method,
+            path,
+            status_code,
+            response_time_ms,
+            request_size_bytes,
+            response_size_bytes,
+            referer,
+            accept_language,
+        ) = raw
+        return (
+            tunnel_id,
+            ts,
+            ip,
+            method,
+            path,
+            status_code,
+            response_time_ms,
+            request_size_bytes,
+            response_size_bytes,
+            referer,
+            accept_language,
+            *_parse_user_agent(user_agent),
+            *self._geo_lookup(ip),
+        )
+
+    def _schedule_flush(self):
+        """Arrancar el volcado en segundo plano o escribir ya si no hay event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_buffer()
+            return
+
+        if self._flush_task is None or self._flush_task.done() or self._flush_task.get_loop() is not loop:
+            self._flush_event = asyncio.Event()
+            self._flush_task = loop.create_task(self._flush_loop())
+
+        if len(self._buffer) >= self.FLUSH_BATCH_SIZE:
+            self._flush_event.set()
+
+    async def _flush_loop(self):
+        """Tarea de fondo: volcar el buffer periódicamente o cuando se llena"""
+        event = self._flush_event
+        while True:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self.FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            event.clear()
+
+            try:
+                self._flush_buffer()
+            except Exception as e:
+                logger.error(f"Error writing analytics batch: {e}")
+
+    def _flush_buffer(self):
+        """
+        Escribir todas las filas pendientes en una sola transacción
+
+        Un request malformado se descarta solo (no el lote entero); si la
+        escritura falla por otra causa, el lote vuelve al buffer.
+        """
+        if not self._buffer:
+            return
+
+        pending = []
+        rows = []
+        while self._buffer:
+            raw = self._buffer.popleft()
+            try:
+                rows.append(self._enrich(raw))
+            except Exception as e:
+                logger.warning(f"Dropping malformed analytics request: {e}")
+                continue
+            pending.append(raw)
+
+        if not rows:
+            return
+
+        conn = self._get_conn()
+        try:
+            with conn:
+                conn.executemany(self.INSERT_SQL, rows)
+        except sqlite3.IntegrityError:
+            # Algún request viola la tabla (p. ej. tunnel_id NULL): escribir fila a fila
+            self._insert_each(conn, rows)
+        except Exception:
+            # Reencolar el lote en su orden original para el siguiente volcado
+            self._buffer.extendleft(reversed(pending))
+            raise
+
+    def _insert_each(self, conn: sqlite3.Connection, rows: List[Tuple]):
+        """Escribir filas una a una en una transacción, descartando las inválidas"""
+        with conn:
+            for row in rows:
+                try:
+                    conn.execute(self.INSERT_SQL, row)
+                except sqlite3.IntegrityError as e:
+                    logger.warning(f"Dropping invalid analytics request: {e}")
+
+    async def flush(self):
+        """Escribir inmediatamente los requests pendientes"""
+        self._flush_buffer()
+
+    async def stop(self):
+        """Detener el volcado en segundo plano, escribir lo pendiente y cerrar la BD"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+
+        self._flush_buffer()
+        self.close()
+
+    @staticmethod
+    def record_to_row(record: Dict, ts: int) -> Tuple:
+        """
+        Convertir un registro (formato dict) a una fila de la tabla requests
+
+        Args:
+            record: Registro con browser/os/device/geo anidados
+            ts: Timestamp en milisegundos Unix
+
+        Returns:
+            Tupla en el orden de COLUMNS
+        """
+        browser = record.get("browser") or {}
+        os_data = record.get("os") or {}
+        device = record.get("device") or {}
+        geo = record.get("geo") or {}
+        return (
+            record.get("tunnel_id"),
+            ts,
+            record.get("ip"),
+            record.get("method"),
+            record.get("path", "/"),
+            record.get("status_code", 0),
+            record.get("response_time_ms", 0),
+            record.get("request_size_bytes", 0),
+            record.get("response_size_bytes", 0),
+            record.get("referer"),
+            record.get("accept_language"),
+            browser.get("family", "Unknown"),
+            browser.get("version"),
+            os_data.get("family"),
+            os_data.get("version"),
+            _device_class(device.get("is_bot"), device.get("is_mobile"), device.get("is_tablet")),
+            geo.get("country", "Unknown"),
+            geo.get("country_code", "XX"),
+        )
 
     def _get_geo_data(self, ip: str) -> Dict:
         """Obtener datos geográficos de una IP"""
-        if not self.geoip_reader:
-            return {"country": "Unknown", "country_code": "XX"}
+        country, country_code = self._geo_lookup(ip)
+        return {"country": country, "country_code": country_code}
+
+    def _lookup_geo(self, ip: str) -> Tuple[str, str]:
+        """Consultar GeoIP para una IP (sin caché)"""
+        # Tráfico LAN/loopback: sin consultar la base ni pasar por la excepción de "no encontrada"
+        if not self.geoip_reader or not ip or _has_no_geo(ip):
+            return _UNKNOWN_GEO
 
         try:
             response = self.geoip_reader.country(ip)
-            return {
-                "country": response.country.name or "Unknown",
-                "country_code": response.country.iso_code or "XX",
-            }
+            # Interning: las entradas del caché por IP comparten los pocos países distintos
+            return (
+                sys.intern(response.country.name or "Unknown"),
+                sys.intern(response.country.iso_code or "XX"),
+            )
         except Exception:
-            return {"country": "Unknown", "country_code": "XX"}
+            return _UNKNOWN_GEO
 
     def get_tunnel_stats(self, tunnel_id: str, hours: int = 24) -> Dict:
         """
@@ -138,114 +479,97 @@ class AnalyticsService:
         Returns:
             Dict con estadísticas
         """
-        Request = Query()
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        # Filtrar requests del túnel en el período
-        requests = self.requests_table.search(
-            (Request.tunnel_id == tunnel_id) & (Request.timestamp >= since.isoformat())
+        self._flush_buffer()
+        since_ms = int((time.time() - hours * 3600) * 1000)
+        params = (tunnel_id, since_ms)
+        conn = self._get_read_conn()
+
+        # Una sola pasada sobre el índice (tunnel_id, ts): SQLite agrupa las dimensiones de
+        # baja cardinalidad y aquí solo se suman unas pocas filas por combinación
+        rows = conn.execute(
+            "SELECT country, country_code, browser_family, status_code, device_class, "
+            "COUNT(*), COUNT(response_time_ms), TOTAL(response_time_ms) "
+            "FROM requests WHERE tunnel_id = ? AND ts >= ? GROUP BY 1, 2, 3, 4, 5",
+            params,
         )
 
-        if not requests:
-            return self._empty_stats()
-
-        # Calcular estadísticas
-        total_requests = len(requests)
-
-        # Por país y código
-        countries = {}
-        country_codes = {}
-        for req in requests:
-            geo = req.get("geo", {})
-            country = geo.get("country", "Unknown")
-            code = geo.get("country_code", "XX")
-            
-            countries[country] = countries.get(country, 0) + 1
-            if code != "XX":
-                country_codes[code] = country_codes.get(code, 0) + 1
-
-        # Por navegador
-        browsers = {}
-        for req in requests:
-            browser = req.get("browser", {}).get("family", "Unknown")
-            browsers[browser] = browsers.get(browser, 0) + 1
-
-        # Por dispositivo
-        devices = {"mobile": 0, "tablet": 0, "desktop": 0, "bot": 0}
-        for req in requests:
-            device = req.get("device", {})
-            if device.get("is_bot"):
-                devices["bot"] += 1
-            elif device.get("is_mobile"):
-                devices["mobile"] += 1
-            elif device.get("is_tablet"):
-                devices["tablet"] += 1
-            else:
-                devices["desktop"] += 1
-
-        # Por status code
-        status_codes = {}
-        for req in requests:
-            code = str(req.get("status_code", 0))
-            status_codes[code] = status_codes.get(code, 0) + 1
-
-        # Tiempo de respuesta promedio
-        response_times = [r.get("response_time_ms", 0) for r in requests]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        countries: Counter = Counter()
+        country_codes: Counter = Counter()
+        browsers: Counter = Counter()
+        status_codes: Counter = Counter()
+        device_counts = [0, 0, 0, 0]
+        total_requests = timed_requests = 0
+        total_response_time = 0.0
+
+        for country, country_code, browser, status_code, device_class, count, timed, time_sum in rows:
+            total_requests += count
+            timed_requests += timed
+            total_response_time += time_sum
+            countries[country] += count
+            if country_code is not None and country_code != "XX":
+                country_codes[country_code] += count
+            browsers[browser] += count
+            status_codes[str(status_code)] += count
+            device_counts[device_class] += count
+
+        if not total_requests:
+            # Contadores vacíos copiados de la plantilla
+            return {"tunnel_id": tunnel_id, "period_hours": hours, **self._empty_stats()}
+
+        devices = {
+            "mobile": device_counts[DEVICE_MOBILE],
+            "tablet": device_counts[DEVICE_TABLET],
+            "desktop": device_counts[DEVICE_DESKTOP],
+            "bot": device_counts[DEVICE_BOT],
+        }
 
         # Top paths
-        paths = {}
-        for req in requests:
-            path = req.get("path", "/")
-            paths[path] = paths.get(path, 0) + 1
-        top_paths = sorted(paths.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_paths = conn.execute(
+            "SELECT path, COUNT(*) AS n FROM requests WHERE tunnel_id = ? AND ts >= ? "
+            "GROUP BY path ORDER BY n DESC LIMIT 10",
+            params,
+        ).fetchall()
 
         return {
             "tunnel_id": tunnel_id,
             "period_hours": hours,
             "total_requests": total_requests,
-            "avg_response_time_ms": round(avg_response_time, 2),
-            "countries": countries,
-            "country_codes": country_codes,
-            "browsers": browsers,
+            "avg_response_time_ms": round(total_response_time / timed_requests, 2) if timed_requests else 0,
+            "countries": dict(countries),
+            "country_codes": dict(country_codes),
+            "browsers": dict(browsers),
             "devices": devices,
-            "status_codes": status_codes,
+            "status_codes": dict(status_codes),
             "top_paths": dict(top_paths),
         }
 
     def _empty_stats(self) -> Dict:
-        """Retornar estadísticas vacías"""
-        return {
-            "total_requests": 0,
-            "avg_response_time_ms": 0,
-            "countries": {},
-            "browsers": {},
-            "devices": {"mobile": 0, "tablet": 0, "desktop": 0, "bot": 0},
-            "status_codes": {},
-            "top_paths": {},
-        }
+        """Retornar estadísticas vacías (dicts nuevos, mismos tipos que con tráfico)"""
+        return {key: dict(value) if isinstance(value, Mapping) else value for key, value in _EMPTY_STATS.items()}
 
     def get_realtime_stats(self, tunnel_id: str, minutes: int = 5) -> Dict:
         """Obtener estadísticas en tiempo real (últimos N minutos)"""
-        Request = Query()
-        since = datetime.utcnow() - timedelta(minutes=minutes)
+        self._flush_buffer()
+        since_ms = int((time.time() - minutes * 60) * 1000)
 
-        requests = self.requests_table.search(
-            (Request.tunnel_id == tunnel_id) & (Request.timestamp >= since.isoformat())
-        )
+        (requests_count,) = self._get_read_conn().execute(
+            "SELECT COUNT(*) FROM requests WHERE tunnel_id = ? AND ts >= ?",
+            (tunnel_id, since_ms),
+        ).fetchone()
 
         return {
             "tunnel_id": tunnel_id,
             "period_minutes": minutes,
-            "requests_count": len(requests),
-            "requests_per_minute": len(requests) / minutes if minutes > 0 else 0,
+            "requests_count": requests_count,
+            "requests_per_minute": requests_count / minutes if minutes > 0 else 0,
         }
 
     def cleanup_old_data(self, days: int = 30):
         """Limpiar datos antiguos"""
-        Request = Query()
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        self._flush_buffer()
+        cutoff_ms = int((time.time() - days * 86400) * 1000)
 
-        removed = self.requests_table.remove(Request.timestamp < cutoff.isoformat())
+        with self._get_conn() as conn:
+            removed = conn.execute("DELETE FROM requests WHERE ts < ?", (cutoff_ms,)).rowcount
 
-        return {"removed_count": len(removed) if removed else 0}
+        return {"removed_count": removed}
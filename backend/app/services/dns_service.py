@@ -5,16 +5,45 @@ Resolves the appropriate DNS driver based on provider.
 """
 
 import logging
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, FrozenSet
 
 from app.enums import DNSProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _cloudflare_driver() -> Any:
+    from app.integrations.cloudflare.dns_driver import CloudflareDNSDriver
+
+    return CloudflareDNSDriver()
+
+
+def _namecheap_driver() -> Any:
+    from app.integrations.namecheap.dns_driver import NamecheapDNSDriver
+
+    return NamecheapDNSDriver()
+
+
+# Driver factories by provider (imports stay lazy until first use)
+_DRIVER_FACTORIES: Dict[DNSProvider, Callable[[], Any]] = {
+    DNSProvider.CLOUDFLARE: _cloudflare_driver,
+    DNSProvider.NAMECHEAP: _namecheap_driver,
+}
+
+
+@lru_cache(maxsize=None)
+def _cached_driver(provider: DNSProvider) -> Any:
+    """Build a provider's driver once; drivers are stateless (credentials go per call)."""
+    return _DRIVER_FACTORIES[provider]()
+
+
 class DNSService:
     """Service Locator for DNS drivers"""
 
+    # Providers with a driver; shared immutable set, O(1) membership
+    _SUPPORTED: ClassVar[FrozenSet[DNSProvider]] = frozenset(_DRIVER_FACTORIES)
+
     @staticmethod
     def resolve(provider: DNSProvider) -> Any:
         """
@@ -33,20 +62,11 @@ class DNSService:
             >>> driver = DNSService.resolve(DNSProvider.CLOUDFLARE)
             >>> zones = await driver.list_zones(credentials)
         """
-        logger.debug(f"Resolving DNS driver for {provider.value}")
-
-        # Cloudflare DNS
-        if provider == DNSProvider.CLOUDFLARE:
-            from app.integrations.cloudflare.dns_driver import CloudflareDNSDriver
-            return CloudflareDNSDriver()
-
-        # Namecheap DNS
-        elif provider == DNSProvider.NAMECHEAP:
-            from app.integrations.namecheap.dns_driver import NamecheapDNSDriver
-            return NamecheapDNSDriver()
+        if provider in DNSService._SUPPORTED:
+            return _cached_driver(provider)
 
         # Route53 DNS
-        elif provider == DNSProvider.ROUTE53:
+        if provider == DNSProvider.ROUTE53:
             # TODO: Implement Route53 driver
             raise NotImplementedError(f"Route53 driver not yet implemented")
 
@@ -54,18 +74,14 @@ class DNSService:
         raise ValueError(f"No DNS driver available for provider '{provider.value}'")
 
     @staticmethod
-    def get_supported_providers() -> list:
+    def get_supported_providers() -> FrozenSet[DNSProvider]:
         """
         Get all supported DNS providers.
 
         Returns:
-            List of supported DNSProvider enums
+            Frozenset of supported DNSProvider enums (ROUTE53 once its driver exists)
         """
-        return [
-            DNSProvider.CLOUDFLARE,
-            DNSProvider.NAMECHEAP,
-            # DNSProvider.ROUTE53,  # TODO: Uncomment when implemented
-        ]
+        return DNSService._SUPPORTED
 
     @staticmethod
     def is_supported(provider: DNSProvider) -> bool:
@@ -78,7 +94,7 @@ class DNSService:
         Returns:
             True if supported, False otherwise
         """
-        return provider in DNSService.get_supported_providers()
+        return provider in DNSService._SUPPORTED
 
 
 # Singleton instance (optional, can use static methods directly)
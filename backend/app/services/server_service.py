@@ -2,11 +2,13 @@
 Server service - Business logic for server management.
 """
 
-import json
-from typing import Optional
+import asyncio
+import time
+from typing import Dict, Optional, Set, Tuple
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
-from app.models.server import Server
+from app.models.server import LOCAL_HOSTS, Server
 from app.repositories.server_repository import server_repository
 from core.network import network_utils
 from core.network import ServiceInfo
@@ -18,16 +20,101 @@ from app.schemas.server import (
     DetectedService,
 )
 from core.logger import setup_logger
+from core.serialization import dumps
 
 logger = setup_logger(__name__)
 
+# Serializes a whole list of detected services in one pydantic-core call
+_DETECTED_SERVICES = TypeAdapter(list[DetectedService])
+
+
+def _detected_services(open_ports: list[ServiceInfo]) -> list[DetectedService]:
+    """Schemas for scanned ports, built once for both the stored JSON and the response"""
+    return [
+        DetectedService(
+            port=s.port,
+            protocol=s.protocol,
+            service_name=s.service_name,
+            confidence=s.confidence,
+            version=s.version,
+            banner=s.banner,
+        )
+        for s in open_ports
+    ]
+
 
 class ServerService:
     """Service for server management operations"""
 
+    # Connectivity results are reused for this long (seconds); failures expire sooner
+    REACHABLE_TTL = 30.0
+    UNREACHABLE_TTL = 5.0
+    # Hosts that gave nothing in a network scan are skipped by later scans for this long (seconds)
+    DEAD_HOST_TTL = 60.0
+
     def __init__(self):
         self.repo = server_repository
         self.network = network_utils
+        # (host, port) -> (expires_at, reachable, latency_ms), on the monotonic clock
+        self._conn_cache: Dict[Tuple[str, Optional[int]], Tuple[float, bool, Optional[float]]] = {}
+        self._conn_refreshing: Set[Tuple[str, Optional[int]]] = set()
+        # host -> expires_at for hosts with no result in a recent network scan
+        self._dead_hosts: Dict[str, float] = {}
+
+    @staticmethod
+    async def _db(fn, *args, **kwargs):
+        """Run a blocking repository call in a worker thread, off the event loop"""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def _remember_connectivity(
+        self, host: str, port: Optional[int], reachable: bool, latency: Optional[float]
+    ) -> None:
+        """Store a connectivity result with its TTL"""
+        ttl = self.REACHABLE_TTL if reachable else self.UNREACHABLE_TTL
+        self._conn_cache[(host, port)] = (time.monotonic() + ttl, reachable, latency)
+
+    async def _probe_connectivity(self, host: str, port: Optional[int]) -> Tuple[bool, Optional[float]]:
+        """Probe the network and cache the result"""
+        reachable, latency = await self.network.check_connectivity(host, port)
+        self._remember_connectivity(host, port, reachable, latency)
+        return reachable, latency
+
+    async def _refresh_connectivity(self, key: Tuple[str, Optional[int]]) -> None:
+        """Background refresh for a stale cache entry"""
+        try:
+            await self._probe_connectivity(*key)
+        except Exception as e:
+            logger.debug("Background connectivity refresh failed for %s: %s", key, e)
+        finally:
+            self._conn_refreshing.discard(key)
+
+    async def _cached_connectivity(
+        self, host: str, port: Optional[int], allow_stale: bool = False
+    ) -> Tuple[Tuple[bool, Optional[float]], bool]:
+        """
+        Connectivity for host/port, probing only when the cached result expired.
+
+        Args:
+            host: Target host
+            port: Optional port
+            allow_stale: Return an expired result immediately and refresh it in the background
+
+        Returns:
+            ((reachable, latency_ms), from_cache)
+        """
+        key = (host, port)
+        entry = self._conn_cache.get(key)
+        if entry is not None:
+            expires_at, reachable, latency = entry
+            if expires_at > time.monotonic():
+                return (reachable, latency), True
+            if allow_stale:
+                if key not in self._conn_refreshing:
+                    self._conn_refreshing.add(key)
+                    asyncio.create_task(self._refresh_connectivity(key))
+                return (reachable, latency), True
+
+        return await self._probe_connectivity(host, port), False
 
     async def create_server(self, db: Session, server_data: ServerCreate) -> Server:
         """
@@ -44,12 +131,12 @@ class ServerService:
             ValueError: If server with same host already exists
         """
         # Check if server already exists
-        existing = self.repo.get_by_host(db, server_data.host)
+        existing = await self._db(self.repo.get_by_host, db, server_data.host)
         if existing:
             raise ValueError(f"Server with host '{server_data.host}' already exists")
 
         # Check if it's localhost
-        is_local = server_data.host in ["localhost", "127.0.0.1", "::1"]
+        is_local = server_data.host in LOCAL_HOSTS
 
         # Create server
         server = Server(
@@ -59,11 +146,11 @@ class ServerService:
         # Check connectivity and detect services
         await self._update_server_info(db, server)
 
-        return self.repo.create(db, server)
+        return await self._db(self.repo.create, db, server)
 
     async def update_server(self, db: Session, server_id: str, server_data: ServerUpdate) -> Server:
         """Update server"""
-        server = self.repo.get_by_id(db, server_id)
+        server = await self._db(self.repo.get_by_id, db, server_id)
         if not server:
             raise ValueError(f"Server {server_id} not found")
 
@@ -72,11 +159,11 @@ class ServerService:
             server.name = server_data.name
         if server_data.host is not None:
             # Check if new host already exists
-            existing = self.repo.get_by_host(db, server_data.host)
+            existing = await self._db(self.repo.get_by_host, db, server_data.host)
             if existing and existing.id != server_id:
                 raise ValueError(f"Server with host '{server_data.host}' already exists")
             server.host = server_data.host
-            server.is_local = server_data.host in ["localhost", "127.0.0.1", "::1"]
+            server.is_local = server_data.host in LOCAL_HOSTS
         if server_data.description is not None:
             server.description = server_data.description
 
@@ -84,7 +171,7 @@ class ServerService:
         if server_data.host is not None:
             await self._update_server_info(db, server)
 
-        return self.repo.update(db, server)
+        return await self._db(self.repo.update, db, server)
 
     def delete_server(self, db: Session, server_id: str) -> bool:
         """Delete server"""
@@ -110,33 +197,34 @@ class ServerService:
         return self.repo.get_all(db, only_reachable)
 
     async def check_connectivity(
-        self, db: Session, server_id: str, port: Optional[int] = None
+        self, db: Session, server_id: str, port: Optional[int] = None, allow_stale: bool = False
     ) -> ConnectivityCheckResponse:
         """
         Check connectivity to a server.
 
+        Results are cached per (host, port) for REACHABLE_TTL / UNREACHABLE_TTL seconds.
+
         Args:
             db: Database session
             server_id: Server ID
             port: Optional specific port to check
+            allow_stale: Serve an expired cached result while it is refreshed in the background
 
         Returns:
             ConnectivityCheckResponse
         """
-        server = self.repo.get_by_id(db, server_id)
+        server = await self._db(self.repo.get_by_id, db, server_id)
         if not server:
             raise ValueError(f"Server {server_id} not found")
 
-        try:
-            is_reachable, latency = await self.network.check_connectivity(server.host, port)
+        # Network errors already come back as (False, None) from network_utils
+        (is_reachable, latency), from_cache = await self._cached_connectivity(server.host, port, allow_stale)
 
-            # Update server status
-            self.repo.update_connectivity(db, server, is_reachable)
+        # Update server status only on a fresh probe
+        if not from_cache:
+            await self._db(self.repo.update_connectivity, db, server, is_reachable)
 
-            return ConnectivityCheckResponse(reachable=is_reachable, latency_ms=latency)
-        except Exception as e:
-            logger.error(f"Connectivity check failed: {e}")
-            return ConnectivityCheckResponse(reachable=False, error=str(e))
+        return ConnectivityCheckResponse(reachable=is_reachable, latency_ms=latency)
 
     async def scan_server(self, db: Session, server_id: str) -> list[DetectedService]:
         """
@@ -149,54 +237,40 @@ class ServerService:
         Returns:
             List of detected services
         """
-        server = self.repo.get_by_id(db, server_id)
+        server = await self._db(self.repo.get_by_id, db, server_id)
         if not server:
             raise ValueError(f"Server {server_id} not found")
 
         # Scan host
         scan_result = await self.network.scan_host(server.host)
+        self._remember_connectivity(server.host, None, scan_result.is_reachable, None)
+
+        # Single pass: the schemas are the response and are dumped as-is for storage
+        detected_services = _detected_services(scan_result.open_ports)
 
-        # Update server info
-        detected_services = [
-            {
-                "port": s.port,
-                "protocol": s.protocol,
-                "service_name": s.service_name,
-                "confidence": s.confidence,
-                "version": s.version,
-                "banner": s.banner,
-            }
-            for s in scan_result.open_ports
-        ]
-
-        self.repo.update_connectivity(
+        await self._db(
+            self.repo.update_connectivity,
             db,
             server,
             scan_result.is_reachable,
-            detected_services=json.dumps(detected_services),
+            detected_services=_DETECTED_SERVICES.dump_json(detected_services).decode(),
             os_type=scan_result.os_type,
         )
 
-        # Convert to schema
-        return [
-            DetectedService(
-                port=s.port,
-                protocol=s.protocol,
-                service_name=s.service_name,
-                confidence=s.confidence,
-                version=s.version,
-                banner=s.banner,
-            )
-            for s in scan_result.open_ports
-        ]
+        return detected_services
 
-    async def scan_network(self, db: Session, network: Optional[str] = None) -> list[NetworkScanResultSchema]:
+    async def scan_network(
+        self, db: Session, network: Optional[str] = None, force: bool = False
+    ) -> list[NetworkScanResultSchema]:
         """
         Scan network for active hosts.
 
+        Hosts that produced no result are not probed again for DEAD_HOST_TTL seconds.
+
         Args:
             db: Database session
             network: Optional network CIDR (defaults to local network)
+            force: Probe every host, ignoring the dead-host cache
 
         Returns:
             List of scan results
@@ -204,23 +278,26 @@ class ServerService:
         if not network:
             network = self.network.get_local_network()
 
-        logger.info(f"Scanning network: {network}")
-        scan_results = await self.network.scan_network(network)
+        now = time.monotonic()
+        if force:
+            skip_hosts = frozenset()
+        else:
+            self._dead_hosts = {host: exp for host, exp in self._dead_hosts.items() if exp > now}
+            skip_hosts = self._dead_hosts.keys()
+
+        logger.info("Scanning network: %s (skipping %s dead hosts)", network, len(skip_hosts))
+        dead_hosts: Set[str] = set()
+        scan_results = await self.network.scan_network(network, skip_hosts=skip_hosts, dead_hosts=dead_hosts)
+
+        expires_at = time.monotonic() + self.DEAD_HOST_TTL
+        self._dead_hosts.update(dict.fromkeys(dead_hosts, expires_at))
+        for result in scan_results:
+            self._dead_hosts.pop(result.host, None)
 
         # Convert to schema
         results = []
         for result in scan_results:
-            services = [
-                DetectedService(
-                    port=s.port,
-                    protocol=s.protocol,
-                    service_name=s.service_name,
-                    confidence=s.confidence,
-                    version=s.version,
-                    banner=s.banner,
-                )
-                for s in result.open_ports
-            ]
+            services = _detected_services(result.open_ports)
 
             results.append(
                 NetworkScanResultSchema(
@@ -237,13 +314,11 @@ class ServerService:
     async def _update_server_info(self, db: Session, server: Server):
         """Update server connectivity and detected services"""
         try:
-            # Quick connectivity check
-            is_reachable, _ = await self.network.check_connectivity(server.host)
-
-            if is_reachable:
-                # Scan for services
-                scan_result = await self.network.scan_host(server.host)
+            # scan_host checks connectivity itself; no separate probe beforehand
+            scan_result = await self.network.scan_host(server.host)
+            self._remember_connectivity(server.host, None, scan_result.is_reachable, None)
 
+            if scan_result.is_reachable:
                 detected_services = [
                     {
                         "port": s.port,
@@ -256,13 +331,13 @@ class ServerService:
                 ]
 
                 server.is_reachable = True
-                server.detected_services = json.dumps(detected_services) if detected_services else None
+                server.detected_services = dumps(detected_services) if detected_services else None
                 server.os_type = scan_result.os_type
             else:
                 server.is_reachable = False
 
-        except Exception as e:
-            logger.error(f"Error updating server info: {e}")
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.error("Error updating server info: %s", e)
             server.is_reachable = False
 
     def ensure_localhost(self, db: Session) -> Server:
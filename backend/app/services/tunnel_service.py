@@ -4,17 +4,90 @@ Tunnel Service - Service Locator for Tunnel Drivers
 Resolves the appropriate tunnel driver based on provider and protocol.
 """
 
+import asyncio
 import logging
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Tuple
 
 from app.enums import TunnelProvider, TunnelProtocol
 
+# Drivers are imported with the service so the request path never takes the import lock
+from app.integrations.cloudflare.tunnel_driver import CloudflaredHTTPDriver
+from app.integrations.ngrok.http_driver import NgrokHTTPDriver
+from app.integrations.pinggy.pinggy_driver import PinggyDriver
+
 logger = logging.getLogger(__name__)
 
 
+def _ngrok_tcp_driver() -> Any:
+    # Stays lazy: its TCPDriver base class has not been moved to core yet
+    from app.integrations.ngrok.tcp_driver import NgrokTCPDriver
+
+    return NgrokTCPDriver()
+
+
+# Driver factories by (provider, protocol); the single source of supported combinations
+_DRIVER_FACTORIES: Dict[Tuple[TunnelProvider, TunnelProtocol], Callable[[], Any]] = {
+    (TunnelProvider.CLOUDFLARE, TunnelProtocol.HTTP): CloudflaredHTTPDriver,
+    (TunnelProvider.CLOUDFLARE, TunnelProtocol.HTTPS): CloudflaredHTTPDriver,
+    (TunnelProvider.CLOUDFLARE, TunnelProtocol.TCP): CloudflaredHTTPDriver,
+    (TunnelProvider.NGROK, TunnelProtocol.HTTP): NgrokHTTPDriver,
+    (TunnelProvider.NGROK, TunnelProtocol.HTTPS): NgrokHTTPDriver,
+    (TunnelProvider.NGROK, TunnelProtocol.TCP): _ngrok_tcp_driver,
+    (TunnelProvider.PINGGY, TunnelProtocol.HTTP): PinggyDriver,
+    (TunnelProvider.PINGGY, TunnelProtocol.HTTPS): PinggyDriver,
+    (TunnelProvider.PINGGY, TunnelProtocol.TCP): PinggyDriver,
+}
+
+
+def _supported_combinations() -> Dict[TunnelProvider, Tuple[TunnelProtocol, ...]]:
+    """Group the factory table keys into provider -> protocols."""
+    combinations: Dict[TunnelProvider, Tuple[TunnelProtocol, ...]] = {}
+    for provider, protocol in _DRIVER_FACTORIES:
+        combinations[provider] = combinations.get(provider, ()) + (protocol,)
+    return combinations
+
+
+# Supported provider/protocol combinations (read-only, derived from the factory table)
+_SUPPORTED_COMBINATIONS = MappingProxyType(_supported_combinations())
+
+# Providers whose one driver used to accept any protocol. Stopping falls back to it,
+# so existing services on combinations outside the table (e.g. UDP) can still be stopped.
+_STOP_FALLBACK_FACTORIES: Dict[TunnelProvider, Callable[[], Any]] = {
+    TunnelProvider.CLOUDFLARE: CloudflaredHTTPDriver,
+    TunnelProvider.PINGGY: PinggyDriver,
+}
+
+# Resolved drivers by (provider, protocol); filled on first resolve
+_DRIVERS: Dict[Tuple[TunnelProvider, TunnelProtocol], Any] = {}
+
+# Lookup tables for the provider_key / protocol strings stored on services
+_PROVIDER_KEYS = {
+    "cloudflare": TunnelProvider.CLOUDFLARE,
+    "ngrok": TunnelProvider.NGROK,
+    "pinggy": TunnelProvider.PINGGY,
+}
+_PROTOCOL_KEYS = {
+    "http": TunnelProtocol.HTTP,
+    "https": TunnelProtocol.HTTP,
+    "tcp": TunnelProtocol.TCP,
+    "udp": TunnelProtocol.UDP,
+}
+
+
+@lru_cache(maxsize=None)
+def _cached_driver(factory: Callable[[], Any]) -> Any:
+    """Build each driver once; drivers keep their own process/container state."""
+    return factory()
+
+
 class TunnelService:
     """Service Locator for tunnel drivers"""
 
+    # Per-driver budget for get_diagnostics
+    DIAGNOSTICS_TIMEOUT_SECONDS = 2.0
+
     @staticmethod
     def resolve(provider: TunnelProvider, protocol: TunnelProtocol) -> Any:
         """
@@ -34,57 +107,34 @@ class TunnelService:
             >>> driver = TunnelService.resolve(TunnelProvider.CLOUDFLARE, TunnelProtocol.TCP)
             >>> tunnel_info = await driver.start_tunnel(config)
         """
-        logger.debug(f"Resolving driver for {provider.value} + {protocol.value}")
-
-        # Cloudflare drivers
-        if provider == TunnelProvider.CLOUDFLARE:
-            from app.integrations.cloudflare.tunnel_driver import CloudflaredHTTPDriver
-            return CloudflaredHTTPDriver()
-
-        # Ngrok drivers
-        elif provider == TunnelProvider.NGROK:
-            if protocol in [TunnelProtocol.HTTP, TunnelProtocol.HTTPS]:
-                from app.integrations.ngrok.http_driver import NgrokHTTPDriver
-                return NgrokHTTPDriver()
-            elif protocol == TunnelProtocol.TCP:
-                from app.integrations.ngrok.tcp_driver import NgrokTCPDriver
-                return NgrokTCPDriver()
-
-        # Pinggy drivers
-        elif provider == TunnelProvider.PINGGY:
-            from app.integrations.pinggy.pinggy_driver import PinggyDriver
-            return PinggyDriver()
-
-        # Unsupported combination
-        raise ValueError(
-            f"No driver available for provider '{provider.value}' with protocol '{protocol.value}'"
-        )
+        logger.debug("Resolving driver for %s + %s", provider.value, protocol.value)
+
+        key = (provider, protocol)
+        try:
+            return _DRIVERS[key]
+        except KeyError:
+            pass
+
+        factory = _DRIVER_FACTORIES.get(key)
+        if factory is None:
+            # Unsupported combination
+            raise ValueError(
+                f"No driver available for provider '{provider.value}' with protocol '{protocol.value}'"
+            )
+
+        # Combinations sharing a factory share the driver instance
+        driver = _DRIVERS[key] = _cached_driver(factory)
+        return driver
 
     @staticmethod
-    def get_supported_combinations() -> dict:
+    def get_supported_combinations() -> MappingProxyType:
         """
         Get all supported provider/protocol combinations.
 
         Returns:
-            Dict mapping providers to their supported protocols
+            Read-only mapping of providers to their supported protocols
         """
-        return {
-            TunnelProvider.CLOUDFLARE: [
-                TunnelProtocol.HTTP,
-                TunnelProtocol.HTTPS,
-                TunnelProtocol.TCP,
-            ],
-            TunnelProvider.NGROK: [
-                TunnelProtocol.HTTP,
-                TunnelProtocol.HTTPS,
-                TunnelProtocol.TCP,
-            ],
-            TunnelProvider.PINGGY: [
-                TunnelProtocol.HTTP,
-                TunnelProtocol.HTTPS,
-                TunnelProtocol.TCP,
-            ],
-        }
+        return _SUPPORTED_COMBINATIONS
 
     @staticmethod
     def is_supported(provider: TunnelProvider, protocol: TunnelProtocol) -> bool:
@@ -98,8 +148,7 @@ class TunnelService:
         Returns:
             True if supported, False otherwise
         """
-        supported = TunnelService.get_supported_combinations()
-        return provider in supported and protocol in supported[provider]
+        return protocol in _SUPPORTED_COMBINATIONS.get(provider, ())
 
 
     async def start_quick_tunnel(self, service: Any, db: Any = None) -> tuple[str, str]:
@@ -152,44 +201,69 @@ class TunnelService:
 
     async def stop_quick_tunnel(self, service: Any) -> bool:
         """Stop a quick tunnel."""
-        provider = self._get_provider_enum(service.provider_key)
-        protocol = self._get_protocol_enum(service.protocol)
-        
-        driver = self.resolve(provider, protocol)
+        driver = self._resolve_for_stop(service)
         return await driver.stop_tunnel(service.port, service_id=str(service.id))
 
 
     async def stop_named_tunnel(self, service: Any, db: Any = None) -> bool:
         """Stop a named tunnel."""
-        provider = self._get_provider_enum(service.provider_key)
-        protocol = self._get_protocol_enum(service.protocol)
-        
-        driver = self.resolve(provider, protocol)
+        driver = self._resolve_for_stop(service)
         return await driver.stop_tunnel(service.port)
 
     async def get_diagnostics(self, services: list, repo: Any) -> dict:
-        """Get diagnostics for tunnel system."""
-        # Simple diagnostics for now, aggregating from drivers if needed
-        # Assuming cloudflare is main provider for now
-        from app.integrations.cloudflare.tunnel_driver import CloudflaredHTTPDriver
-        driver = CloudflaredHTTPDriver()
-        return driver.get_provider_info()
+        """
+        Get diagnostics for tunnel system, one entry per provider.
+
+        Drivers are queried concurrently, each with its own timeout, so a slow
+        or failing provider only reports an error for itself.
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                provider: tg.create_task(self._provider_diagnostics(provider))
+                for provider in _SUPPORTED_COMBINATIONS
+            }
+        return {provider.value: task.result() for provider, task in tasks.items()}
+
+    async def _provider_diagnostics(self, provider: TunnelProvider) -> dict:
+        """Provider info for one driver; errors are returned instead of raised."""
+        try:
+            driver = self.resolve(provider, TunnelProtocol.HTTP)
+            return await asyncio.wait_for(
+                asyncio.to_thread(driver.get_provider_info), timeout=self.DIAGNOSTICS_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            logger.warning("Diagnostics for %s timed out", provider.value)
+            return {"error": "timeout"}
+        except Exception as e:
+            logger.error("Error getting diagnostics for %s: %s", provider.value, e)
+            return {"error": str(e)}
 
     # Helpers
+    def _resolve_for_stop(self, service: Any) -> Any:
+        """Driver to stop a service's tunnel, falling back to the provider-wide driver."""
+        provider = self._get_provider_enum(service.provider_key)
+        protocol = self._get_protocol_enum(service.protocol)
+        try:
+            return self.resolve(provider, protocol)
+        except ValueError:
+            factory = _STOP_FALLBACK_FACTORIES.get(provider)
+            if factory is None:
+                raise
+        return _cached_driver(factory)
+
     def _get_provider_enum(self, key: str) -> TunnelProvider:
         key = key.lower()
-        if key == "cloudflare": return TunnelProvider.CLOUDFLARE
-        if key == "ngrok": return TunnelProvider.NGROK
-        if key == "pinggy": return TunnelProvider.PINGGY
-        raise ValueError(f"Unknown provider key: {key}")
+        try:
+            return _PROVIDER_KEYS[key]
+        except KeyError:
+            raise ValueError(f"Unknown provider key: {key}") from None
 
     def _get_protocol_enum(self, key: str) -> TunnelProtocol:
         key = key.lower()
-        if key in ["http", "https"]: return TunnelProtocol.HTTP
-        if key == "tcp": return TunnelProtocol.TCP
-        if key == "udp": return TunnelProtocol.UDP
-        if key == "ssh": return TunnelProtocol.SSH
-        raise ValueError(f"Unknown protocol key: {key}")
+        try:
+            return _PROTOCOL_KEYS[key]
+        except KeyError:
+            raise ValueError(f"Unknown protocol key: {key}") from None
 
 # Singleton instance
 tunnel_service = TunnelService()
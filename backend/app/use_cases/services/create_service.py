@@ -6,7 +6,9 @@ Business logic for creating a new tunnel service.
 
 import logging
 from fastapi import HTTPException
+from sqlmodel import Session, select
 
+from core.database import engine
 from app.models.service import Service
 from app.models.provider import Provider
 from app.enums.service import ServiceStatus
@@ -45,23 +47,30 @@ class CreateServiceUseCase:
         Raises:
             HTTPException: If validation fails or creation errors
         """
-        logger.info(f"Creating service: {service_data.name} for user {user_id}")
+        logger.info("Creating service: %s for user %s", service_data.name, user_id)
         
+        # 1-2. Provider activo y puerto libre, resueltos en una sola consulta
+        with Session(engine) as session:
+            provider_active, port_taken = session.exec(
+                select(
+                    Provider.exists_expression(key=service_data.provider_key, is_active=True),
+                    Service.exists_expression(
+                        user_id=user_id,
+                        port=service_data.port,
+                        host=service_data.host
+                    ),
+                )
+            ).one()
+
         # 1. Validate provider exists and is active
-        provider = Provider.first_where(key=service_data.provider_key, is_active=True)
-        if not provider:
+        if not provider_active:
             raise HTTPException(
                 status_code=400,
                 detail=f"Proveedor '{service_data.provider_key}' no existe o está inactivo"
             )
         
         # 2. Validate port is available
-        existing = Service.first_where(
-            user_id=user_id,
-            port=service_data.port,
-            host=service_data.host
-        )
-        if existing:
+        if port_taken:
             raise HTTPException(
                 status_code=400,
                 detail=f"Ya existe un servicio en {service_data.host}:{service_data.port}"
@@ -85,6 +94,6 @@ class CreateServiceUseCase:
             status=ServiceStatus.STOPPED.value,
         )
         
-        logger.info(f"Service created successfully: {service.name} (ID: {service.id})")
+        logger.info("Service created successfully: %s (ID: %s)", service.name, service.id)
         
         return service
@@ -4,6 +4,7 @@ Delete Service Use Case
 Business logic for deleting a service.
 """
 
+import asyncio
 import logging
 import uuid
 from typing import Dict, Any
@@ -28,6 +29,9 @@ class DeleteServiceUseCase:
     - Delete service from database
     - Return success message
     """
+
+    # Tiempo máximo para detener el túnel antes de borrar igualmente el servicio
+    STOP_TIMEOUT_SECONDS = 5.0
     
     def __init__(
         self,
@@ -64,27 +68,33 @@ class DeleteServiceUseCase:
         Raises:
             HTTPException: If service not found
         """
-        logger.info(f"Deleting service {service_id} for user {user_id}")
+        logger.info("Deleting service %s for user %s", service_id, user_id)
         
         # 1. Get service
-        service = self.service_repo.get_by_id(service_id, user_id)
+        service = await asyncio.to_thread(self.service_repo.get_by_id, service_id, user_id)
         if not service:
             raise HTTPException(status_code=404, detail="Servicio no encontrado")
         
         service_name = service.name
         
-        # 2. Stop tunnel if running
+        # 2. Stop tunnel if running (acotado: un driver colgado no debe impedir el borrado)
         if service.status == ServiceStatus.RUNNING.value:
             try:
-                logger.info(f"Stopping tunnel for service {service_name} before deletion")
-                await self._stop_tunnel(service, db)
+                logger.info("Stopping tunnel for service %s before deletion", service_name)
+                await asyncio.wait_for(self._stop_tunnel(service, db), timeout=self.STOP_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Timed out after %ss stopping tunnel for %s; deleting anyway (tunnel may be left orphaned)",
+                    self.STOP_TIMEOUT_SECONDS,
+                    service_name,
+                )
             except Exception as e:
-                logger.warning(f"Error stopping tunnel before deletion: {e}")
+                logger.warning("Error stopping tunnel before deletion: %s", e)
         
         # 3. Delete from database
-        self.service_repo.delete(service)
+        await asyncio.to_thread(self.service_repo.delete, service)
         
-        logger.info(f"Service deleted successfully: {service_name} (ID: {service_id})")
+        logger.info("Service deleted successfully: %s (ID: %s)", service_name, service_id)
         
         return {
             "success": True,
@@ -4,6 +4,7 @@ Disable Service Use Case
 Business logic for disabling a service.
 """
 
+import asyncio
 import logging
 import uuid
 from typing import Dict, Any
@@ -44,10 +45,10 @@ class DisableServiceUseCase:
         Raises:
             HTTPException: If service not found
         """
-        logger.info(f"Disabling service {service_id} for user {user_id}")
+        logger.info("Disabling service %s for user %s", service_id, user_id)
         
         # Get service
-        service = Service.find(service_id)
+        service = await asyncio.to_thread(Service.find, service_id)
         if not service or service.user_id != user_id:
             raise HTTPException(status_code=404, detail="Servicio no encontrado")
         
@@ -60,9 +61,9 @@ class DisableServiceUseCase:
                 "process_id": None,
             })
         
-        service.update(**updates)
+        await asyncio.to_thread(service.update, **updates)
         
-        logger.info(f"Service disabled: {service.name} (ID: {service_id})")
+        logger.info("Service disabled: %s (ID: %s)", service.name, service_id)
         
         return {
             "success": True,
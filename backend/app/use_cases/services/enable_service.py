@@ -4,6 +4,7 @@ Enable Service Use Case
 Business logic for enabling a service.
 """
 
+import asyncio
 import logging
 import uuid
 from typing import Dict, Any
@@ -42,17 +43,17 @@ class EnableServiceUseCase:
         Raises:
             HTTPException: If service not found
         """
-        logger.info(f"Enabling service {service_id} for user {user_id}")
+        logger.info("Enabling service %s for user %s", service_id, user_id)
         
         # Get service
-        service = Service.find(service_id)
+        service = await asyncio.to_thread(Service.find, service_id)
         if not service or service.user_id != user_id:
             raise HTTPException(status_code=404, detail="Servicio no encontrado")
         
         # Enable service using Active Record
-        service.update(enabled=True)
+        await asyncio.to_thread(service.update, enabled=True)
         
-        logger.info(f"Service enabled: {service.name} (ID: {service_id})")
+        logger.info("Service enabled: %s (ID: %s)", service.name, service_id)
         
         return {
             "success": True,
@@ -40,7 +40,7 @@ class GetServiceUseCase:
         Raises:
             HTTPException: If service not found or doesn't belong to user
         """
-        logger.info(f"Getting service {service_id} for user {user_id}")
+        logger.info("Getting service %s for user %s", service_id, user_id)
         
         service = Service.find(service_id)
         
@@ -1,16 +1,41 @@
 """
 Reconcile services with running Docker containers
 """
+import asyncio
 import logging
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
 import docker
 from sqlalchemy.orm import Session
 
+from app.infrastructure.container_events import container_event_watcher
 from app.models.service import Service
 from app.integrations.utils.url_extractor import extract_url_by_provider
 
 logger = logging.getLogger(__name__)
 
+# Docker client shared by every use case instance (created on first use)
+_SHARED_CLIENT: Optional[docker.DockerClient] = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client() -> docker.DockerClient:
+    """
+    Cliente Docker compartido del proceso.
+
+    Solo se guarda si la conexión funcionó, así un daemon que no estaba
+    disponible se reintenta en la siguiente instancia.
+
+    Raises:
+        docker.errors.DockerException: Si no se puede conectar con Docker
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                _SHARED_CLIENT = docker.from_env()
+    return _SHARED_CLIENT
+
 
 class ReconcileServicesUseCase:
     """
@@ -18,94 +43,149 @@ class ReconcileServicesUseCase:
     Updates services that have running containers but show error/stopped status.
     """
 
+    # Max concurrent container log fetches against the Docker daemon
+    MAX_CONCURRENT_LOG_FETCHES = 16
+
     def __init__(self, db: Session):
         self.db = db
         try:
-            self.docker_client = docker.from_env()
+            self.docker_client = _get_shared_client()
         except Exception as e:
             logger.error(f"Failed to initialize Docker client: {e}")
             self.docker_client = None
 
-    async def execute(self, user_id: int) -> Dict[str, Any]:
+    async def execute(self, user_id: int, verbose: bool = False) -> Dict[str, Any]:
         """
         Execute reconciliation process.
         
         Args:
             user_id: User ID to reconcile services for
+            verbose: Also return per-service / per-container details
             
         Returns:
-            Reconciliation report with updated services and orphaned containers
+            Reconciliation summary: count plus updated service IDs and orphaned container IDs
+            (with 'updated_services' / 'orphaned_containers' details when verbose)
         """
         if not self.docker_client:
-            return {
-                "reconciled": 0,
-                "updated_services": [],
-                "orphaned_containers": [],
-                "error": "Docker client not available"
-            }
+            return self._report([], [], verbose, error="Docker client not available")
 
         try:
             # Get all running containers with localrun labels
-            containers = self._get_localrun_containers()
+            # Tracked from Docker events when the watcher is synced; full list otherwise (cold start)
+            containers = container_event_watcher.running_containers()
+            if containers is None:
+                containers = await self._get_localrun_containers()
+                container_event_watcher.seed(containers)
             
             # Get all services for this user that might need reconciliation
-            services = self._get_services_to_reconcile(user_id)
+            services = self._get_services_to_reconcile(user_id, self._container_ports(containers))
+            by_port_provider, by_port = self._index_services(services)
             
+            # Reconcile containers concurrently; only the Docker log fetches overlap
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_LOG_FETCHES)
+            results = await asyncio.gather(
+                *(self._reconcile_container(c, by_port_provider, by_port, semaphore, verbose) for c in containers)
+            )
+
             # Match containers to services and update
-            updated_services = []
-            orphaned_containers = []
-            
-            for container in containers:
-                result = await self._reconcile_container(container, services)
-                if result["updated"]:
-                    updated_services.append(result["service_info"])
-                elif result["orphaned"]:
-                    orphaned_containers.append(result["container_info"])
+            updated = [result for result in results if result["updated"]]
+            orphaned = [result for result in results if result["orphaned"]]
             
             # Commit all changes
             self.db.commit()
             
-            return {
-                "reconciled": len(updated_services),
-                "updated_services": updated_services,
-                "orphaned_containers": orphaned_containers
-            }
+            return self._report(updated, orphaned, verbose)
             
         except Exception as e:
             logger.error(f"Error during reconciliation: {e}")
             self.db.rollback()
-            return {
-                "reconciled": 0,
-                "updated_services": [],
-                "orphaned_containers": [],
-                "error": str(e)
-            }
-
-    def _get_localrun_containers(self) -> List:
+            return self._report([], [], verbose, error=str(e))
+
+    @staticmethod
+    def _report(
+        updated: List[Dict[str, Any]],
+        orphaned: List[Dict[str, Any]],
+        verbose: bool,
+        error: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Armar el resumen de la reconciliación (detalles solo si verbose)"""
+        report: Dict[str, Any] = {
+            "reconciled": len(updated),
+            "updated_ids": [result["service_id"] for result in updated],
+            "orphan_ids": [result["container_id"] for result in orphaned],
+        }
+        if verbose:
+            report["updated_services"] = [result["service_info"] for result in updated]
+            report["orphaned_containers"] = [result["container_info"] for result in orphaned]
+        if error is not None:
+            report["error"] = error
+        return report
+
+    async def _get_localrun_containers(self) -> List:
         """Get all running containers managed by localrun"""
         try:
-            return self.docker_client.containers.list(
-                filters={"label": "managed-by=localrun-agent"}
+            # Blocking Docker API call: run it off the event loop. Only running containers, no size stats
+            return await asyncio.to_thread(
+                self.docker_client.containers.list,
+                filters={"label": "managed-by=localrun-agent"},
             )
         except Exception as e:
             logger.error(f"Error listing containers: {e}")
             return []
 
-    def _get_services_to_reconcile(self, user_id: int) -> List[Service]:
-        """Get services that might need reconciliation (error or stopped status)"""
+    @staticmethod
+    def _container_ports(containers: List) -> Set[int]:
+        """Puertos publicados en las etiquetas de los contenedores"""
+        ports = set()
+        for container in containers:
+            labels = container.labels
+            port = labels.get("tunnel-port") or labels.get("port")
+            try:
+                ports.add(int(port))
+            except (TypeError, ValueError):
+                continue
+        return ports
+
+    def _get_services_to_reconcile(self, user_id: int, ports: Set[int]) -> List[Service]:
+        """Get services that might need reconciliation (error or stopped status) on the given ports"""
+        if not ports:
+            return []
         return self.db.query(Service).filter(
             Service.user_id == user_id,
+            Service.port.in_(ports),
             Service.status.in_(["error", "stopped", "starting"])
         ).all()
 
+    @staticmethod
+    def _index_services(
+        services: List[Service],
+    ) -> Tuple[Dict[Tuple[int, str], Service], Dict[int, Service]]:
+        """
+        Indexar servicios por (puerto, proveedor) y por puerto.
+
+        Si varios servicios comparten clave gana el primero, igual que el recorrido lineal anterior.
+        """
+        by_port_provider: Dict[Tuple[int, str], Service] = {}
+        by_port: Dict[int, Service] = {}
+        for s in services:
+            by_port_provider.setdefault((s.port, s.provider_key.lower()), s)
+            by_port.setdefault(s.port, s)
+        return by_port_provider, by_port
+
     async def _reconcile_container(
-        self, container, services: List[Service]
+        self,
+        container,
+        by_port_provider: Dict[Tuple[int, str], Service],
+        by_port: Dict[int, Service],
+        semaphore: asyncio.Semaphore,
+        verbose: bool = False,
     ) -> Dict[str, Any]:
         """
         Reconcile a single container with services.
         
         Returns:
-            Dict with 'updated', 'service_info', 'orphaned', 'container_info'
+            Dict with 'updated', 'service_id', 'orphaned', 'container_id'
+            (plus 'service_info' / 'container_info' when verbose)
         """
         try:
             # Extract port and provider from container labels
@@ -118,33 +198,27 @@ class ReconcileServicesUseCase:
             
             port = int(port)
             
-            # Find matching service by port AND provider
-            service = None
-            for s in services:
-                if s.port == port:
-                    # If provider label exists, match it too
-                    if provider and s.provider_key.lower() == provider.lower():
-                        service = s
-                        break
-                    # If no provider label, just match by port (fallback)
-                    elif not provider:
-                        service = s
-                        break
+            # Find matching service by port AND provider; without a provider label, by port only
+            if provider:
+                service = by_port_provider.get((port, provider.lower()))
+            else:
+                service = by_port.get(port)
             
             if not service:
-                return {
-                    "updated": False,
-                    "orphaned": True,
-                    "container_info": {
+                result = {"updated": False, "orphaned": True, "container_id": container.id[:12]}
+                if verbose:
+                    result["container_info"] = {
                         "container_id": container.id[:12],
                         "port": port,
                         "provider": provider or "unknown",
                         "reason": "No matching service found"
                     }
-                }
+                return result
             
             # Get container logs and extract URL
-            logs = container.logs(tail=100).decode("utf-8", errors="ignore")
+            async with semaphore:
+                logs = await asyncio.to_thread(container.logs, tail=100)
+            # Searched as raw bytes; only the matched URL is decoded
             public_url = extract_url_by_provider(service.provider_key, logs)
             
             if not public_url:
@@ -162,9 +236,9 @@ class ReconcileServicesUseCase:
                 f"{old_status} -> running, URL: {public_url}"
             )
             
-            return {
-                "updated": True,
-                "service_info": {
+            result = {"updated": True, "orphaned": False, "service_id": service.id}
+            if verbose:
+                result["service_info"] = {
                     "id": service.id,
                     "name": service.name,
                     "provider": service.provider_key,
@@ -172,9 +246,8 @@ class ReconcileServicesUseCase:
                     "new_status": "running",
                     "public_url": public_url,
                     "port": port
-                },
-                "orphaned": False
-            }
+                }
+            return result
             
         except Exception as e:
             logger.error(f"Error reconciling container {container.id[:12]}: {e}")
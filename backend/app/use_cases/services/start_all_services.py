@@ -4,10 +4,14 @@ Start All Services Use Case
 Business logic for starting all enabled services.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 
 from sqlmodel import Session
+from app.models.server import Server
+from app.models.service import Service
 from app.use_cases.services.start_service import StartServiceUseCase
 
 logger = logging.getLogger(__name__)
@@ -24,6 +28,9 @@ class StartAllServicesUseCase:
     - Return summary of results
     """
     
+    # Max services starting at the same time (tunnel CLI / Docker calls)
+    MAX_CONCURRENCY = 8
+    
     def __init__(self, start_service_use_case: StartServiceUseCase):
         """
         Initialize use case.
@@ -37,6 +44,7 @@ class StartAllServicesUseCase:
         self,
         user_id: int,
         db: Session,
+        services: Optional[List[Service]] = None,
     ) -> Dict[str, Any]:
         """
         Execute the use case.
@@ -44,6 +52,7 @@ class StartAllServicesUseCase:
         Args:
             user_id: ID of the user starting services
             db: Database session for operations
+            services: Enabled services that are not running, if the caller already loaded them
             
         Returns:
             Summary with started services and errors
@@ -51,9 +60,9 @@ class StartAllServicesUseCase:
         logger.info(f"Starting all enabled services for user {user_id}")
         
         # Get enabled services that are not running
-        from app.repositories.service_repository import ServiceRepository
-        repo = ServiceRepository(db)
-        services = repo.list_enabled(user_id)
+        if services is None:
+            from app.repositories.service_repository import ServiceRepository
+            services = ServiceRepository(db).list_enabled(user_id)
         
         if not services:
             return {
@@ -61,32 +70,78 @@ class StartAllServicesUseCase:
                 "started": [],
             }
         
-        results = []
+        # Load every referenced server in one query instead of one per service
+        from app.repositories.server_repository import server_repository
+        server_cache = server_repository.get_many(
+            db, (service.server_id for service in services if service.server_id)
+        )
+        
+        # Start services concurrently (bounded); each one reports its own result.
+        # If the request is cancelled, the task group cancels every in-flight start.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        pending_running: List[Tuple[uuid.UUID, str, str]] = []
+        pending_errors: List[Tuple[uuid.UUID, str]] = []
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        self._start_one(
+                            service, user_id, db, semaphore, server_cache, pending_running, pending_errors
+                        )
+                    )
+                    for service in services
+                ]
+            results = [task.result() for task in tasks]
+        finally:
+            # Nothing is written while tunnels start (no SQLite write lock held across the awaits);
+            # every status lands here in one short transaction
+            service_repo = self.start_use_case.service_repo
+            service_repo.mark_many_as_running(pending_running, commit=False)
+            service_repo.mark_many_as_error(pending_errors, commit=False)
+            db.commit()
+        
+        successful = sum(r["status"] == "started" for r in results)
         
-        # Start each service
-        for service in services:
+        logger.info(f"Started {successful}/{len(results)} services")
+        
+        return {
+            "message": f"{successful}/{len(results)} servicios iniciados",
+            "started": results,
+        }
+
+    async def _start_one(
+        self,
+        service: Service,
+        user_id: int,
+        db: Session,
+        semaphore: asyncio.Semaphore,
+        server_cache: Dict[str, Server],
+        pending_running: List[Tuple[uuid.UUID, str, str]],
+        pending_errors: List[Tuple[uuid.UUID, str]],
+    ) -> Dict[str, Any]:
+        """Iniciar un servicio y devolver su resultado (los errores no se propagan)"""
+        async with semaphore:
             try:
-                await self.start_use_case.execute(service.id, user_id, db)
-                results.append({
-                    "id": service.id,
-                    "name": service.name,
-                    "status": "started",
-                })
-                logger.info(f"Started service: {service.name}")
+                await self.start_use_case.execute(
+                    service.id,
+                    user_id,
+                    db,
+                    server_cache=server_cache,
+                    pending_running=pending_running,
+                    pending_errors=pending_errors,
+                )
             except Exception as e:
                 logger.error(f"Error starting {service.name}: {e}")
-                results.append({
+                return {
                     "id": service.id,
                     "name": service.name,
                     "status": "error",
                     "error": str(e),
-                })
-        
-        successful = len([r for r in results if r["status"] == "started"])
-        
-        logger.info(f"Started {successful}/{len(results)} services")
-        
+                }
+
+        logger.info(f"Started service: {service.name}")
         return {
-            "message": f"{successful}/{len(results)} servicios iniciados",
-            "started": results,
+            "id": service.id,
+            "name": service.name,
+            "status": "started",
         }
@@ -6,13 +6,16 @@ Business logic for starting a tunnel service.
 
 import logging
 import uuid
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
 from sqlmodel import Session
 
-from app.models.service import Service
 from app.enums.service import ServiceStatus
+from app.models.server import Server
+from app.models.service import Service
 from app.repositories.service_repository import ServiceRepository
 from app.services.tunnel_service import TunnelService
-from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,9 @@ class StartServiceUseCase:
         service_id: uuid.UUID,
         user_id: int,
         db: Session,
+        server_cache: Optional[Dict[str, Server]] = None,
+        pending_running: Optional[List[Tuple[uuid.UUID, str, str]]] = None,
+        pending_errors: Optional[List[Tuple[uuid.UUID, str]]] = None,
     ) -> Service:
         """
         Execute the use case.
@@ -57,6 +63,11 @@ class StartServiceUseCase:
             service_id: ID of service to start
             user_id: ID of the user starting the service
             db: Database session for tunnel operations
+            server_cache: Servers already loaded by ID (bulk start); skips the per-service lookup
+            pending_running: If given, (service_id, public_url, process_id) is appended here instead
+                of marking the service as running; the caller writes them in one batch
+            pending_errors: If given, (service_id, error_message) is appended here instead of
+                marking the service with the error; the caller writes them in the same batch
             
         Returns:
             Updated service with running status
@@ -86,10 +97,7 @@ class StartServiceUseCase:
         try:
             # 4. Resolve correct Host IP based on Server
             if service.server_id:
-                # Need to use ServerRepository to finding connection details
-                from app.repositories.server_repository import ServerRepository
-                server_repo = ServerRepository()
-                server = server_repo.get_by_id(db, service.server_id)
+                server = self._resolve_server(service, db, server_cache)
                 
                 if server and not server.is_local and server.network_ip:
                     # For remote servers, use the network IP
@@ -112,8 +120,8 @@ class StartServiceUseCase:
                     service, db
                 )
             
-            # 6. Update service status
-            self.service_repo.mark_as_running(service, public_url, process_id)
+            # 6. Update service status (or leave it to the caller's batch)
+            self._record_status(service, pending_running, pending_errors, public_url, process_id)
             
             logger.info(f"Service started: {service.name} -> {public_url}")
             
@@ -121,9 +129,49 @@ class StartServiceUseCase:
             
         except Exception as e:
             logger.error(f"Error starting service {service.name}: {e}")
-            # Mark as error in database
-            try:
-                self.service_repo.mark_as_error(service, str(e))
-            except Exception:
-                pass
+            # Mark as error in database (or leave it to the caller's batch)
+            self._record_status(service, pending_running, pending_errors, error=str(e))
             raise HTTPException(status_code=500, detail=str(e))
+
+    def _resolve_server(
+        self, service: Service, db: Session, server_cache: Optional[Dict[str, Server]]
+    ) -> Optional[Server]:
+        """
+        Server of a service: bulk-start cache first, then the relationship (already
+        loaded when the service came from a bulk listing), then the repository.
+        """
+        if server_cache is not None and service.server_id in server_cache:
+            return server_cache[service.server_id]
+        if service.server is not None:
+            return service.server
+
+        from app.repositories.server_repository import server_repository
+        return server_repository.get_by_id(db, service.server_id)
+
+    def _record_status(
+        self,
+        service: Service,
+        pending_running: Optional[List[Tuple[uuid.UUID, str, str]]],
+        pending_errors: Optional[List[Tuple[uuid.UUID, str]]],
+        public_url: Optional[str] = None,
+        process_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        Mark the service as running (or with `error`), or queue it on the caller's
+        pending list when one was given.
+        """
+        if error is None:
+            if pending_running is not None:
+                pending_running.append((service.id, public_url, process_id))
+            else:
+                self.service_repo.mark_as_running(service, public_url, process_id)
+            return
+
+        if pending_errors is not None:
+            pending_errors.append((service.id, error))
+            return
+        try:
+            self.service_repo.mark_as_error(service, error)
+        except Exception:
+            pass
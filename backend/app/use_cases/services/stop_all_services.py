@@ -4,10 +4,13 @@ Stop All Services Use Case
 Business logic for stopping all running services.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import uuid
+from typing import Dict, Any, List, Optional
 
 from sqlmodel import Session
+from app.models.service import Service
 from app.use_cases.services.stop_service import StopServiceUseCase
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,9 @@ class StopAllServicesUseCase:
     - Return summary of results
     """
     
+    # Max services stopping at the same time (tunnel CLI / Docker calls)
+    MAX_CONCURRENCY = 8
+    
     def __init__(self, stop_service_use_case: StopServiceUseCase):
         """
         Initialize use case.
@@ -37,6 +43,7 @@ class StopAllServicesUseCase:
         self,
         user_id: int,
         db: Session,
+        services: Optional[List[Service]] = None,
     ) -> Dict[str, Any]:
         """
         Execute the use case.
@@ -44,6 +51,7 @@ class StopAllServicesUseCase:
         Args:
             user_id: ID of the user stopping services
             db: Database session for operations
+            services: Running services, if the caller already loaded them
             
         Returns:
             Summary with stopped services and errors
@@ -51,9 +59,9 @@ class StopAllServicesUseCase:
         logger.info(f"Stopping all running services for user {user_id}")
         
         # Get running services
-        from app.repositories.service_repository import ServiceRepository
-        repo = ServiceRepository(db)
-        services = repo.list_running(user_id)
+        if services is None:
+            from app.repositories.service_repository import ServiceRepository
+            services = ServiceRepository(db).list_running(user_id)
         
         if not services:
             return {
@@ -61,32 +69,54 @@ class StopAllServicesUseCase:
                 "stopped": [],
             }
         
-        results = []
+        # Stop services concurrently (bounded); each one reports its own result.
+        # If the request is cancelled, the task group cancels every in-flight stop.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        pending_stopped: List[uuid.UUID] = []
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._stop_one(service, user_id, db, semaphore, pending_stopped))
+                    for service in services
+                ]
+            results = [task.result() for task in tasks]
+        finally:
+            # One UPDATE for every tunnel that went down
+            self.stop_use_case.service_repo.mark_many_stopped(pending_stopped)
+        
+        successful = sum(r["status"] == "stopped" for r in results)
+        
+        logger.info(f"Stopped {successful}/{len(results)} services")
         
-        # Stop each service
-        for service in services:
+        return {
+            "message": f"{successful}/{len(results)} servicios detenidos",
+            "stopped": results,
+        }
+
+    async def _stop_one(
+        self,
+        service: Service,
+        user_id: int,
+        db: Session,
+        semaphore: asyncio.Semaphore,
+        pending_stopped: List[uuid.UUID],
+    ) -> Dict[str, Any]:
+        """Detener un servicio y devolver su resultado (los errores no se propagan)"""
+        async with semaphore:
             try:
-                await self.stop_use_case.execute(service.id, user_id, db)
-                results.append({
-                    "id": service.id,
-                    "name": service.name,
-                    "status": "stopped",
-                })
-                logger.info(f"Stopped service: {service.name}")
+                await self.stop_use_case.execute(service.id, user_id, db, pending_stopped=pending_stopped)
             except Exception as e:
                 logger.error(f"Error stopping {service.name}: {e}")
-                results.append({
+                return {
                     "id": service.id,
                     "name": service.name,
                     "status": "error",
                     "error": str(e),
-                })
-        
-        successful = len([r for r in results if r["status"] == "stopped"])
-        
-        logger.info(f"Stopped {successful}/{len(results)} services")
-        
+                }
+
+        logger.info(f"Stopped service: {service.name}")
         return {
-            "message": f"{successful}/{len(results)} servicios detenidos",
-            "stopped": results,
+            "id": service.id,
+            "name": service.name,
+            "status": "stopped",
         }
@@ -6,7 +6,7 @@ Business logic for stopping a tunnel service.
 
 import logging
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from sqlmodel import Session
 
 from app.models.service import Service
@@ -50,6 +50,7 @@ class StopServiceUseCase:
         service_id: uuid.UUID,
         user_id: int,
         db: Session,
+        pending_stopped: Optional[List[uuid.UUID]] = None,
     ) -> Dict[str, Any]:
         """
         Execute the use case.
@@ -58,6 +59,8 @@ class StopServiceUseCase:
             service_id: ID of service to stop
             user_id: ID of the user stopping the service
             db: Database session for tunnel operations
+            pending_stopped: If given, the service ID is appended here instead of marking
+                the service as stopped; the caller writes them in one batch
             
         Returns:
             Success message with service name
@@ -83,8 +86,11 @@ class StopServiceUseCase:
         # 3. Stop tunnel based on type
         await self._stop_tunnel(service, db)
         
-        # 4. Update service status
-        self.service_repo.mark_as_stopped(service)
+        # 4. Update service status (or leave it to the caller's batch)
+        if pending_stopped is not None:
+            pending_stopped.append(service.id)
+        else:
+            self.service_repo.mark_as_stopped(service)
         
         logger.info(f"Service stopped: {service.name}")
         
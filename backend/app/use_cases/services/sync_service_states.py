@@ -51,9 +51,9 @@ class SyncServiceStatesUseCase:
         """
         logger.info(f"Syncing service states for user {user_id}")
         
-        # Get all services
+        # Get all services (only the columns sync reads)
         repo = ServiceRepository(db)
-        services = repo.list_all(user_id)
+        services = repo.list_sync_view(user_id)
         
         # Delegate to tunnel service
         result = await self.tunnel_service.sync_service_states(services, repo)
@@ -96,6 +96,28 @@ async def stop_health_checker_use_case():
     logger.info("Health checker stopped")
 
 
+def start_container_watcher_use_case():
+    """
+    Start background Docker event watcher.
+    
+    Use case that starts tracking managed containers for reconciliation.
+    """
+    from app.infrastructure.container_events import container_event_watcher
+    
+    container_event_watcher.start()
+
+
+async def stop_container_watcher_use_case():
+    """
+    Stop background Docker event watcher.
+    
+    Use case that stops the container event watcher infrastructure service.
+    """
+    from app.infrastructure.container_events import container_event_watcher
+    
+    await container_event_watcher.stop()
+
+
 async def stop_managed_containers_use_case():
     """
     Stop all containers managed by LocalRun.
@@ -2,11 +2,15 @@
 JWT authentication - Laravel Sanctum style with SQLModel
 """
 
+import hashlib
+import time
 from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import Session, select
 
 from app.models.user import User
@@ -26,6 +30,59 @@ def create_system_user():
 
 security = HTTPBearer()
 
+# Validated tokens and authenticated users, cached briefly so each request
+# skips the JWT signature check and the user SELECT.
+PAYLOAD_CACHE_TTL = 30.0
+PAYLOAD_CACHE_MAX = 10000
+USER_CACHE_TTL = 60.0
+USER_CACHE_MAX = 5000
+
+# sha256(token) -> (expires_at, payload), on the monotonic clock
+_payload_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+# user id -> (expires_at, detached User snapshot)
+_user_cache: Dict[int, Tuple[float, User]] = {}
+
+
+def _token_key(token: str) -> bytes:
+    """Cache key for a token (the raw token is never stored)."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _cache_get(cache: Dict, key) -> Optional[Any]:
+    """Return a live cache entry, dropping it if it has expired."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_put(cache: Dict, key, value, ttl: float, max_size: int):
+    """Store an entry for ttl seconds, evicting the oldest one when full."""
+    if ttl <= 0:
+        return
+    if key not in cache and len(cache) >= max_size:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (time.monotonic() + ttl, value)
+
+
+def invalidate_token(token: str):
+    """Forget a cached token and the user it belongs to (logout)."""
+    entry = _payload_cache.pop(_token_key(token), None)
+    if entry is not None:
+        invalidate_user(entry[1].get("sub"))
+
+
+def invalidate_user(user_id):
+    """Forget the cached user row after it has been modified."""
+    try:
+        _user_cache.pop(int(user_id), None)
+    except (TypeError, ValueError):
+        pass
+
 
 def create_access_token(data: dict) -> str:
     """
@@ -57,23 +114,44 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            logger.warning("JWT token missing user ID")
-            raise credentials_exception
-    except JWTError as e:
-        logger.warning(f"JWT validation failed: {str(e)}")
-        raise credentials_exception from e
+    token_key = _token_key(token)
+    payload = _cache_get(_payload_cache, token_key)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        except JWTError as e:
+            logger.warning(f"JWT validation failed: {str(e)}")
+            raise credentials_exception from e
+
+        # Never serve a token from cache past its expiry
+        ttl = PAYLOAD_CACHE_TTL
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        _cache_put(_payload_cache, token_key, payload, ttl, PAYLOAD_CACHE_MAX)
+
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        logger.warning("JWT token missing user ID")
+        raise credentials_exception
 
-    # Get user from database using SQLModel
-    statement = select(User).where(User.id == int(user_id))
-    user = db.exec(statement).first()
+    cached = _cache_get(_user_cache, int(user_id))
+    if cached is not None:
+        # Attach a copy to this request's session without a SELECT
+        user = db.merge(cached, load=False)
+    else:
+        # Get user from database using SQLModel
+        statement = select(User).where(User.id == int(user_id))
+        user = db.exec(statement).first()
+
+        if user is None:
+            logger.warning(f"User not found: {user_id}")
+            raise credentials_exception
 
-    if user is None:
-        logger.warning(f"User not found: {user_id}")
-        raise credentials_exception
+        # Keep a detached snapshot; the loaded instance belongs to this session
+        snapshot = User(**user.model_dump())
+        make_transient_to_detached(snapshot)
+        _cache_put(_user_cache, user.id, snapshot, USER_CACHE_TTL, USER_CACHE_MAX)
 
     if not user.is_active:
         logger.warning(f"Inactive user attempted access: {user.username}")
@@ -3,14 +3,20 @@ Database Model Base - Active Record Pattern
 Provides Laravel-style ORM methods for SQLModel entities.
 """
 
+from sqlalchemy import func
 from sqlmodel import SQLModel, Session, select
 from typing import TypeVar, Type, Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from core.database import engine
 
 T = TypeVar("T", bound="DatabaseModel")
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime (the convention for every stored timestamp)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def get_engine():
     """Lazy import engine to avoid circular imports."""
     return engine
@@ -110,17 +116,21 @@ class DatabaseModel(SQLModel):
             Server.where(is_reachable=True, os_type="Linux")
         """
         with Session(get_engine()) as session:
-            statement = select(cls)
-            for key, value in filters.items():
-                if hasattr(cls, key):
-                    statement = statement.where(getattr(cls, key) == value)
-            return list(session.exec(statement).all())
+            return list(session.exec(cls._filtered(select(cls), filters)).all())
 
     @classmethod
     def first_where(cls: Type[T], **filters) -> Optional[T]:
         """Find first record matching filters."""
-        results = cls.where(**filters)
-        return results[0] if results else None
+        with Session(get_engine()) as session:
+            return session.exec(cls._filtered(select(cls), filters).limit(1)).first()
+
+    @classmethod
+    def _filtered(cls, statement, filters: Dict[str, Any]):
+        """Apply equality filters for the given model attributes."""
+        for key, value in filters.items():
+            if hasattr(cls, key):
+                statement = statement.where(getattr(cls, key) == value)
+        return statement
 
     @classmethod
     def create(cls: Type[T], **kwargs) -> T:
@@ -153,14 +163,25 @@ class DatabaseModel(SQLModel):
     @classmethod
     def count(cls: Type[T]) -> int:
         """Count all records."""
-        with Session(engine) as session:
-            statement = select(cls)
-            return len(list(session.exec(statement).all()))
+        with Session(get_engine()) as session:
+            statement = select(func.count()).select_from(cls)
+            return session.exec(statement).one()
 
     @classmethod
     def exists(cls: Type[T], **filters) -> bool:
         """Check if any record exists matching filters."""
-        return cls.first_where(**filters) is not None
+        with Session(get_engine()) as session:
+            return session.exec(select(cls.exists_expression(**filters))).one()
+
+    @classmethod
+    def exists_expression(cls, **filters):
+        """
+        SQL EXISTS expression for records matching filters.
+
+        Lets several existence checks share one query:
+            select(Provider.exists_expression(key="cloudflare"), Service.exists_expression(port=80))
+        """
+        return cls._filtered(select(cls), filters).exists()
 
     @classmethod
     def delete_where(cls: Type[T], **filters) -> int:
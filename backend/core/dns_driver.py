@@ -66,8 +66,8 @@ class DNSDriver(ABC):
         pass
 
     @abstractmethod
-    async def list_zones(self, credentials: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """List DNS zones available to this API token"""
+    async def list_zones(self, credentials: Dict[str, Any], name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List DNS zones available to this API token (optionally only the zone named `name`)"""
         pass
 
     @abstractmethod
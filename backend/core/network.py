@@ -6,7 +6,7 @@ import asyncio
 import ipaddress
 import platform
 import socket
-from typing import Optional
+from typing import Awaitable, Container, Iterable, Optional
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
@@ -47,11 +47,48 @@ def is_localhost_connection(client_ip: str, db) -> bool:
     return client_ip == localhost_server.network_ip
 
 
+# Well-known service names for the common scan ports
+PORT_SERVICES = {
+    21: "ftp",
+    22: "ssh",
+    23: "telnet",
+    25: "smtp",
+    53: "dns",
+    80: "http",
+    110: "pop3",
+    143: "imap",
+    443: "https",
+    445: "smb",
+    3000: "http",
+    3306: "mysql",
+    3389: "rdp",
+    5000: "http",
+    5432: "postgresql",
+    5900: "vnc",
+    6379: "redis",
+    8000: "http",
+    8080: "http",
+    8123: "home-assistant",
+    8443: "https",
+    8888: "http",
+    9000: "http",
+    9090: "http",
+    27017: "mongodb",
+    32400: "plex",
+}
+
+# Banner grab limits for service detection
+BANNER_MAX_BYTES = 256
+BANNER_TIMEOUT = 1.0
+
+
 @dataclass
 class ServiceInfo:
     """Service information for detected services"""
     port: int
     service_name: str
+    protocol: str = "tcp"
+    confidence: float = 0.0
     version: Optional[str] = None
     banner: Optional[str] = None
 
@@ -70,8 +107,40 @@ class NetworkScanResult:
 class NetworkUtils:
     """Network utilities for server management"""
 
+    # Max concurrent probes per scan phase, and max scan sockets open at once across
+    # every host being scanned by this instance (keeps a /24 scan well below the FD limit)
+    SCAN_CONCURRENCY = 64
+    # Max concurrent service detections on open ports
+    DETECT_CONCURRENCY = 32
+    # Connect budget per port during the open-port sweep (seconds)
+    SWEEP_TIMEOUT = 0.5
+
     def __init__(self, timeout: int = 3):
         self.timeout = timeout
+        self._socket_slots: Optional[asyncio.Semaphore] = None
+        self._socket_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _scan_sockets(self) -> asyncio.Semaphore:
+        """Semaphore shared by every sweep/detection connect, so concurrent host scans share one budget."""
+        loop = asyncio.get_running_loop()
+        if self._socket_slots_loop is not loop:
+            self._socket_slots = asyncio.Semaphore(self.SCAN_CONCURRENCY)
+            self._socket_slots_loop = loop
+        return self._socket_slots
+
+    async def _gather_bounded(self, coros: Iterable[Awaitable], limit: Optional[int] = None) -> list:
+        """
+        Run coroutines concurrently, at most `limit` (default SCAN_CONCURRENCY) at a time.
+
+        Results keep the input order; exceptions are returned, not raised.
+        """
+        semaphore = asyncio.Semaphore(limit or self.SCAN_CONCURRENCY)
+
+        async def bounded(coro: Awaitable):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(bounded(coro) for coro in coros), return_exceptions=True)
 
     async def check_connectivity(self, host: str, port: Optional[int] = None) -> tuple[bool, Optional[float]]:
         """
@@ -106,10 +175,55 @@ class NetworkUtils:
             logger.debug(f"Connectivity check failed for {host}:{port or 'N/A'}: {e}")
             return False, None
 
+    async def _port_open(self, host: str, port: int) -> bool:
+        """Stateless sweep probe: True if a TCP connect succeeds within SWEEP_TIMEOUT."""
+        async with self._scan_sockets():
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=self.SWEEP_TIMEOUT)
+            except (OSError, asyncio.TimeoutError):
+                return False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return True
+
+    async def _detect_service(self, host: str, port: int) -> ServiceInfo:
+        """Stateful probe on an open port: name from the port table plus any greeting banner."""
+        banner = None
+        async with self._scan_sockets():
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=self.timeout)
+            except (OSError, asyncio.TimeoutError):
+                reader = writer = None
+
+            if writer is not None:
+                try:
+                    data = await asyncio.wait_for(reader.read(BANNER_MAX_BYTES), timeout=BANNER_TIMEOUT)
+                    banner = data.decode("utf-8", "replace").strip() or None
+                except (OSError, asyncio.TimeoutError):
+                    pass
+                finally:
+                    writer.close()
+                    try:
+                        await writer.wait_closed()
+                    except OSError:
+                        pass
+
+        service_name = PORT_SERVICES.get(port)
+        if service_name is None:
+            return ServiceInfo(port=port, service_name="unknown", banner=banner)
+        # Port-table match only; a greeting banner makes it somewhat more likely
+        return ServiceInfo(port=port, service_name=service_name, confidence=0.7 if banner else 0.5, banner=banner)
+
     async def scan_ports(self, host: str, ports: list[int]) -> list[ServiceInfo]:
         """
         Scan multiple ports on a host and detect services.
 
+        Two phases: a short-timeout connect sweep over every port finds the open
+        set, then service detection runs only on the open ports.
+
         Args:
             host: Target host
             ports: List of ports to scan
@@ -117,23 +231,24 @@ class NetworkUtils:
         Returns:
             List of detected services
         """
-        detected_services = []
+        # Phase 1: stateless sweep (parallel, bounded)
+        results = await self._gather_bounded(self._port_open(host, port) for port in ports)
+        open_ports = [port for port, is_open in zip(ports, results) if is_open is True]
+        if not open_ports:
+            return []
 
-        # Check ports in parallel
-        tasks = [ServiceInfo_detector.check_port(host, port) for port in ports]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Phase 2: service detection on open ports only
+        results = await self._gather_bounded(
+            (self._detect_service(host, port) for port in open_ports), limit=self.DETECT_CONCURRENCY
+        )
 
-        # For open ports, detect service
-        for port, is_open in zip(ports, results):
-            if is_open is True:
-                try:
-                    service_info = await ServiceInfo_detector.detect_service(host, port)
-                    detected_services.append(service_info)
-                    logger.info(
-                        f"Detected: {host}:{port} -> {service_info.service_name} (confidence: {service_info.confidence})"
-                    )
-                except Exception as e:
-                    logger.debug(f"Service detection failed for {host}:{port}: {e}")
+        detected_services = []
+        for port, service_info in zip(open_ports, results):
+            if isinstance(service_info, Exception):
+                logger.debug(f"Service detection failed for {host}:{port}: {service_info}")
+                continue
+            detected_services.append(service_info)
+            logger.info(f"Detected: {host}:{port} -> {service_info.service_name}")
 
         return detected_services
 
@@ -181,17 +296,24 @@ class NetworkUtils:
         else:
             ports = list(range(1, 65536))  # All ports (very slow!)
 
-        # Check if host is reachable
-        is_reachable, _ = await self.check_connectivity(host)
+        # Start hostname lookup and port scan speculatively while reachability is checked;
+        # reachable hosts (the common case) no longer wait for the check before scanning
+        hostname_task = asyncio.create_task(self._get_hostname(host))
+        scan_task = asyncio.create_task(self.scan_ports(host, ports))
+
+        try:
+            is_reachable, _ = await self.check_connectivity(host)
+        except BaseException:
+            hostname_task.cancel()
+            scan_task.cancel()
+            raise
 
         if not is_reachable:
+            hostname_task.cancel()
+            scan_task.cancel()
             return NetworkScanResult(host=host, hostname=None, is_reachable=False, os_type=None, open_ports=[])
 
-        # Try to get hostname
-        hostname = await self._get_hostname(host)
-
-        # Scan ports
-        open_ports = await self.scan_ports(host, ports)
+        hostname, open_ports = await asyncio.gather(hostname_task, scan_task)
 
         # Try to detect OS (basic)
         os_type = await self._detect_os(host, open_ports)
@@ -200,13 +322,21 @@ class NetworkUtils:
             host=host, hostname=hostname, is_reachable=True, os_type=os_type, open_ports=open_ports
         )
 
-    async def scan_network(self, network: str = "192.168.1.0/24", max_hosts: int = 254) -> list[NetworkScanResult]:
+    async def scan_network(
+        self,
+        network: str = "192.168.1.0/24",
+        max_hosts: int = 254,
+        skip_hosts: Container[str] = frozenset(),
+        dead_hosts: Optional[set[str]] = None,
+    ) -> list[NetworkScanResult]:
         """
         Scan an entire network for active hosts.
 
         Args:
             network: Network in CIDR notation (e.g., '192.168.1.0/24')
             max_hosts: Maximum number of hosts to scan
+            skip_hosts: Hosts not to probe (e.g. known dead from a recent scan)
+            dead_hosts: If given, probed hosts that produced no result are added to it
 
         Returns:
             List of NetworkScanResult for reachable hosts
@@ -218,30 +348,32 @@ class NetworkUtils:
             return []
 
         # Get all hosts in network
-        hosts = list(net.hosts())[:max_hosts]
+        hosts = [host for host in map(str, list(net.hosts())[:max_hosts]) if host not in skip_hosts]
         logger.info(f"Scanning {len(hosts)} hosts in {network}...")
 
-        # Quick ping check first (parallel)
+        # Discovery phase: quick ping check (parallel)
         reachable_hosts = []
-        tasks = [self.check_connectivity(str(host)) for host in hosts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self._gather_bounded(self.check_connectivity(host) for host in hosts)
 
         for host, result in zip(hosts, results):
             if isinstance(result, tuple) and result[0]:
-                reachable_hosts.append(str(host))
+                reachable_hosts.append(host)
 
         logger.info(f"Found {len(reachable_hosts)} reachable hosts")
 
-        # Scan each reachable host
+        # Port-scan phase: all reachable hosts concurrently
+        results = await self._gather_bounded(self.scan_host(host) for host in reachable_hosts)
+
         scan_results = []
-        for host in reachable_hosts:
-            try:
-                result = await self.scan_host(host)
-                if result.is_reachable and result.open_ports:
-                    scan_results.append(result)
-                    logger.info(f"Host {host}: {len(result.open_ports)} services detected")
-            except Exception as e:
-                logger.error(f"Error scanning {host}: {e}")
+        for host, result in zip(reachable_hosts, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scanning {host}: {result}")
+            elif result.is_reachable and result.open_ports:
+                scan_results.append(result)
+                logger.info(f"Host {host}: {len(result.open_ports)} services detected")
+
+        if dead_hosts is not None:
+            dead_hosts.update(set(hosts).difference(result.host for result in scan_results))
 
         return scan_results
 
@@ -0,0 +1,33 @@
+"""
+Custom API route class - parses JSON request bodies with orjson when available
+"""
+
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from core.serialization import loads
+
+
+class JSONBodyRequest(Request):
+    """Request whose JSON body is decoded straight from bytes by core.serialization."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+            # still turns malformed bodies into a 422
+            self._json = loads(await self.body())
+        return self._json
+
+
+class JSONBodyRoute(APIRoute):
+    """APIRoute that hands endpoints a JSONBodyRequest."""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(JSONBodyRequest(request.scope, request.receive))
+
+        return route_handler
@@ -0,0 +1,55 @@
+"""
+JSON serialization helpers - uses orjson when installed, stdlib json otherwise
+"""
+
+import json
+import os
+from typing import Any, Union
+
+from tinydb.storages import JSONStorage
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrjsonStorage(JSONStorage):
+    """
+    TinyDB JSON storage backed by orjson (falls back to stdlib json).
+
+    Same file layout as the default JSONStorage, so existing databases
+    can be opened with either storage.
+    """
+
+    def read(self):
+        # Empty file means an empty database
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            return None
+
+        self._handle.seek(0)
+        return loads(self._handle.read())
+
+    def write(self, data):
+        self._handle.seek(0)
+        self._handle.write(dumps(data))
+
+        # Ensure the file is written to disk and drop leftover content
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.truncate()
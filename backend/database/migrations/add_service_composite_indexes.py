@@ -0,0 +1,43 @@
+from app.models.service import Service
+from core.database import engine
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+INDEX_NAMES = (
+    "ix_service_user_status",
+    "ix_service_user_port_host",
+    "ix_service_user_provider",
+    "ix_service_user_enabled",
+)
+
+
+def _indexes():
+    """Composite indexes declared on the services table"""
+    return [index for index in Service.__table__.indexes if index.name in INDEX_NAMES]
+
+
+def upgrade():
+    """Create composite indexes on services table"""
+    logger.info("Running migration: add_service_composite_indexes")
+
+    for index in _indexes():
+        index.create(engine, checkfirst=True)
+        logger.info(f"Created index {index.name}")
+
+    logger.info("Migration completed successfully")
+
+
+def downgrade():
+    """Drop composite indexes from services table"""
+    logger.info("Rolling back migration: add_service_composite_indexes")
+
+    for index in _indexes():
+        index.drop(engine, checkfirst=True)
+        logger.info(f"Dropped index {index.name}")
+
+    logger.info("Rollback completed")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,36 @@
+from app.models.service import Service
+from core.database import engine
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+INDEX_NAME = "ix_service_user_enabled_provider_protocol"
+
+
+def _index():
+    """Composite index for the filtered service listing"""
+    return next(index for index in Service.__table__.indexes if index.name == INDEX_NAME)
+
+
+def upgrade():
+    """Create the service listing index"""
+    logger.info("Running migration: add_service_list_index")
+
+    _index().create(engine, checkfirst=True)
+    logger.info(f"Created index {INDEX_NAME}")
+
+    logger.info("Migration completed successfully")
+
+
+def downgrade():
+    """Drop the service listing index"""
+    logger.info("Rolling back migration: add_service_list_index")
+
+    _index().drop(engine, checkfirst=True)
+    logger.info(f"Dropped index {INDEX_NAME}")
+
+    logger.info("Rollback completed")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,69 @@
+import sqlite3
+
+from app.repositories.server_stats_repository import server_stats_repository
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _ts_type(conn: sqlite3.Connection) -> str:
+    """Declared type of the stats.ts column ('' if the table does not exist)"""
+    for _, name, col_type, *_ in conn.execute("PRAGMA table_info(stats)"):
+        if name == "ts":
+            return col_type.upper()
+    return ""
+
+
+def _rebuild(conn: sqlite3.Connection, col_type: str, ts_expr: str):
+    """Recreate the stats table with the given ts column type, converting existing rows"""
+    with conn:
+        conn.execute(
+            f"""
+            CREATE TABLE stats_new (
+                server_id TEXT NOT NULL,
+                ts {col_type} NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (server_id, ts DESC)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            f"INSERT OR REPLACE INTO stats_new (server_id, ts, payload) SELECT server_id, {ts_expr}, payload FROM stats"
+        )
+        conn.execute("DROP TABLE stats")
+        conn.execute("ALTER TABLE stats_new RENAME TO stats")
+
+
+def upgrade():
+    """Run migration"""
+    logger.info("Running migration: convert_stats_ts_to_unix_ms")
+
+    conn = sqlite3.connect(server_stats_repository.db_path)
+    try:
+        if _ts_type(conn) == "TEXT":
+            # ISO 8601 (UTC) -> unix milliseconds
+            _rebuild(conn, "INTEGER", "CAST(ROUND((julianday(ts) - 2440587.5) * 86400000) AS INTEGER)")
+            logger.info("Converted stats.ts to unix milliseconds")
+    finally:
+        conn.close()
+
+    logger.info("Migration completed successfully")
+
+
+def downgrade():
+    """Rollback migration"""
+    logger.info("Rolling back migration: convert_stats_ts_to_unix_ms")
+
+    conn = sqlite3.connect(server_stats_repository.db_path)
+    try:
+        if _ts_type(conn) == "INTEGER":
+            _rebuild(conn, "TEXT", "strftime('%Y-%m-%dT%H:%M:%f', ts / 1000.0, 'unixepoch')")
+            logger.info("Converted stats.ts back to ISO 8601")
+    finally:
+        conn.close()
+
+    logger.info("Rollback completed")
+
+
+if __name__ == "__main__":
+    upgrade()
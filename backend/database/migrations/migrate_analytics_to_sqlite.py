@@ -0,0 +1,60 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.services.analytics_service import AnalyticsService
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LEGACY_DB_PATH = Path("database/analytics.json")
+
+
+def _to_ms(timestamp: str) -> int:
+    """Convert a legacy naive-UTC ISO timestamp to unix milliseconds"""
+    return int(datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def upgrade():
+    """Run migration"""
+    logger.info("Running migration: migrate_analytics_to_sqlite")
+
+    if not LEGACY_DB_PATH.exists():
+        logger.info("No legacy analytics database found")
+        return
+
+    try:
+        data = json.loads(LEGACY_DB_PATH.read_text() or "{}")
+    except json.JSONDecodeError as e:
+        logger.warning(f"Skipping unreadable analytics file {LEGACY_DB_PATH}: {e}")
+        return
+
+    # Import the TinyDB "requests" table into SQLite
+    records = list(data.get("requests", {}).values())
+    rows = [AnalyticsService.record_to_row(record, _to_ms(record["timestamp"])) for record in records]
+
+    analytics = AnalyticsService()
+    with analytics._get_conn() as conn:
+        conn.executemany(AnalyticsService.INSERT_SQL, rows)
+    analytics.close()
+
+    LEGACY_DB_PATH.rename(LEGACY_DB_PATH.with_suffix(".json.migrated"))
+    logger.info(f"Imported {len(rows)} analytics requests")
+
+    logger.info("Migration completed successfully")
+
+
+def downgrade():
+    """Rollback migration"""
+    logger.info("Rolling back migration: migrate_analytics_to_sqlite")
+
+    # Restore legacy TinyDB file
+    migrated = LEGACY_DB_PATH.with_suffix(".json.migrated")
+    if migrated.exists():
+        migrated.rename(LEGACY_DB_PATH)
+
+    logger.info("Rollback completed")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+from app.repositories.server_stats_repository import server_stats_repository
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def upgrade():
+    """Run migration"""
+    logger.info("Running migration: migrate_stats_to_sqlite")
+
+    # Import legacy per-server TinyDB files (<server_id>.json) into SQLite
+    for path in Path(server_stats_repository.data_dir).glob("*.json"):
+        server_id = path.stem
+
+        try:
+            data = json.loads(path.read_text() or "{}")
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping unreadable stats file {path}: {e}")
+            continue
+
+        entries = list(data.get("_default", {}).values())
+        for stats in entries:
+            server_stats_repository.add_stats(server_id, stats)
+
+        path.rename(path.with_suffix(".json.migrated"))
+        logger.info(f"Imported {len(entries)} stats entries for server {server_id}")
+
+    logger.info("Migration completed successfully")
+
+
+def downgrade():
+    """Rollback migration"""
+    logger.info("Rolling back migration: migrate_stats_to_sqlite")
+
+    # Restore legacy TinyDB files
+    for path in Path(server_stats_repository.data_dir).glob("*.json.migrated"):
+        path.rename(path.with_suffix(""))
+
+    logger.info("Rollback completed")
+
+
+if __name__ == "__main__":
+    upgrade()
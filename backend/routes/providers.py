@@ -5,8 +5,9 @@ Providers routes - Provider configuration endpoints.
 from fastapi import APIRouter, Depends
 from app.controllers.providers import ProvidersController
 from core.auth import get_current_user
+from core.routing import JSONBodyRoute
 
-router = APIRouter(prefix="/providers", tags=["providers"])
+router = APIRouter(prefix="/providers", tags=["providers"], route_class=JSONBodyRoute)
 providers_controller = ProvidersController()
 
 
@@ -11,8 +11,9 @@ from app.schemas.service import (
     ServiceAgentResponse,
 )
 from core.auth import get_current_user
+from core.routing import JSONBodyRoute
 
-router = APIRouter(prefix="/services", tags=["services"])
+router = APIRouter(prefix="/services", tags=["services"], route_class=JSONBodyRoute)
 services_controller = ServicesController()
 
 